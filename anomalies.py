@@ -0,0 +1,211 @@
+import numpy as np
+import pandas as pd
+from typing import Optional, Dict, Sequence
+
+from leaderboard import Leaderboard
+from selection import ElectionIndex
+
+# Robust z-scores above this are flagged (Iglewicz and Hoaglin's outlier cut-off).
+Z_THRESHOLD = 3.5
+
+# feature -> (booth column, baseline area, label)
+ANOMALY_CHECKS = {
+    'turnout_constituency': ('turnout', 'constituency', "Turnout vs constituency"),
+    'turnout_district': ('turnout', 'district', "Turnout vs district"),
+    'winner_share_constituency': ('winner_share', 'constituency', "Winner's share vs constituency"),
+    'winner_share_district': ('winner_share', 'district', "Winner's share vs district"),
+    'postal_ratio': ('postal_ratio', 'district', "Postal vote ratio"),
+    'tendered_ratio': ('tendered_ratio', 'district', "Tendered vote ratio"),
+    'previous_error': ('previous_error', 'district', "Previous errors"),
+}
+# Only unusually high postal, tendered and error counts are suspicious; turnout and share count both ways.
+ONE_SIDED = {'postal_ratio', 'tendered_ratio', 'previous_error'}
+
+
+def group_median(values: np.ndarray, groups: np.ndarray, n_groups: int) -> np.ndarray:
+    """Median of ``values`` within each group code, from a single sort."""
+    order = np.lexsort((values, groups))
+    ordered = values[order]
+    counts = np.bincount(groups, minlength=n_groups)
+    starts = np.cumsum(counts) - counts
+    last = np.maximum(counts - 1, 0)
+    return (ordered[np.minimum(starts + last // 2, len(ordered) - 1)] +
+            ordered[np.minimum(starts + (last + 1) // 2, len(ordered) - 1)]) / 2
+
+
+def robust_z(values: np.ndarray, groups: np.ndarray) -> np.ndarray:
+    """0.6745 * (x - median) / MAD within each group.
+
+    Where a group's MAD is 0 the mean absolute deviation (scaled to match
+    the MAD of a normal distribution) is used instead, and booths of a
+    group with no spread at all score 0.
+    """
+    codes, uniques = pd.factorize(groups)
+    n_groups = len(uniques)
+    median = group_median(values, codes, n_groups)
+    deviation = np.abs(values - median[codes])
+    mad = group_median(deviation, codes, n_groups)
+    mean_ad = np.bincount(codes, weights=deviation, minlength=n_groups) / np.maximum(np.bincount(codes), 1)
+    scale = np.where(mad > 0, mad / 0.6745, mean_ad * 1.2533)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = (values - median[codes]) / scale[codes]
+    return np.where(scale[codes] > 0, z, 0.0)
+
+
+def booth_anomalies(booths: pd.DataFrame, results: pd.DataFrame) -> pd.DataFrame:
+    """One row per booth with robust z-scores of each check, an overall score and the flagged checks.
+
+    Turnout and the winner's share of votes polled are scored against the
+    booth's constituency and district in the same year; postal and
+    tendered votes as a share of votes polled, and previous errors, against
+    the district. ``score`` is the largest absolute z-score (only the high
+    side for the one-sided checks) and ``flags`` names the checks above
+    ``Z_THRESHOLD``.
+    """
+    booths = booths.reset_index(drop=True)
+    polled = booths['votes_polled'].to_numpy(dtype=np.float64)
+    winner_votes = results.groupby('booth_key', observed=True)['votes'].max()
+    winner_votes = winner_votes.reindex(booths['booth_key'].to_numpy(), fill_value=0).to_numpy(dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        features = {
+            'turnout': booths['turnout_percentage'].to_numpy(dtype=np.float64),
+            'winner_share': np.where(polled > 0, winner_votes / polled * 100, 0.0),
+            'postal_ratio': np.where(polled > 0, booths['postal_votes'].to_numpy() / polled * 100, 0.0),
+            'tendered_ratio': np.where(polled > 0, booths['tendered_votes'].to_numpy() / polled * 100, 0.0),
+            'previous_error': booths['previous_error'].to_numpy(dtype=np.float64),
+        }
+
+    year = booths['year'].to_numpy().astype(np.int64)
+    areas = {
+        'district': year * 1000 + booths['district'].astype('category').cat.codes.to_numpy(),
+        'constituency': year * 100000 + booths['constituency'].astype('category').cat.codes.to_numpy(),
+    }
+
+    anomalies = pd.DataFrame({
+        'year': booths['year'].to_numpy(),
+        'district': booths['district'].array,
+        'constituency': booths['constituency'].array,
+        'booth_id': booths['booth_id'].to_numpy(),
+        'booth_key': booths['booth_key'].to_numpy(),
+    })
+    for name, values in features.items():
+        anomalies[name] = np.round(values, 2)
+
+    flagged = np.zeros((len(booths), len(ANOMALY_CHECKS)), dtype=bool)
+    scores = np.zeros((len(booths), len(ANOMALY_CHECKS)))
+    for i, (check, (feature, area, _)) in enumerate(ANOMALY_CHECKS.items()):
+        z = robust_z(features[feature], areas[area])
+        anomalies[f'z_{check}'] = np.round(z, 2)
+        scores[:, i] = np.maximum(z, 0) if check in ONE_SIDED else np.abs(z)
+        flagged[:, i] = scores[:, i] > Z_THRESHOLD
+
+    anomalies['score'] = np.round(scores.max(axis=1), 2) if len(booths) else np.zeros(0)
+    # Each distinct combination of flagged checks is formatted once.
+    names = np.array(list(ANOMALY_CHECKS))
+    patterns, codes = np.unique(np.packbits(flagged, axis=1, bitorder='little'), axis=0, return_inverse=True)
+    labels = [", ".join(names[np.unpackbits(p, bitorder='little')[:len(names)].astype(bool)]) for p in patterns]
+    anomalies['flags'] = pd.Categorical.from_codes(codes.ravel(), categories=labels)
+    anomalies['flag_count'] = flagged.sum(axis=1).astype(np.int8)
+    return anomalies
+
+
+class AnomalyReport:
+    """Booths ranked by anomaly score, filterable by year and district, plus per-area flag counts.
+
+    Everything a rerun reads is prepared once: rows are grouped by year,
+    district and constituency through an ``ElectionIndex``, booths are
+    found through a ``booth_id`` index per year, and booth, flagged-booth
+    and per-check flag counts are tabulated per (year, district). Lookups
+    then cost the size of their answer, not of the statewide frame.
+    """
+
+    def __init__(self, anomalies: pd.DataFrame):
+        self.index = ElectionIndex(anomalies)
+        self.frame = self.index.frame
+        self.years = self.index.years
+        self._ranking = Leaderboard(self.frame, 'score', ties=('booth_id',))
+
+        booth_ids = self.frame['booth_id'].to_numpy()
+        self._booths = {}
+        for year in self.years:
+            start, stop = self.index.span(year)
+            self._booths[year] = (start, pd.Index(booth_ids[start:stop]))
+        self._scores = self.frame['score'].to_numpy()
+        self._flag_codes = self.frame['flags'].cat.codes.to_numpy()
+        # Code -1 (no row) reads the trailing empty label.
+        self._flag_labels = np.asarray(list(self.frame['flags'].cat.categories) + [''], dtype=object)
+
+        district_codes, districts = pd.factorize(self.frame['district'])
+        order = np.argsort(np.asarray(districts, dtype=str), kind='stable')
+        self.districts = [str(districts[i]) for i in order]
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order))
+        year_codes = np.searchsorted(np.asarray(self.years), self.frame['year'].to_numpy())
+        cells = year_codes * len(self.districts) + rank[district_codes]
+        shape = (len(self.years), len(self.districts))
+
+        def tabulate(mask):
+            return np.bincount(cells[mask], minlength=shape[0] * shape[1]).reshape(shape)
+
+        self._booth_counts = tabulate(slice(None))
+        self._flagged_counts = tabulate(self.frame['flag_count'].to_numpy() > 0)
+        hits = []
+        for check in ANOMALY_CHECKS:
+            z = self.frame[f'z_{check}'].to_numpy()
+            hits.append(tabulate((z if check in ONE_SIDED else np.abs(z)) > Z_THRESHOLD))
+        self._check_counts = np.stack(hits, axis=-1)
+
+    def _year_rows(self, year: Optional[int]) -> slice:
+        if year is None:
+            return slice(None)
+        position = self.years.index(int(year)) if int(year) in self.years else len(self.years)
+        return slice(position, position + 1)
+
+    def top(self, k: int = 20, year: Optional[int] = None, district: Optional[str] = None,
+            flagged_only: bool = True) -> pd.DataFrame:
+        """The ``k`` most anomalous booths, highest score first, with a 1-based ``rank`` column."""
+        top = self._ranking.top(k, year=year, district=district)
+        return top[top['flag_count'] > 0] if flagged_only else top
+
+    def summary(self, year: Optional[int] = None, district: Optional[str] = None) -> Dict[str, int]:
+        """Booths checked and booths flagged in a year and district (all of them by default)."""
+        rows = self._year_rows(year)
+        columns = slice(None)
+        if district:
+            if district not in self.districts:
+                return {'booths': 0, 'flagged': 0}
+            position = self.districts.index(district)
+            columns = slice(position, position + 1)
+        return {'booths': int(self._booth_counts[rows, columns].sum()),
+                'flagged': int(self._flagged_counts[rows, columns].sum())}
+
+    def flag_counts(self, year: Optional[int] = None) -> pd.DataFrame:
+        """Flagged booths per district and check."""
+        rows = self._year_rows(year)
+        present = self._booth_counts[rows].sum(axis=0) > 0
+        counts = self._check_counts[rows].sum(axis=0)[present]
+        return pd.DataFrame(counts, columns=list(ANOMALY_CHECKS),
+                            index=pd.Index(np.asarray(self.districts, dtype=object)[present], name='district'))
+
+    def _positions(self, booth_ids: np.ndarray, year: int) -> np.ndarray:
+        if int(year) not in self._booths:
+            return np.full(len(booth_ids), -1, dtype=np.int64)
+        start, index = self._booths[int(year)]
+        positions = index.get_indexer(booth_ids)
+        return np.where(positions >= 0, positions + start, -1)
+
+    def scores(self, booth_ids: Sequence[int], year: int) -> pd.DataFrame:
+        """Score and flags of the given booths of one year, in the given order (NaN and '' if unknown)."""
+        positions = self._positions(np.asarray(booth_ids), year)
+        found = positions >= 0
+        take = np.where(found, positions, 0)
+        return pd.DataFrame({'score': np.where(found, self._scores[take], np.nan),
+                             'flags': self._flag_labels[np.where(found, self._flag_codes[take], -1)]})
+
+    def booth(self, booth_id: int, year: Optional[int] = None) -> Optional[pd.Series]:
+        """Anomaly row of one booth, or None."""
+        for candidate_year in ([int(year)] if year is not None else self.years):
+            position = self._positions(np.array([int(booth_id)]), candidate_year)[0]
+            if position >= 0:
+                return self.frame.iloc[position]
+        return None
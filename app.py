@@ -54,7 +54,7 @@ with col3:
     if st.button("View Candidates", key="home_candidate", use_container_width=True, type="primary"):
         st.switch_page("pages/3_Candidate_Performance.py")
 
-col4, col5 = st.columns(2)
+col4, col5, col6 = st.columns(3)
 
 with col4:
     st.markdown("""
@@ -78,6 +78,52 @@ with col5:
     if st.button("Ask Chatbot", key="home_chatbot", use_container_width=True, type="primary"):
         st.switch_page("pages/5_Election_Chatbot.py")
 
+with col6:
+    st.markdown("""
+    <div class="feature-box">
+        <div class="feature-icon">🏆</div>
+        <h3>Party Tally</h3>
+        <p>Statewide and district-wise party standings for every election: seats won, votes polled, seats contested and vote share.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    if st.button("View Tally", key="home_tally", use_container_width=True, type="primary"):
+        st.switch_page("pages/6_Party_Tally.py")
+
+col7, col8, col9 = st.columns(3)
+
+with col7:
+    st.markdown("""
+    <div class="feature-box">
+        <div class="feature-icon">⏱️</div>
+        <h3>Counting Day</h3>
+        <p>Follow live leads and margins as each round of counting lands, or rewind to any earlier round.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    if st.button("Follow Counting", key="home_counting", use_container_width=True, type="primary"):
+        st.switch_page("pages/9_Counting_Day.py")
+
+with col8:
+    st.markdown("""
+    <div class="feature-box">
+        <div class="feature-icon">🥇</div>
+        <h3>Leaderboards</h3>
+        <p>Rank contests and booths: narrowest margins, biggest landslides, winners' vote share and turnout extremes.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    if st.button("View Leaderboards", key="home_leaderboards", use_container_width=True, type="primary"):
+        st.switch_page("pages/7_Leaderboards.py")
+
+with col9:
+    st.markdown("""
+    <div class="feature-box">
+        <div class="feature-icon">🚩</div>
+        <h3>Booth Anomalies</h3>
+        <p>Scan every booth in the state for unusual turnout, vote share and postal or tendered vote ratios.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    if st.button("View Anomalies", key="home_anomalies", use_container_width=True, type="primary"):
+        st.switch_page("pages/8_Booth_Anomalies.py")
+
 st.markdown("<div style='height: 2rem;'></div>", unsafe_allow_html=True)
 
 st.markdown("""
@@ -0,0 +1,46 @@
+"""Booth anomaly pass: robust z-scores of every booth in the state, at scale.
+
+Usage: python benchmarks/bench_anomalies.py [--booths-per-constituency N] [--years N] [--repeat N]
+"""
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from anomalies import AnomalyReport, booth_anomalies
+from utils import generate_booth_tables
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--booths-per-constituency', type=int, default=5000)
+    parser.add_argument('--years', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    logging.getLogger('streamlit').setLevel(logging.ERROR)
+
+    tables = generate_booth_tables(args.booths_per_constituency, args.years)
+    print(f"{len(tables.booths):,} booths, {len(tables.results):,} booth results")
+
+    anomalies = booth_anomalies(tables.booths, tables.results)
+    print(f"{'anomaly pass':20} {best_of(args.repeat, lambda: booth_anomalies(tables.booths, tables.results)):10.2f}s")
+    report = AnomalyReport(anomalies)
+    print(f"{'top 25 (first)':20} {best_of(1, lambda: report.top(25)) * 1000:10.2f}ms")
+    print(f"{'top 25 (cached)':20} {best_of(args.repeat, lambda: report.top(25)) * 1000:10.2f}ms")
+    print(f"{'flagged booths':20} {int((anomalies['flag_count'] > 0).sum()):10,}")
+
+
+if __name__ == '__main__':
+    main()
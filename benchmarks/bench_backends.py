@@ -0,0 +1,105 @@
+"""Compare the pandas and SQLite backends on page filters and chatbot lookups.
+
+Every lookup is run against both backends and the results are checked to be
+identical before timing.
+
+Usage: python benchmarks/bench_backends.py [--booths-per-constituency N] [--years N] [--repeat N]
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from chatbot import ElectionChatbot
+from selection import ElectionIndex
+from sqlstore import SQLiteStore, SQLiteIndex, SQLiteBoothTables
+from utils import generate_booth_tables, read_election_data
+
+QUERIES = [
+    "Who won in Thiruvananthapuram in 2024?",
+    "What was the margin in Nemom?",
+    "How many seats did CPI win in 2024?",
+    "How many votes did Suresh get?",
+    "Show results for Kollam district",
+    "Compare 2023 and 2024 in Vattiyoorkavu",
+    "Tell me about booth 1001",
+]
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--booths-per-constituency', type=int, default=200)
+    parser.add_argument('--years', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    df = read_election_data()
+    tables = generate_booth_tables(args.booths_per_constituency, args.years)
+    election_index = ElectionIndex(df)
+    booth_index = ElectionIndex(tables.booths)
+    print(f"{len(df):,} election rows, {len(tables.booths):,} booths, {len(tables.results):,} booth results")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        started = time.perf_counter()
+        election_store = SQLiteStore(Path(tmp) / "election.sqlite", "bench",
+                                     lambda: {'results': election_index.frame})
+        booth_store = SQLiteStore(Path(tmp) / "booths.sqlite", "bench",
+                                  lambda: {'booths': booth_index.frame, 'booth_results': tables.results})
+        print(f"sqlite build: {time.perf_counter() - started:.2f} s")
+        sql_index = SQLiteIndex(election_store)
+        sql_booth_index = SQLiteIndex(booth_store, 'booths')
+        sql_booths = SQLiteBoothTables(booth_store)
+
+        year = election_index.years[-1]
+        district = election_index.districts(year)[0]
+        constituency = election_index.constituencies(year, district)[0]
+        candidate = str(df['candidate'].iloc[0])
+        party = str(df['party'].iloc[0])
+        booth_year = booth_index.years[-1]
+        booth_district = booth_index.districts(booth_year)[0]
+        booth_constituency = booth_index.constituencies(booth_year, booth_district)[0]
+        booth_id = int(tables.booths['booth_id'].iloc[len(tables.booths) // 2])
+
+        lookups = [
+            ("results: year + district", lambda ix: ix.select(year=year, district=district),
+             election_index, sql_index),
+            ("results: constituency", lambda ix: ix.select(year=year, constituency=constituency),
+             election_index, sql_index),
+            ("results: candidate", lambda ix: ix.select(candidate=candidate), election_index, sql_index),
+            ("results: party + year", lambda ix: ix.select(year=year, party=party), election_index, sql_index),
+            ("booths: constituency", lambda ix: ix.select(year=booth_year, constituency=booth_constituency),
+             booth_index, sql_booth_index),
+            ("booths: find + results", lambda t: t.booth_results(t.find(booth_id)['booth_key']),
+             tables, sql_booths),
+        ]
+        print(f"{'lookup':28} {'pandas':>10} {'sqlite':>10}  rows")
+        for name, lookup, pandas_side, sqlite_side in lookups:
+            expected = lookup(pandas_side)
+            assert expected.equals(lookup(sqlite_side)), name
+            pandas_s = best_of(args.repeat, lambda: lookup(pandas_side))
+            sqlite_s = best_of(args.repeat, lambda: lookup(sqlite_side))
+            print(f"{name:28} {pandas_s * 1000:8.3f}ms {sqlite_s * 1000:8.3f}ms  {len(expected):,}")
+
+        pandas_bot = ElectionChatbot(df, tables, index=election_index)
+        sqlite_bot = ElectionChatbot(df, sql_booths, index=sql_index)
+        for query in QUERIES:
+            assert pandas_bot.process_query(query) == sqlite_bot.process_query(query), query
+        pandas_s = best_of(args.repeat, lambda: [pandas_bot.process_query(q) for q in QUERIES])
+        sqlite_s = best_of(args.repeat, lambda: [sqlite_bot.process_query(q) for q in QUERIES])
+        print(f"{'chatbot: ' + str(len(QUERIES)) + ' queries':28} {pandas_s * 1000:8.3f}ms {sqlite_s * 1000:8.3f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""Chatbot entity extraction: linear substring scan against the gazetteer trie, by vocabulary size.
+
+The scan is what the extractors did before: one ``in`` test of every name
+against the lowercased query. The gazetteer walks the query's tokens once,
+whatever the number of names.
+
+Usage: python benchmarks/bench_entities.py [--sizes N ...] [--repeat N]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from gazetteer import Gazetteer
+
+QUERIES = [
+    "How many votes did Suresh get in Nemom in 2024?",
+    "Who won in Kollam district?",
+    "Compare CPI and INC seats in Thrissur between 2023 and 2025",
+    "Which constituency had the closest contest?",
+]
+SYLLABLES = ['ra', 'jan', 'su', 'resh', 'mee', 'an', 'and', 'pri', 'ya', 'ma', 'noj', 'dee', 'pa', 'vi', 'jay', 'ku']
+
+
+def candidate_names(count, seed=0):
+    """Distinct synthetic given names plus surnames."""
+    rng = np.random.default_rng(seed)
+    names = set()
+    while len(names) < count:
+        parts = rng.choice(SYLLABLES, size=(count, 5))
+        lengths = rng.integers(2, 4, count)
+        names.update(f"{''.join(p[:n]).title()} {''.join(p[n:]).title()}" for p, n in zip(parts, lengths))
+    return sorted(names)[:count]
+
+
+def linear_scan(names, query):
+    lowered = query.lower()
+    return next((name for name in names if name.lower() in lowered), None)
+
+
+def per_query(repeat, fn):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for query in QUERIES:
+            fn(query)
+    return (time.perf_counter() - started) / (repeat * len(QUERIES))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000, 50000])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'names':>8} {'linear scan':>14} {'gazetteer':>12} {'build':>10}")
+    for size in args.sizes:
+        names = candidate_names(size)
+        started = time.perf_counter()
+        gazetteer = Gazetteer({'candidate': names})
+        build = time.perf_counter() - started
+        scan = per_query(args.repeat, lambda q: linear_scan(names, q))
+        trie = per_query(args.repeat, gazetteer.find)
+        print(f"{size:>8,} {scan * 1e6:12.1f}us {trie * 1e6:10.1f}us {build * 1000:8.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
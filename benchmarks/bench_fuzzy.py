@@ -0,0 +1,102 @@
+"""Fuzzy name matching: difflib.get_close_matches against the symmetric-delete index, by vocabulary size.
+
+The difflib path is the chatbot's previous fuzzy_match: lowercase every
+option and run get_close_matches on each call. Queries are names from the
+vocabulary with one or two typos introduced; "found" is the share of
+queries that come back as the name they were made from.
+
+Usage: python benchmarks/bench_fuzzy.py [--sizes N ...] [--queries N]
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+from difflib import get_close_matches
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fuzzy import FuzzyIndex
+
+# Name-like syllables; two to four of them give a vocabulary about as dense as real candidate lists.
+SYLLABLES = ['a', 'ra', 'jan', 'su', 'resh', 'mee', 'an', 'and', 'pri', 'ya', 'ma', 'noj', 'dee', 'pa', 'vi', 'jay',
+             'ku', 'kol', 'lam', 'thri', 'ssur', 'ne', 'mom', 'va', 'kka', 'la', 'bin', 'du', 'geo', 'rge', 'jo',
+             'se', 'pe', 'ter', 'u', 'mesh', 'sree', 'dha', 'ran', 'kri', 'shna', 'go', 'pal', 'ni', 'sha', 'ha',
+             'ri', 'das', 'mo', 'han', 'ch', 'and', 'ran', 'thomas', 'ab', 'dul', 'ra', 'him', 'ba', 'sheer']
+
+
+def vocabulary(count, seed=0):
+    """Distinct synthetic single-word names."""
+    rng = np.random.default_rng(seed)
+    names = set()
+    while len(names) < count:
+        lengths = rng.integers(2, 5, count)
+        parts = rng.choice(SYLLABLES, size=(count, 4))
+        names.update(''.join(p[:n]).title() for p, n in zip(parts, lengths))
+    return sorted(names)[:count]
+
+
+def misspell(name, rng):
+    """The name with one or two random substitutions, deletions or adjacent swaps."""
+    word = list(name.lower())
+    for _ in range(rng.integers(1, 3) if len(word) >= 6 else 1):
+        i = int(rng.integers(0, len(word) - 1))
+        edit = rng.integers(0, 3)
+        if edit == 0:
+            word[i] = chr(ord('a') + int(rng.integers(0, 26)))
+        elif edit == 1 and len(word) > 4:
+            del word[i]
+        else:
+            word[i], word[i + 1] = word[i + 1], word[i]
+    return ''.join(word)
+
+
+def difflib_match(query, options):
+    query_lower = query.lower().strip()
+    for opt in options:
+        if opt.lower() == query_lower:
+            return opt
+    matches = get_close_matches(query_lower, [o.lower() for o in options], n=1, cutoff=0.6)
+    return next((opt for opt in options if matches and opt.lower() == matches[0]), None)
+
+
+def per_query(queries, fn):
+    started = time.perf_counter()
+    results = [fn(query) for query in queries]
+    return (time.perf_counter() - started) / len(queries), results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000, 100000])
+    parser.add_argument('--queries', type=int, default=50)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(1)
+    print(f"{'names':>8} {'difflib':>12} {'found':>6} {'index':>10} {'found':>6} {'build':>8} {'index MB':>9}")
+    for size in args.sizes:
+        names = vocabulary(size)
+        sources = [names[i] for i in rng.integers(0, len(names), args.queries)]
+        queries = [misspell(name, rng) for name in sources]
+        started = time.perf_counter()
+        index = FuzzyIndex(names)
+        build = time.perf_counter() - started
+        tracemalloc.start()
+        measured = FuzzyIndex(names)
+        memory = tracemalloc.get_traced_memory()[0] / 2 ** 20
+        tracemalloc.stop()
+        del measured
+        # difflib is slow at the larger sizes; a few queries give its per-query cost.
+        sample = max(3, args.queries * 1000 // size)
+        difflib_time, expected = per_query(queries[:sample], lambda q: difflib_match(q, names))
+        index_time, found = per_query(queries, index.lookup)
+        difflib_found = sum(a == b for a, b in zip(expected, sources)) / len(expected)
+        index_found = sum(a == b for a, b in zip(found, sources)) / len(found)
+        print(f"{size:>8,} {difflib_time * 1000:10.2f}ms {difflib_found:6.0%} {index_time * 1000:8.3f}ms "
+              f"{index_found:6.0%} {build:7.2f}s {memory:9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""Chatbot intent detection: the old keyword if-chain against the compiled intent classifier.
+
+The if-chain is what process_query did before: a fixed sequence of
+substring scans where the first list with a hit wins. Both are scored on
+the labeled queries in intent_queries.csv (intent "none" means the
+fallback answer), and timed per query on the intent step alone, after
+the query has been parsed and its entities extracted.
+
+Exits non-zero when the classifier's accuracy or latency misses the
+given limits, so it can guard changes to the intent table.
+
+Usage: python benchmarks/bench_intents.py [--repeat N] [--min-accuracy F] [--max-us F] [--verbose]
+"""
+import argparse
+import csv
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from chatbot import ElectionChatbot
+from utils import read_election_data
+
+QUERIES_PATH = Path(__file__).resolve().parent / 'intent_queries.csv'
+# The chain before the classifier, in its original order.
+CHAIN = [
+    ('winner', ['who won', 'winner', 'won in', 'victory', 'elected']),
+    ('runner_up', ['runner up', 'second place', 'came second', '2nd place', 'runner-up']),
+    ('votes', ['how many votes', 'votes did', 'vote count', 'total votes']),
+    ('landslide', ['landslide', 'biggest margin', 'largest margin', 'highest margin', 'biggest win',
+                   'biggest victory']),
+    ('turnout', ['highest turnout', 'lowest turnout', 'best turnout', 'worst turnout']),
+    ('margin', ['margin', 'won by', 'victory margin', 'winning margin']),
+    ('closest', ['closest', 'narrowest', 'tightest', 'nail-biter']),
+    ('compare', ['compare', 'comparison', 'vs', 'versus', 'difference between']),
+    ('party', ['party', 'seats', 'how many seats']),
+    ('district_results', ['results for', 'show results', 'all results', 'district summary']),
+    ('projection', ['what if', 'simulate', 'projection', 'project seats', 'chance of winning', 'majority']),
+    ('exit_poll', ['exit poll', 'prediction', 'forecast']),
+    ('help', ['help', 'what can you', 'how to use']),
+]
+
+
+def keyword_chain(query_lower, slots):
+    if slots['booth_id']:
+        return 'booth'
+    for intent, words in CHAIN:
+        if any(word in query_lower for word in words):
+            return intent
+    if slots['constituency']:
+        return 'constituency'
+    if slots['district']:
+        return 'district'
+    return 'none'
+
+
+def compiled_classifier(bot, query_lower, slots):
+    ranked = bot.intents.classify(query_lower, slots)
+    return ranked[0].intent if ranked else 'none'
+
+
+def evaluate(labeled, detect, repeat):
+    """Accuracy, mean microseconds per query and the misclassified queries."""
+    wrong = [(query, intent, detect(frame, slots)) for query, intent, frame, slots in labeled
+             if detect(frame, slots) != intent]
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for _, _, frame, slots in labeled:
+            detect(frame, slots)
+    per_query = (time.perf_counter() - started) / (repeat * len(labeled))
+    return 1 - len(wrong) / len(labeled), per_query * 1e6, wrong
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=200)
+    parser.add_argument('--min-accuracy', type=float, default=0.95)
+    parser.add_argument('--max-us', type=float, default=50.0, help="classifier microseconds per query")
+    parser.add_argument('--verbose', action='store_true', help="list misclassified queries")
+    args = parser.parse_args()
+    logging.getLogger('streamlit').setLevel(logging.ERROR)
+
+    bot = ElectionChatbot(read_election_data())
+    with open(QUERIES_PATH, newline='') as f:
+        rows = list(csv.DictReader(f))
+    labeled = []
+    for row in rows:
+        frame = bot.parse(row['query'])
+        labeled.append((row['query'], row['intent'], frame, bot.extract_slots(frame)))
+
+    started = time.perf_counter()
+    for _ in range(args.repeat // 10 or 1):
+        for query, _, _, _ in labeled:
+            bot.classify(query)
+    end_to_end = (time.perf_counter() - started) / ((args.repeat // 10 or 1) * len(labeled))
+
+    print(f"{len(labeled)} labeled queries")
+    print(f"{'detector':>12} {'accuracy':>9} {'per query':>11}")
+    results = {}
+    for name, detect in [('if-chain', lambda frame, slots: keyword_chain(frame.lower, slots)),
+                         ('classifier', lambda frame, slots: compiled_classifier(bot, frame.lower, slots))]:
+        accuracy, micros, wrong = evaluate(labeled, detect, args.repeat)
+        results[name] = (accuracy, micros)
+        print(f"{name:>12} {accuracy:8.1%} {micros:9.1f}us")
+        if args.verbose:
+            for query, expected, got in wrong:
+                print(f"{'':>14}{query!r}: expected {expected}, got {got}")
+    print(f"parse, extract and classify: {end_to_end * 1e6:.1f}us per query")
+
+    accuracy, micros = results['classifier']
+    if accuracy < args.min_accuracy or micros > args.max_us:
+        print(f"FAIL: classifier accuracy {accuracy:.1%} (min {args.min_accuracy:.0%}), "
+              f"{micros:.1f}us per query (max {args.max_us:.0f}us)")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
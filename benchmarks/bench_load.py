@@ -0,0 +1,40 @@
+"""Compare cold (CSV parse) and warm (columnar cache) election data loads.
+
+Also prints the memory saved by the compact frame (object strings to categoricals, downcast integers).
+
+Usage: python benchmarks/bench_load.py [--csv PATH] [--repeat N]
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from datastore import cached_read_csv, load_report
+from utils import BASE_DIR, compact_frame, memory_report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--csv', default=str(BASE_DIR / "data" / "kerala_election_data.csv"))
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = Path(tmp) / "columns"
+        cold = cached_read_csv(args.csv, prepare=compact_frame, cache_dir=cache_dir)
+        print(f"cold: {len(cold):,} rows {load_report(cold)}")
+        print(f"memory: {memory_report(cold)}")
+
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            warm = cached_read_csv(args.csv, prepare=compact_frame, cache_dir=cache_dir)
+            timings.append(time.perf_counter() - started)
+        print(f"warm: {len(warm):,} rows {load_report(warm)}, best of {args.repeat}: {min(timings) * 1000:,.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Per-rerun data access overhead: st.cache_data copies against shared read-only handles.
+
+``st.cache_data`` pickles its return value once and unpickles a fresh copy
+on every call, which every page did on every rerun. The shared handles are
+cached as resources over memory-mapped columns, so a rerun only pays for a
+cache lookup and a shallow view.
+
+Usage: python benchmarks/bench_rerun.py [--booths-per-constituency N] [--years N] [--repeat N]
+"""
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import streamlit as st
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from booths import PartitionedBoothTables
+from datastore import read_only_view, shared_frames
+from selection import year_partitions
+from utils import generate_booth_tables, read_election_data
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--booths-per-constituency', type=int, default=200)
+    parser.add_argument('--years', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    logging.getLogger('streamlit').setLevel(logging.ERROR)
+
+    election = read_election_data()
+    tables = generate_booth_tables(args.booths_per_constituency, args.years)
+    tables.booths.attrs['partitions'] = year_partitions(tables.booths, bounds=('booth_id',))
+    print(f"{len(election):,} election rows, {len(tables.booths):,} booths, {len(tables.results):,} booth results")
+
+    @st.cache_data
+    def cached_election():
+        return election
+
+    @st.cache_data
+    def cached_booth_data():
+        return tables.wide()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        @st.cache_resource
+        def shared_election():
+            return shared_frames('election', 'bench', lambda: {'results': election}, root=tmp)['results']
+
+        @st.cache_resource
+        def shared_booths():
+            frames = shared_frames('booths', 'bench',
+                                   lambda: {'booths': tables.booths, 'results': tables.results}, root=tmp)
+            return PartitionedBoothTables(frames['booths'], frames['results'])
+
+        runs = [
+            ("election: cache_data", cached_election),
+            ("election: shared handle", lambda: read_only_view(shared_election())),
+            ("booths: cache_data (wide)", cached_booth_data),
+            ("booths: shared tables", shared_booths),
+        ]
+        print(f"{'per rerun':28} {'time':>12}")
+        for name, access in runs:
+            access()
+            print(f"{name:28} {best_of(args.repeat, access) * 1000:10.3f}ms")
+
+
+if __name__ == '__main__':
+    main()
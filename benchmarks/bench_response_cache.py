@@ -0,0 +1,68 @@
+"""Chatbot answers with and without the response cache, for the example questions and paraphrases of them.
+
+The first pass answers every question cold; later passes hit the cache,
+which is keyed on the intent and entities rather than the text, so a
+paraphrase of an answered question is a hit too. The uncached column
+answers with a cache of size zero.
+
+Usage: python benchmarks/bench_response_cache.py [--repeat N]
+"""
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from chatbot import ElectionChatbot
+from utils import read_election_data, generate_booth_tables
+
+PARAPHRASES = [
+    "who won thiruvananthapuram 2024",
+    "Winner in Thiruvananthapuram, 2024?",
+    "show results for kollam district",
+    "Margin in Nemom?",
+    "how many seats did cpi win in 2024",
+    "Which was the closest contest?",
+    "compare 2023 and 2024 vattiyoorkavu",
+]
+
+
+def timed(bot, questions, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for question in questions:
+            bot.process_query(question)
+    return (time.perf_counter() - started) / (repeat * len(questions))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    logging.getLogger('streamlit').setLevel(logging.ERROR)
+
+    results = read_election_data()
+    booth_tables = generate_booth_tables()
+    cached = ElectionChatbot(results, booth_tables, data_version='bench')
+    uncached = ElectionChatbot(results, booth_tables, cache_size=0)
+    questions = cached.get_example_questions()
+
+    uncached_time = timed(uncached, questions + PARAPHRASES, args.repeat)
+    cold = timed(cached, questions, 1)
+    paraphrased = timed(cached, PARAPHRASES, 1)
+    paraphrase_stats = cached.cache.stats()
+    warm = timed(cached, questions + PARAPHRASES, args.repeat)
+
+    print(f"{'uncached':>20} {uncached_time * 1e6:10.1f}us per question")
+    print(f"{'cached, first ask':>20} {cold * 1e6:10.1f}us per question")
+    print(f"{'paraphrases':>20} {paraphrased * 1e6:10.1f}us per question "
+          f"({paraphrase_stats['hits']} hits after {len(questions)} questions)")
+    print(f"{'cached, repeated':>20} {warm * 1e6:10.1f}us per question")
+    stats = cached.cache.stats()
+    print(f"cache: {stats['hits']} hits, {stats['misses']} misses, {stats['size']}/{stats['max_size']} entries")
+
+
+if __name__ == '__main__':
+    main()
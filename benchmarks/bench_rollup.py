@@ -0,0 +1,53 @@
+"""Booth rollups: full rebuild against an incremental update of one batch of booths.
+
+A corrected batch only touches its booths' constituency, district and state
+nodes, so the update cost follows the batch size, not the number of booths.
+
+Usage: python benchmarks/bench_rollup.py [--booths-per-constituency N] [--years N] [--batch N] [--repeat N]
+"""
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from booths import BoothTables
+from rollup import BoothRollup
+from utils import generate_booth_tables
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--booths-per-constituency', type=int, default=200)
+    parser.add_argument('--years', type=int, default=3)
+    parser.add_argument('--batch', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    logging.getLogger('streamlit').setLevel(logging.ERROR)
+
+    tables = generate_booth_tables(args.booths_per_constituency, args.years)
+    booths = tables.booths.iloc[:args.batch].copy()
+    booths['votes_polled'] = booths['votes_polled'] + 1
+    batch = BoothTables(booths, tables.results[tables.results['booth_key'].isin(booths['booth_key'])])
+    print(f"{len(tables.booths):,} booths, {len(tables.results):,} booth results, batch of {len(booths):,}")
+
+    rollup = BoothRollup.from_tables(tables)
+    rebuild = best_of(args.repeat, lambda: BoothRollup.from_tables(tables))
+    update = best_of(args.repeat, lambda: rollup.update(batch))
+    print(f"{'full rebuild':20} {rebuild * 1000:10.2f}ms")
+    print(f"{'incremental update':20} {update * 1000:10.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Monte Carlo seat projection: draws per second on one core and across worker processes.
+
+Runs the simulator over a synthetic state of --seats constituencies and
+--parties parties in --districts districts. An interactive run (10,000
+draws over Kerala's 140 seats) should finish well under a second on one
+core; --workers splits larger runs across processes.
+
+Usage: python benchmarks/bench_simulator.py [--seats N] [--parties N] [--districts N] [--draws N ...] [--workers N] [--repeat N]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from simulator import SeatSimulator
+from swing import SwingEngine
+
+
+def synthetic_results(seats, parties, districts, seed=0):
+    """One candidate per party in every seat, with Dirichlet-distributed vote shares."""
+    rng = np.random.default_rng(seed)
+    votes = (rng.dirichlet(np.full(parties, 2.0), seats) * 100000).astype(np.int64)
+    seat = np.repeat(np.arange(seats), parties)
+    flat = votes.ravel()
+    winner = np.zeros(len(flat), dtype=bool)
+    winner[seat * parties + votes.argmax(axis=1)[seat]] = True
+    return pd.DataFrame({
+        'year': 2024,
+        'district': [f"District {s % districts}" for s in seat],
+        'constituency': [f"Seat {s}" for s in seat],
+        'candidate': [f"Candidate {i}" for i in range(len(flat))],
+        'party': [f"P{p}" for p in np.tile(np.arange(parties), seats)],
+        'votes': flat,
+        'winner': winner,
+    })
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--seats', type=int, default=140)
+    parser.add_argument('--parties', type=int, default=6)
+    parser.add_argument('--districts', type=int, default=14)
+    parser.add_argument('--draws', type=int, nargs='+', default=[10000, 50000, 200000])
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    simulator = SeatSimulator(SwingEngine(synthetic_results(args.seats, args.parties, args.districts)), 2024)
+    print(f"{args.seats} seats, {args.parties} parties, {args.districts} districts")
+    print(f"{'draws':>10} {'1 worker':>12} {f'{args.workers} workers':>12}")
+    for draws in args.draws:
+        single = best_of(args.repeat, lambda: simulator.run(draws=draws))
+        parallel = best_of(args.repeat, lambda: simulator.run(draws=draws, workers=args.workers))
+        print(f"{draws:>10,} {single * 1000:10.1f}ms {parallel * 1000:10.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+import threading
+import numpy as np
+import pandas as pd
+from typing import Optional, List, Dict, Any
+
+from selection import year_partitions
+
+BOOTH_COLUMNS = ['year', 'district', 'constituency', 'booth_id', 'booth_no', 'booth_serial', 'booth_place',
+                 'booth_name', 'total_voters', 'votes_polled', 'previous_error', 'postal_votes', 'tendered_votes']
+
+
+class BoothTables:
+    """Booth data as a booth dimension table plus a narrow candidate-results fact table.
+
+    ``booths`` has one row per booth, keyed by ``booth_key`` (its row
+    position), holding the booth metrics together with the precomputed
+    winner, margin and turnout. ``results`` has one (booth_key, candidate,
+    party, votes) row per candidate, sorted by booth_key so a booth's
+    candidates are the slice ``result_start:result_stop``.
+
+    Generated booths carry ``booth_no`` and a categorical ``booth_place``
+    instead of a near-unique ``booth_name`` string, so the table stays
+    fixed-width and maps zero-copy from the shared store; ``with_names``
+    formats the names for the rows being shown. ``booth_id`` is unique per
+    year; ``booth_serial``, the booth's number within its constituency,
+    identifies the same booth across years.
+    """
+
+    def __init__(self, booths: pd.DataFrame, results: pd.DataFrame):
+        self.booths = booths
+        self.results = results
+        self._booth_ids: Optional[pd.Index] = None
+        # A year slice of larger tables keeps the global booth keys and result positions.
+        self._key_offset = int(booths['booth_key'].iloc[0]) if 'booth_key' in booths.columns and len(booths) else 0
+        self._result_offset = int(booths['result_start'].iloc[0]) if 'result_start' in booths.columns and len(booths) else 0
+
+    @classmethod
+    def from_results(cls, booths: pd.DataFrame, results: pd.DataFrame) -> 'BoothTables':
+        """Attach the per-booth winner, margin, turnout and result ranges to a booth table."""
+        booths = booths.reset_index(drop=True)
+        results = results.sort_values('booth_key', kind='mergesort').reset_index(drop=True)
+        keys = results['booth_key'].to_numpy()
+        votes = results['votes'].to_numpy()
+        counts = np.bincount(keys, minlength=len(booths))
+        stops = np.cumsum(counts)
+        starts = stops - counts
+
+        # Within each booth, order candidates by votes: first is the winner, second the runner-up.
+        ranked = np.lexsort((-votes.astype(np.int64), keys))
+        has_winner = counts > 0
+        first = ranked[starts[has_winner]]
+        second_ok = counts[has_winner] > 1
+        runner_up_votes = np.zeros(has_winner.sum(), dtype=np.int64)
+        runner_up_votes[second_ok] = votes[ranked[starts[has_winner][second_ok] + 1]]
+
+        booths = booths.copy()
+        booths['booth_key'] = np.arange(len(booths), dtype=np.int32)
+        booths['result_start'] = starts.astype(np.int32)
+        booths['result_stop'] = stops.astype(np.int32)
+        for source, target in (('candidate', 'winner_candidate'), ('party', 'winner_party')):
+            codes = np.full(len(booths), -1, dtype=results[source].cat.codes.dtype)
+            codes[has_winner] = results[source].cat.codes.to_numpy()[first]
+            booths[target] = pd.Categorical.from_codes(codes, dtype=results[source].dtype)
+        margin = np.zeros(len(booths), dtype=np.int32)
+        margin[has_winner] = votes[first] - runner_up_votes
+        booths['margin'] = margin
+        with np.errstate(divide='ignore', invalid='ignore'):
+            turnout = booths['votes_polled'].to_numpy() / booths['total_voters'].to_numpy() * 100
+        booths['turnout_percentage'] = np.round(turnout, 1)
+        return cls(booths, results)
+
+    def booth_results(self, booth_key: int) -> pd.DataFrame:
+        """Candidate rows of one booth."""
+        booth = self.booths.iloc[int(booth_key) - self._key_offset]
+        start = int(booth['result_start']) - self._result_offset
+        stop = int(booth['result_stop']) - self._result_offset
+        return self.results.iloc[start:stop]
+
+    def find(self, booth_id: int, year: Optional[int] = None) -> Optional[pd.Series]:
+        """Booth row for a booth ID (optionally only in the given year), or None."""
+        if self._booth_ids is None:
+            self._booth_ids = pd.Index(self.booths['booth_id']) if 'booth_id' in self.booths.columns else pd.Index([])
+        position = self._booth_ids.get_indexer([booth_id])[0]
+        if position < 0:
+            return None
+        booth = self.booths.iloc[position]
+        if year is not None and int(booth['year']) != int(year):
+            return None
+        return booth
+
+    @staticmethod
+    def with_names(booths: pd.DataFrame) -> pd.DataFrame:
+        """Booth rows with a ``booth_name`` column."""
+        if 'booth_name' in booths.columns or 'booth_place' not in booths.columns:
+            return booths
+        names = [f"Booth {no} - {place}" for no, place in zip(booths['booth_no'], booths['booth_place'])]
+        return booths.assign(booth_name=names)
+
+    def booth_name(self, booth: pd.Series) -> str:
+        """Display name of one booth row."""
+        if 'booth_name' in booth.index:
+            return str(booth['booth_name'])
+        return f"Booth {booth['booth_no']} - {booth['booth_place']}"
+
+    def wide(self) -> pd.DataFrame:
+        """Denormalized view with the booth metrics repeated on every candidate row."""
+        booths = self.with_names(self.booths)
+        columns = [col for col in BOOTH_COLUMNS if col in booths.columns and col not in ('booth_no', 'booth_place')]
+        booth_part = booths[columns].take(self.results['booth_key'].to_numpy())
+        wide = pd.concat([booth_part.reset_index(drop=True),
+                          self.results[['candidate', 'party', 'votes']].reset_index(drop=True)], axis=1)
+        winner_codes = self.booths['winner_candidate'].cat.codes.to_numpy()
+        wide['winner'] = self.results['candidate'].cat.codes.to_numpy() == \
+            winner_codes[self.results['booth_key'].to_numpy()]
+        return wide
+
+    def memory_usage(self) -> int:
+        """Bytes held by both tables."""
+        return int(self.booths.memory_usage(deep=True).sum() + self.results.memory_usage(deep=True).sum())
+
+
+class PartitionedBoothTables(BoothTables):
+    """BoothTables stored year by year, whose lookups only touch the year a booth belongs to.
+
+    The catalog (``booths.attrs['partitions']``) gives every year's booth
+    rows and booth ID range, so a booth is found by indexing a single year
+    and its candidates are read from that year's slice of ``results``.
+    """
+
+    def __init__(self, booths: pd.DataFrame, results: pd.DataFrame, partitions: List[Dict[str, Any]] = None):
+        super().__init__(booths, results)
+        if partitions is None:
+            partitions = booths.attrs.get('partitions') or year_partitions(booths, bounds=('booth_id',))
+        self.partitions = partitions
+        self._years: Dict[int, BoothTables] = {}
+        self._lock = threading.Lock()
+
+    def year(self, year: int) -> Optional[BoothTables]:
+        """Tables holding one year's booths, or None for a year not in the catalog."""
+        year = int(year)
+        tables = self._years.get(year)
+        if tables is None:
+            entry = next((entry for entry in self.partitions if entry['year'] == year), None)
+            if entry is None:
+                return None
+            with self._lock:
+                tables = self._years.get(year)
+                if tables is None:
+                    tables = self._years[year] = self._slice(*entry['rows'])
+        return tables
+
+    def _slice(self, start: int, stop: int) -> BoothTables:
+        booths = self.booths.iloc[start:stop]
+        if booths.empty:
+            return BoothTables(booths, self.results.iloc[0:0])
+        first = int(booths['result_start'].iloc[0])
+        last = int(booths['result_stop'].iloc[-1])
+        return BoothTables(booths, self.results.iloc[first:last])
+
+    def booth_results(self, booth_key: int) -> pd.DataFrame:
+        """Candidate rows of one booth."""
+        for entry in self.partitions:
+            start, stop = entry['rows']
+            if start <= int(booth_key) < stop:
+                return self.year(entry['year']).booth_results(booth_key)
+        return self.results.iloc[0:0]
+
+    def find(self, booth_id: int, year: Optional[int] = None) -> Optional[pd.Series]:
+        """Booth row for a booth ID (optionally only in the given year), or None."""
+        for entry in self.partitions:
+            if year is not None and entry['year'] != int(year):
+                continue
+            low, high = entry.get('booth_id', (booth_id, booth_id))
+            if low <= booth_id <= high:
+                booth = self.year(entry['year']).find(booth_id)
+                if booth is not None:
+                    return booth
+        return None
+
@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+from typing import Optional, List, Dict, Tuple
+
+BOOTH_KEY = ['district', 'constituency', 'booth_serial']
+
+
+def booth_serials(booths: pd.DataFrame) -> np.ndarray:
+    """Booth numbers within each (year, constituency), in booth_id order, for tables that do not record them."""
+    ordered = booths.sort_values('booth_id', kind='mergesort')
+    serials = ordered.groupby(['year', 'district', 'constituency'], observed=True, sort=False).cumcount() + 1
+    return serials.reindex(booths.index).to_numpy()
+
+
+class BoothSwing:
+    """Booths aligned across years by (district, constituency, booth_serial), with every year pair's swing.
+
+    ``rows[key, year]`` is the booth row of a stable booth key in a year
+    (-1 where the booth did not exist). Keys are sorted by constituency,
+    so a constituency is a contiguous range of keys, and the turnout,
+    margin and votes-polled changes and the winner-party changes of every
+    booth are computed for all year pairs at construction. A
+    constituency's booth-swing table is then a slice, not a join.
+    """
+
+    def __init__(self, booths: pd.DataFrame):
+        booths = booths.reset_index(drop=True)
+        serial = booths['booth_serial'].to_numpy() if 'booth_serial' in booths.columns else booth_serials(booths)
+        keyed = pd.DataFrame({'district': booths['district'].astype(str),
+                              'constituency': booths['constituency'].astype(str),
+                              'booth_serial': serial})
+        order = np.lexsort((serial, keyed['constituency'].to_numpy(dtype=str), keyed['district'].to_numpy(dtype=str)))
+        key_of_row = np.empty(len(booths), dtype=np.int64)
+        key_of_row[order] = keyed.iloc[order].groupby(BOOTH_KEY, sort=False).ngroup().to_numpy()
+        year_codes, years = pd.factorize(booths['year'], sort=True)
+        self.years: List[int] = [int(y) for y in years]
+        self._year = {year: i for i, year in enumerate(self.years)}
+
+        n_keys = int(key_of_row.max()) + 1 if len(booths) else 0
+        first = np.zeros(n_keys, dtype=np.int64)
+        first[key_of_row[::-1]] = np.arange(len(booths))[::-1]
+        self.keys = keyed.iloc[first].reset_index(drop=True)
+        self.rows = np.full((n_keys, len(self.years)), -1, dtype=np.int64)
+        self.rows[key_of_row, year_codes] = np.arange(len(booths))
+        self.booths = booths
+
+        # Constituency (and district) -> its range of keys.
+        self._ranges: Dict[Tuple, Tuple[int, int]] = {}
+        for columns in (['district'], ['district', 'constituency']):
+            spans = self.keys.groupby(columns, sort=False).indices
+            for area, positions in spans.items():
+                area = area if isinstance(area, tuple) else (area,)
+                self._ranges[tuple(str(part) for part in area)] = (int(positions[0]), int(positions[-1]) + 1)
+
+        present = self.rows >= 0
+        take = np.maximum(self.rows, 0)
+        turnout = booths['turnout_percentage'].to_numpy(dtype=np.float64)[take]
+        margin = booths['margin'].to_numpy().astype(np.int64)[take]
+        polled = booths['votes_polled'].to_numpy().astype(np.int64)[take]
+        party_codes, self.parties = pd.factorize(booths['winner_party'].astype(str), sort=True)
+        winner = np.where(present, party_codes[take], -1)
+        self.present = present
+        self.winner = winner
+        self.turnout = turnout
+        self.margin = margin
+        self.polled = polled
+
+        # Every year pair at once: [key, y1, y2] is the change from y1 to y2.
+        self.turnout_change = np.round(turnout[:, None, :] - turnout[:, :, None], 1)
+        self.margin_change = margin[:, None, :] - margin[:, :, None]
+        self.polled_change = polled[:, None, :] - polled[:, :, None]
+        self.winner_changed = winner[:, None, :] != winner[:, :, None]
+        self.aligned = present[:, None, :] & present[:, :, None]
+
+    def _keys(self, district: Optional[str], constituency: Optional[str]) -> np.ndarray:
+        if not district and not constituency:
+            return np.arange(len(self.keys))
+        if not district:
+            district = next((d for d, c in (area for area in self._ranges if len(area) == 2) if c == constituency), None)
+        area = (district, constituency) if constituency else (district,)
+        start, stop = self._ranges.get(area, (0, 0))
+        return np.arange(start, stop)
+
+    def compare(self, year1: int, year2: int, district: Optional[str] = None,
+                constituency: Optional[str] = None) -> pd.DataFrame:
+        """One row per booth present in both years within the area (the whole state by default).
+
+        Holds the booth IDs of both years, turnout in both years and its
+        change (points), votes polled change, winning party in both years,
+        whether it changed, and the margin change.
+        """
+        y1, y2 = self._year[int(year1)], self._year[int(year2)]
+        keys = self._keys(district, constituency)
+        keys = keys[self.aligned[keys, y1, y2]]
+        ids = self.booths['booth_id'].to_numpy()
+        parties = np.asarray(list(self.parties) + [''], dtype=object)
+        return pd.DataFrame({
+            'district': self.keys['district'].to_numpy()[keys],
+            'constituency': self.keys['constituency'].to_numpy()[keys],
+            'booth_serial': self.keys['booth_serial'].to_numpy()[keys],
+            f'booth_id_{year1}': ids[self.rows[keys, y1]],
+            f'booth_id_{year2}': ids[self.rows[keys, y2]],
+            f'turnout_{year1}': self.turnout[keys, y1],
+            f'turnout_{year2}': self.turnout[keys, y2],
+            'turnout_change': self.turnout_change[keys, y1, y2],
+            'polled_change': self.polled_change[keys, y1, y2],
+            f'winner_{year1}': parties[self.winner[keys, y1]],
+            f'winner_{year2}': parties[self.winner[keys, y2]],
+            'winner_changed': self.winner_changed[keys, y1, y2],
+            'margin_change': self.margin_change[keys, y1, y2],
+        })
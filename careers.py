@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+from typing import Optional, List, Dict, Tuple
+
+CANDIDATE_KEY = ['candidate', 'party', 'home_district']
+CAREER_COLUMNS = CANDIDATE_KEY + ['year', 'district', 'constituency', 'votes', 'winner', 'rank', 'candidates',
+                                  'share', 'deficit']
+
+
+def home_districts(results: pd.DataFrame) -> np.ndarray:
+    """Home district of the candidate on each result row, aligned with the rows.
+
+    A candidate's home district is the district they contested most often
+    under that name and party, ties going to the one they stood in first,
+    so a candidate who moves district keeps one home. A name and party
+    standing in several districts in the same year are namesakes, not one
+    person, and each keeps the district they contest in.
+    """
+    stands = pd.DataFrame({
+        'candidate': results['candidate'].astype(str).to_numpy(),
+        'party': results['party'].astype(str).to_numpy(),
+        'district': results['district'].astype(str).to_numpy(),
+        'year': results['year'].to_numpy(),
+    })
+    per_district = (stands.groupby(['candidate', 'party', 'district'], sort=False)['year']
+                    .agg(['size', 'min'])
+                    .sort_values(['size', 'min'], ascending=[False, True], kind='stable')
+                    .reset_index())
+    home = per_district.drop_duplicates(['candidate', 'party']).set_index(['candidate', 'party'])['district']
+    homes = home.reindex(pd.MultiIndex.from_frame(stands[['candidate', 'party']])).to_numpy()
+    same_year = stands.groupby(['candidate', 'party', 'year'], sort=False)['district'].transform('nunique') > 1
+    namesakes = same_year.groupby([stands['candidate'], stands['party']], sort=False).transform('any')
+    return np.where(namesakes.to_numpy(), stands['district'].to_numpy(), homes)
+
+
+def career_frame(results: pd.DataFrame) -> pd.DataFrame:
+    """One row per candidacy, grouped by candidate identity and in year order within it.
+
+    A candidate is identified by (name, party, home district), see
+    home_districts, so namesakes in other parties or districts are kept
+    apart while a candidate who contests a different district later stays
+    one identity. Namesakes of one party who never stand in the same year
+    are taken to be the same person. Every row carries the candidate's rank in the contest, share of
+    its votes in percent and deficit to the winner (0 for the winner),
+    computed in one sort of the candidate rows.
+    """
+    if results.empty:
+        return pd.DataFrame(columns=CAREER_COLUMNS)
+
+    contest = results.groupby(['year', 'district', 'constituency'], observed=True, sort=False).ngroup().to_numpy()
+    votes = results['votes'].to_numpy().astype(np.int64)
+    order = np.lexsort((-votes, contest))
+    counts = np.bincount(contest)
+    starts = np.cumsum(counts) - counts
+    rank = np.empty(len(votes), dtype=np.int64)
+    rank[order] = np.arange(len(votes)) - starts[contest[order]] + 1
+    totals = np.bincount(contest, weights=votes)
+    winner_votes = votes[order[starts]]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        share = np.where(totals[contest] > 0, votes / totals[contest] * 100, 0.0)
+
+    careers = pd.DataFrame({
+        'candidate': results['candidate'].array,
+        'party': results['party'].array,
+        'home_district': pd.Categorical(home_districts(results)),
+        'year': results['year'].to_numpy(),
+        'district': results['district'].array,
+        'constituency': results['constituency'].array,
+        'votes': results['votes'].to_numpy(),
+        'winner': results['winner'].to_numpy(dtype=bool),
+        'rank': rank.astype(np.int16),
+        'candidates': counts[contest].astype(np.int16),
+        'share': np.round(share, 2),
+        'deficit': (winner_votes[contest] - votes).astype(results['votes'].dtype),
+    })
+    identity = [careers[col].astype(str).to_numpy(dtype=str) for col in CANDIDATE_KEY]
+    ordered = np.lexsort((careers['year'].to_numpy(),) + tuple(reversed(identity)))
+    return careers.iloc[ordered].reset_index(drop=True)
+
+
+class CandidateIndex:
+    """Every candidate's contests, looked up by (name, party, home district).
+
+    The career frame is stored grouped by identity, so a candidate's
+    contests are one contiguous slice; a name maps to the identities of
+    everyone who stood under it.
+    """
+
+    def __init__(self, careers: pd.DataFrame):
+        self.frame = careers.reset_index(drop=True)
+        self._spans: Dict[Tuple[str, str, str], Tuple[int, int]] = {}
+        self._names: Dict[str, List[Tuple[str, str, str]]] = {}
+        if self.frame.empty:
+            return
+        identity = list(zip(*(self.frame[col].astype(str) for col in CANDIDATE_KEY)))
+        starts = [0] + [i for i in range(1, len(identity)) if identity[i] != identity[i - 1]]
+        stops = starts[1:] + [len(identity)]
+        for start, stop in zip(starts, stops):
+            key = identity[start]
+            self._spans[key] = (start, stop)
+            self._names.setdefault(key[0], []).append(key)
+
+    def identities(self, name: str, party: Optional[str] = None,
+                   district: Optional[str] = None) -> List[Tuple[str, str, str]]:
+        """(name, party, home district) of every candidate of that name, optionally narrowed down."""
+        return [key for key in self._names.get(name, [])
+                if (party is None or key[1] == party) and (district is None or key[2] == district)]
+
+    def career(self, name: str, party: Optional[str] = None, district: Optional[str] = None) -> pd.DataFrame:
+        """Contests of the matching candidates, one identity after another, each in year order."""
+        spans = [self._spans[key] for key in self.identities(name, party, district)]
+        if not spans:
+            return self.frame.iloc[0:0]
+        return self.frame.iloc[np.concatenate([np.arange(start, stop) for start, stop in spans])]
+
+    def contests(self, name: str, year: Optional[int] = None, constituency: Optional[str] = None,
+                 party: Optional[str] = None) -> pd.DataFrame:
+        """Contests of candidates of that name, optionally in one year, constituency or party."""
+        career = self.career(name, party)
+        if year is not None:
+            career = career[career['year'] == int(year)]
+        if constituency is not None:
+            career = career[career['constituency'] == constituency]
+        return career
@@ -1,14 +1,77 @@
 import pandas as pd
-import re
-from difflib import get_close_matches
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List, Dict, Any, Union, Callable
+from selection import ElectionIndex
+from booths import BoothTables
+from summary import constituency_summary
+from cube import PartyCube, party_cube_frame
+from careers import CandidateIndex, career_frame
+from leaderboard import Leaderboard, build_leaderboards
+from swing import SwingEngine
+from simulator import SeatSimulator
+from gazetteer import Gazetteer
+from fuzzy import FuzzyIndex
+from query import (QueryFrame, parse_query, phrases, LOSS_PATTERN, SWING_AFTER_PATTERN,
+                   SWING_BEFORE_PATTERN)
+from intents import Intent, IntentClassifier, IntentMatch
+from response_cache import DEFAULT_MAX_SIZE, MISSING, ResponseCache, cache_key
+
+# What each kind of question looks like and the slots its answer needs; ties go to the earlier intent.
+INTENTS = [
+    Intent('booth', {}, requires=('booth_id',), base=5.0),
+    Intent('winner', {'who won': 1.0, 'winner': 1.0, 'winners': 1.0, 'won in': 1.0, 'victory': 1.0, 'elected': 1.0},
+           requires=('location',)),
+    Intent('runner_up', {'runner up': 1.0, 'second place': 1.0, 'came second': 1.0, '2nd place': 1.0},
+           requires=('constituency',)),
+    Intent('votes', {'how many votes': 1.0, 'votes did': 1.0, 'vote count': 1.0, 'total votes': 1.0},
+           requires=('candidate',)),
+    Intent('landslide', {'landslide': 1.5, 'biggest margin': 1.5, 'largest margin': 1.5, 'highest margin': 1.5,
+                         'biggest win': 1.5, 'biggest wins': 1.5, 'biggest victory': 1.5}),
+    Intent('turnout', {'highest turnout': 1.5, 'lowest turnout': 1.5, 'best turnout': 1.5, 'worst turnout': 1.5}),
+    Intent('margin', {'margin': 1.2, 'margins': 1.2, 'won by': 1.0, 'victory margin': 1.2, 'winning margin': 1.2},
+           requires=('constituency',)),
+    Intent('closest', {'closest': 1.5, 'narrowest': 1.5, 'tightest': 1.5, 'nail biter': 1.5}),
+    Intent('compare', {'compare': 1.0, 'comparison': 1.0, 'vs': 1.0, 'versus': 1.0, 'difference between': 1.0},
+           requires=('constituency', 'year_pair')),
+    # A party's vote total is part of its performance, so vote phrases lean here when a party is named.
+    Intent('party', {'party': 1.0, 'seats': 1.0, 'how many seats': 1.0, 'how many votes': 0.8, 'vote count': 0.8,
+                     'total votes': 0.8}, requires=('party',)),
+    Intent('district_results', {'results for': 1.0, 'show results': 1.0, 'all results': 1.0,
+                                'district summary': 1.0}, requires=('district',)),
+    Intent('projection', {'what if': 1.0, 'simulate': 1.0, 'projection': 1.0, 'project seats': 1.0,
+                          'chance of winning': 1.0, 'chances of winning': 1.0,
+                          'majority': 1.0}),
+    Intent('exit_poll', {'exit poll': 1.0, 'exit polls': 1.0, 'prediction': 1.0, 'predictions': 1.0,
+                         'forecast': 1.0}),
+    Intent('help', {'help': 1.0, 'what can you': 1.0, 'how to use': 1.0}),
+    Intent('constituency', {}, requires=('constituency',), base=0.2),
+    Intent('district', {}, requires=('district',), base=0.1),
+]
+LOW_TURNOUT_PHRASES = phrases('lowest', 'worst')
+# Slots an answer can depend on; with the intent they key the response cache, so paraphrases share an entry.
+CACHE_KEY_SLOTS = ('year', 'district', 'constituency', 'candidate', 'party', 'booth_id', 'count', 'year_pair',
+                   'lowest', 'swing')
+# Simulated elections per chat projection: enough for whole-seat means, quick inside one chat turn.
+CHAT_PROJECTION_DRAWS = 2000
 
 class ElectionChatbot:
     """Intelligent chatbot for Kerala Election Analysis."""
     
-    def __init__(self, df: pd.DataFrame, booth_df: pd.DataFrame = None):
+    def __init__(self, df: pd.DataFrame, booth_tables: BoothTables = None, index: ElectionIndex = None,
+                 summary: ElectionIndex = None, cube: PartyCube = None,
+                 leaderboards: Dict[str, Leaderboard] = None, careers: CandidateIndex = None,
+                 swing: SwingEngine = None, cache_size: int = DEFAULT_MAX_SIZE, data_version: str = None,
+                 projector: Callable[..., Dict[str, Any]] = None):
         self.df = df
-        self.booth_df = booth_df
+        self.booth_tables = booth_tables
+        self.index = index if index is not None else ElectionIndex(df)
+        self.summary = summary if summary is not None else ElectionIndex(constituency_summary(df))
+        self.cube = cube if cube is not None else PartyCube(party_cube_frame(df))
+        self.leaderboards = leaderboards if leaderboards is not None else \
+            build_leaderboards(self.summary.frame, getattr(booth_tables, 'booths', None))
+        self.careers = careers if careers is not None else CandidateIndex(career_frame(df))
+        self.swing = swing if swing is not None else SwingEngine(df)
+        self.simulators: Dict[int, SeatSimulator] = {}
+        self.projector = projector
         
         self.districts = list(df['district'].unique()) if 'district' in df.columns else []
         self.constituencies = list(df['constituency'].unique()) if 'constituency' in df.columns else []
@@ -17,87 +80,91 @@ class ElectionChatbot:
         self.years = list(df['year'].unique()) if 'year' in df.columns else []
         
         self.all_locations = self.districts + self.constituencies
+        self.gazetteer = Gazetteer({'district': self.districts, 'constituency': self.constituencies,
+                                    'candidate': self.candidates, 'party': self.parties})
+        self.fuzzy = {'district': FuzzyIndex(self.districts), 'constituency': FuzzyIndex(self.constituencies),
+                      'candidate': FuzzyIndex(self.candidates)}
+        self.intents = IntentClassifier(INTENTS)
+        self.data_version = data_version
+        self.cache = ResponseCache(cache_size, data_version)
     
-    def fuzzy_match(self, query: str, options: List[str], cutoff: float = 0.6) -> Optional[str]:
-        """Find closest match for a query string."""
-        if not query or not options:
+    def fuzzy_match(self, query: str, kind: str) -> Optional[str]:
+        """Find the closest district, constituency or candidate name to a possibly misspelt word."""
+        if not query or kind not in self.fuzzy:
             return None
-        query_lower = query.lower().strip()
-        for opt in options:
-            if opt.lower() == query_lower:
-                return opt
-        matches = get_close_matches(query_lower, [o.lower() for o in options], n=1, cutoff=cutoff)
-        if matches:
-            for opt in options:
-                if opt.lower() == matches[0]:
-                    return opt
-        return None
+        return self.fuzzy[kind].lookup(query)
+    
+    def parse(self, query: Union[str, QueryFrame]) -> QueryFrame:
+        """Parse a query into the frame every extractor reads (a frame is returned as is)."""
+        return query if isinstance(query, QueryFrame) else parse_query(query, self.gazetteer)
     
-    def extract_year(self, text: str) -> Optional[int]:
+    def extract_year(self, text: Union[str, QueryFrame]) -> Optional[int]:
         """Extract year from text."""
-        year_match = re.search(r'\b(2023|2024|2025)\b', text)
-        if year_match:
-            return int(year_match.group(1))
-        return None
+        return next((year for year in self.parse(text).years if year in self.years), None)
     
-    def extract_location(self, text: str) -> Tuple[Optional[str], Optional[str]]:
+    def extract_location(self, text: Union[str, QueryFrame]) -> Tuple[Optional[str], Optional[str]]:
         """Extract district and/or constituency from text."""
-        text_lower = text.lower()
-        found_district = None
-        found_constituency = None
-        
-        for district in self.districts:
-            if district.lower() in text_lower:
-                found_district = district
-                break
-        
-        for const in self.constituencies:
-            if const.lower() in text_lower:
-                found_constituency = const
-                break
+        frame = self.parse(text)
+        found_district = frame.entity('district')
+        found_constituency = frame.entity('constituency')
         
         if not found_district and not found_constituency:
-            words = re.findall(r'\b[a-zA-Z]{4,}\b', text)
-            for word in words:
-                if word.lower() not in ['what', 'which', 'where', 'when', 'winner', 'votes', 'party', 'margin', 'results', 'show', 'tell', 'about', 'many', 'district', 'constituency', 'election', 'booth', 'compare', 'between']:
-                    match = self.fuzzy_match(word, self.districts)
-                    if match:
-                        found_district = match
-                        break
-                    match = self.fuzzy_match(word, self.constituencies)
-                    if match:
-                        found_constituency = match
-                        break
+            for word in frame.location_words:
+                match = self.fuzzy_match(word, 'district')
+                if match:
+                    found_district = match
+                    break
+                match = self.fuzzy_match(word, 'constituency')
+                if match:
+                    found_constituency = match
+                    break
         
         return found_district, found_constituency
     
-    def extract_candidate(self, text: str) -> Optional[str]:
+    def extract_candidate(self, text: Union[str, QueryFrame]) -> Optional[str]:
         """Extract candidate name from text."""
-        text_lower = text.lower()
-        for candidate in self.candidates:
-            if candidate.lower() in text_lower:
-                return candidate
-        words = re.findall(r'\b[A-Z][a-z]+\b', text)
-        for word in words:
-            match = self.fuzzy_match(word, self.candidates)
+        frame = self.parse(text)
+        candidate = frame.entity('candidate')
+        if candidate:
+            return candidate
+        for word in frame.name_words:
+            match = self.fuzzy_match(word, 'candidate')
             if match:
                 return match
         return None
     
-    def extract_party(self, text: str) -> Optional[str]:
+    def extract_party(self, text: Union[str, QueryFrame]) -> Optional[str]:
         """Extract party name from text."""
-        text_upper = text.upper()
-        for party in self.parties:
-            if party.upper() in text_upper:
-                return party
-        return None
+        return self.parse(text).entity('party')
     
-    def extract_booth(self, text: str) -> Optional[int]:
+    def extract_booth(self, text: Union[str, QueryFrame]) -> Optional[int]:
         """Extract booth ID from text."""
-        booth_match = re.search(r'booth\s*(?:id\s*)?(\d+)', text.lower())
-        if booth_match:
-            return int(booth_match.group(1))
-        return None
+        booth_ids = self.parse(text).booth_ids
+        return booth_ids[0] if booth_ids else None
+    
+    def extract_count(self, text: Union[str, QueryFrame]) -> Optional[int]:
+        """Extract a requested list length ("top 5") from text."""
+        return self.parse(text).count
+    
+    def extract_swing(self, text: Union[str, QueryFrame]) -> Dict[str, float]:
+        """Extract party swings in points ("BJP gains 3 points", "CPI -2%", "4 points to INC") from text."""
+        frame = self.parse(text)
+        swings = {}
+        for span in frame.entities('party'):
+            party = span.entities['party']
+            if party in swings:
+                continue
+            after = SWING_AFTER_PATTERN.match(frame.lower, span.end)
+            before = SWING_BEFORE_PATTERN.search(frame.lower, 0, span.start)
+            if after:
+                points = float(after.group(2))
+                if LOSS_PATTERN.search(after.group(1)):
+                    points = -abs(points)
+                swings[party] = points
+            elif before:
+                points = float(before.group(1))
+                swings[party] = -abs(points) if before.group(2) in ('from', 'against') else points
+        return swings
     
     def format_number(self, num: int) -> str:
         """Format number with commas."""
@@ -105,32 +172,23 @@ class ElectionChatbot:
     
     def get_winner(self, year: int = None, district: str = None, constituency: str = None) -> str:
         """Get winner for a specific location and year."""
-        filtered = self.df.copy()
-        
-        if year:
-            filtered = filtered[filtered['year'] == year]
-        if district:
-            filtered = filtered[filtered['district'] == district]
-        if constituency:
-            filtered = filtered[filtered['constituency'] == constituency]
+        filtered = self.index.select(year=year or None, district=district or None,
+                                     constituency=constituency or None)
         
         if filtered.empty:
             return None
         
-        winners = filtered[filtered['winner'] == 'Yes']
+        winners = filtered[filtered['winner']]
         if winners.empty:
             return None
         
         return winners
     
-    def get_candidate_votes(self, candidate: str, year: int = None, constituency: str = None) -> str:
-        """Get vote count for a candidate."""
-        filtered = self.df[self.df['candidate'] == candidate]
-        
-        if year:
-            filtered = filtered[filtered['year'] == year]
-        if constituency:
-            filtered = filtered[filtered['constituency'] == constituency]
+    def get_candidate_votes(self, candidate: str, year: int = None, constituency: str = None,
+                            party: str = None) -> pd.DataFrame:
+        """Get vote counts of everyone standing under a name, grouped by (name, party, home district)."""
+        filtered = self.careers.contests(candidate, year=year or None, constituency=constituency or None,
+                                         party=party or None)
         
         if filtered.empty:
             return None
@@ -139,131 +197,129 @@ class ElectionChatbot:
     
     def get_party_performance(self, party: str, year: int = None) -> Dict[str, Any]:
         """Get party performance stats."""
-        filtered = self.df.copy()
-        if year:
-            filtered = filtered[filtered['year'] == year]
-        
-        party_data = filtered[filtered['party'] == party]
-        if party_data.empty:
+        performance = self.cube.party(party, year or None)
+        if performance is None:
             return None
         
-        wins = party_data[party_data['winner'] == 'Yes']
-        total_votes = party_data['votes'].sum()
+        contests = self.summary.select(year=year or None)
+        wins = contests[contests['winner_party'] == party]
         
         return {
-            'seats_won': len(wins),
-            'total_votes': total_votes,
-            'constituencies': wins['constituency'].tolist() if not wins.empty else []
+            'seats_won': performance['seats'],
+            'total_votes': performance['votes'],
+            'constituencies': wins['constituency'].tolist()
         }
     
     def get_margin(self, year: int, constituency: str) -> Dict[str, Any]:
         """Get winning margin for a constituency."""
-        filtered = self.df[(self.df['year'] == year) & (self.df['constituency'] == constituency)]
-        
-        if filtered.empty:
+        contest = self.summary.select(year=year, constituency=constituency)
+        if contest.empty or contest['candidates'].iloc[0] < 2:
             return None
         
-        sorted_df = filtered.sort_values('votes', ascending=False)
-        if len(sorted_df) < 2:
-            return None
-        
-        winner = sorted_df.iloc[0]
-        runner_up = sorted_df.iloc[1]
-        margin = winner['votes'] - runner_up['votes']
-        
+        row = contest.iloc[0]
         return {
-            'winner': winner['candidate'],
-            'winner_party': winner['party'],
-            'winner_votes': winner['votes'],
-            'runner_up': runner_up['candidate'],
-            'runner_up_party': runner_up['party'],
-            'runner_up_votes': runner_up['votes'],
-            'margin': margin
+            'winner': row['winner_candidate'],
+            'winner_party': row['winner_party'],
+            'winner_votes': row['winner_votes'],
+            'runner_up': row['runner_up_candidate'],
+            'runner_up_party': row['runner_up_party'],
+            'runner_up_votes': row['runner_up_votes'],
+            'margin': row['margin']
         }
     
     def get_closest_contest(self, year: int = None) -> Dict[str, Any]:
         """Find the closest contest."""
-        filtered = self.df.copy()
-        if year:
-            filtered = filtered[filtered['year'] == year]
-        
-        min_margin = float('inf')
-        closest = None
-        
-        for const in filtered['constituency'].unique():
-            const_data = filtered[filtered['constituency'] == const]
-            sorted_df = const_data.sort_values('votes', ascending=False)
-            if len(sorted_df) >= 2:
-                margin = sorted_df.iloc[0]['votes'] - sorted_df.iloc[1]['votes']
-                if margin < min_margin:
-                    min_margin = margin
-                    closest = {
-                        'constituency': const,
-                        'winner': sorted_df.iloc[0]['candidate'],
-                        'runner_up': sorted_df.iloc[1]['candidate'],
-                        'margin': margin,
-                        'year': sorted_df.iloc[0]['year']
-                    }
-        
-        return closest
+        contests = self.get_top_contests('margin', year, largest=False, k=1)
+        return contests[0] if contests else None
+    
+    def get_top_contests(self, board: str, year: int = None, district: str = None, largest: bool = True,
+                         k: int = 5) -> List[Dict[str, Any]]:
+        """Top-k contests of a contest leaderboard ('margin' or 'winner_share')."""
+        top = self.leaderboards[board].top(k, year=year or None, district=district or None, largest=largest)
+        return [{
+            'constituency': row['constituency'],
+            'district': row['district'],
+            'winner': row['winner_candidate'],
+            'winner_party': row['winner_party'],
+            'runner_up': row['runner_up_candidate'],
+            'margin': row['margin'],
+            'winner_share': row['winner_share'],
+            'year': row['year']
+        } for _, row in top.iterrows()]
+    
+    def get_top_booths(self, board: str, year: int = None, district: str = None, largest: bool = True,
+                       k: int = 5) -> List[Dict[str, Any]]:
+        """Top-k booths of a booth leaderboard ('booth_turnout' or 'booth_margin')."""
+        if board not in self.leaderboards:
+            return []
+        top = BoothTables.with_names(self.leaderboards[board].top(k, year=year or None, district=district or None,
+                                                                  largest=largest))
+        return [{
+            'booth_id': row['booth_id'],
+            'booth_name': row['booth_name'],
+            'constituency': row['constituency'],
+            'turnout': row['turnout_percentage'],
+            'margin': row['margin'],
+            'winner': row['winner_candidate'],
+            'year': row['year']
+        } for _, row in top.iterrows()]
     
     def compare_years(self, year1: int, year2: int, constituency: str) -> Dict[str, Any]:
         """Compare results between two years."""
-        data1 = self.df[(self.df['year'] == year1) & (self.df['constituency'] == constituency)]
-        data2 = self.df[(self.df['year'] == year2) & (self.df['constituency'] == constituency)]
+        contest1 = self.summary.select(year=year1, constituency=constituency)
+        contest2 = self.summary.select(year=year2, constituency=constituency)
         
-        if data1.empty or data2.empty:
+        if contest1.empty or contest2.empty:
             return None
         
-        winner1 = data1[data1['winner'] == 'Yes'].iloc[0] if not data1[data1['winner'] == 'Yes'].empty else None
-        winner2 = data2[data2['winner'] == 'Yes'].iloc[0] if not data2[data2['winner'] == 'Yes'].empty else None
+        winner1 = contest1.iloc[0]
+        winner2 = contest2.iloc[0]
         
         return {
             'year1': year1,
             'year2': year2,
             'constituency': constituency,
-            'winner1': winner1['candidate'] if winner1 is not None else 'N/A',
-            'party1': winner1['party'] if winner1 is not None else 'N/A',
-            'votes1': winner1['votes'] if winner1 is not None else 0,
-            'winner2': winner2['candidate'] if winner2 is not None else 'N/A',
-            'party2': winner2['party'] if winner2 is not None else 'N/A',
-            'votes2': winner2['votes'] if winner2 is not None else 0
+            'winner1': winner1['winner_candidate'],
+            'party1': winner1['winner_party'],
+            'votes1': winner1['winner_votes'],
+            'winner2': winner2['winner_candidate'],
+            'party2': winner2['winner_party'],
+            'votes2': winner2['winner_votes']
         }
     
     def get_district_summary(self, district: str, year: int = None) -> Dict[str, Any]:
         """Get summary for a district."""
-        filtered = self.df[self.df['district'] == district]
-        if year:
-            filtered = filtered[filtered['year'] == year]
+        winners = self.summary.select(year=year or None, district=district)
         
-        if filtered.empty:
+        if winners.empty:
             return None
         
-        winners = filtered[filtered['winner'] == 'Yes']
-        party_wins = winners.groupby('party').size().to_dict()
+        tally = self.cube.slice(year or None, district).sort_values('party')
+        party_wins = {party: int(seats) for party, seats in zip(tally['party'], tally['seats']) if seats > 0}
+        winners = winners.rename(columns={'winner_candidate': 'candidate', 'winner_party': 'party',
+                                          'winner_votes': 'votes'})
         
         return {
             'district': district,
-            'total_constituencies': len(filtered['constituency'].unique()),
+            'total_constituencies': winners['constituency'].nunique(),
             'party_wins': party_wins,
             'winners': winners[['constituency', 'candidate', 'party', 'votes']].to_dict('records')
         }
     
     def get_booth_details(self, booth_id: int) -> Dict[str, Any]:
         """Get booth details if booth data exists."""
-        if self.booth_df is None or self.booth_df.empty:
+        if self.booth_tables is None:
             return None
         
-        booth_data = self.booth_df[self.booth_df['booth_id'] == booth_id]
-        if booth_data.empty:
+        booth_info = self.booth_tables.find(booth_id)
+        if booth_info is None:
             return None
         
-        booth_info = booth_data.iloc[0]
-        candidates = booth_data[['candidate', 'party', 'votes']].to_dict('records')
+        candidates = self.booth_tables.booth_results(booth_info['booth_key'])[['candidate', 'party', 'votes']].to_dict('records')
         
         return {
             'booth_id': booth_id,
-            'booth_name': booth_info.get('booth_name', 'N/A'),
+            'booth_name': self.booth_tables.booth_name(booth_info),
             'constituency': booth_info.get('constituency', 'N/A'),
             'district': booth_info.get('district', 'N/A'),
             'total_voters': booth_info.get('total_voters', 0),
@@ -271,155 +327,290 @@ class ElectionChatbot:
             'candidates': candidates
         }
     
+    def extract_slots(self, query: Union[str, QueryFrame]) -> Dict[str, Any]:
+        """Every entity slot an answer can use, extracted from one parsed query."""
+        frame = self.parse(query)
+        district, constituency = self.extract_location(frame)
+        years = [found for found in frame.years if found in self.years]
+        return {
+            'year': self.extract_year(frame),
+            'district': district,
+            'constituency': constituency,
+            'location': constituency or district,
+            'candidate': self.extract_candidate(frame),
+            'party': self.extract_party(frame),
+            'booth_id': self.extract_booth(frame),
+            'count': self.extract_count(frame),
+            'year_pair': (years[0], years[1]) if len(years) >= 2 else None,
+            'lowest': frame.mentions(LOW_TURNOUT_PHRASES),
+            'swing': tuple(self.extract_swing(frame).items()),
+        }
+    
+    def classify(self, query: Union[str, QueryFrame], slots: Dict[str, Any] = None) -> List[IntentMatch]:
+        """Ranked intents for a query, with confidences and any required slots it leaves empty."""
+        frame = self.parse(query)
+        return self.intents.classify(frame.lower, slots if slots is not None else self.extract_slots(frame))
+    
     def process_query(self, query: str) -> str:
         """Process user query and return response."""
-        query_lower = query.lower().strip()
-        
-        year = self.extract_year(query)
-        district, constituency = self.extract_location(query)
-        candidate = self.extract_candidate(query)
-        party = self.extract_party(query)
-        booth_id = self.extract_booth(query)
-        
-        if booth_id:
-            details = self.get_booth_details(booth_id)
-            if details:
-                winner = None
-                max_votes = 0
-                for c in details['candidates']:
-                    if c['votes'] > max_votes:
-                        max_votes = c['votes']
-                        winner = c
-                
-                response = f"🏛️ **Booth {details['booth_id']}** - {details['booth_name']}\n\n"
-                response += f"📍 Location: {details['constituency']}, {details['district']}\n"
-                response += f"👥 Total Voters: {self.format_number(details['total_voters'])}\n"
-                response += f"🗳️ Votes Polled: {self.format_number(details['votes_polled'])}\n\n"
-                if winner:
-                    response += f"🏆 Winner: **{winner['candidate']}** ({winner['party']}) - {self.format_number(winner['votes'])} votes"
+        frame = self.parse(query)
+        slots = self.extract_slots(frame)
+        
+        for match in self.classify(frame, slots):
+            key = cache_key(match.intent, slots, CACHE_KEY_SLOTS)
+            response = self.cache.get(key, self.data_version)
+            if response is MISSING:
+                response = getattr(self, f'answer_{match.intent}')(slots)
+                self.cache.put(key, response, self.data_version)
+            if response:
                 return response
-            else:
-                return f"❌ I couldn't find booth {booth_id} in the database. Try booth IDs between 1001-1140."
         
-        if any(word in query_lower for word in ['who won', 'winner', 'won in', 'victory', 'elected']):
-            if not year:
-                year = max(self.years) if self.years else 2024
+        return self.get_fallback_response()
+    
+    def answer_booth(self, slots: Dict[str, Any]) -> Optional[str]:
+        """Details and winner of one booth."""
+        booth_id = slots['booth_id']
+        details = self.get_booth_details(booth_id)
+        if details:
+            winner = None
+            max_votes = 0
+            for c in details['candidates']:
+                if c['votes'] > max_votes:
+                    max_votes = c['votes']
+                    winner = c
             
-            winners = self.get_winner(year, district, constituency)
-            if winners is not None and not winners.empty:
-                if constituency:
-                    w = winners.iloc[0]
-                    margin_data = self.get_margin(year, constituency)
-                    margin_text = f" with a margin of {self.format_number(margin_data['margin'])} votes" if margin_data else ""
-                    return f"🏆 **{w['candidate']}** ({w['party']}) won in **{constituency}** in {year}{margin_text}!\n\n🗳️ Total Votes: {self.format_number(w['votes'])}"
-                elif district:
-                    response = f"🏆 **Winners in {district} District ({year}):**\n\n"
-                    for _, w in winners.iterrows():
-                        response += f"• **{w['constituency']}**: {w['candidate']} ({w['party']}) - {self.format_number(w['votes'])} votes\n"
-                    return response
-                else:
-                    return f"Please specify a district or constituency. For example: 'Who won in Thiruvananthapuram in {year}?'"
-            else:
-                location = constituency or district or "the specified location"
-                return f"❌ I couldn't find winner data for {location} in {year}. Please check the location name."
-        
-        if any(word in query_lower for word in ['runner up', 'second place', 'came second', '2nd place', 'runner-up']):
-            if not year:
-                year = max(self.years) if self.years else 2024
-            if constituency:
-                margin_data = self.get_margin(year, constituency)
-                if margin_data:
-                    return f"🥈 **Runner-up in {constituency} ({year}):**\n\n**{margin_data['runner_up']}** ({margin_data['runner_up_party']})\n🗳️ Votes: {self.format_number(margin_data['runner_up_votes'])}\n\nLost to {margin_data['winner']} by {self.format_number(margin_data['margin'])} votes."
-            return "Please specify a constituency. For example: 'Who was the runner up in Nemom in 2024?'"
-        
-        if any(word in query_lower for word in ['how many votes', 'votes did', 'vote count', 'total votes']):
-            if candidate:
-                votes_data = self.get_candidate_votes(candidate, year, constituency)
-                if votes_data is not None and not votes_data.empty:
-                    if len(votes_data) == 1:
-                        row = votes_data.iloc[0]
-                        return f"🗳️ **{candidate}** received **{self.format_number(row['votes'])}** votes in {row['constituency']} ({row['year']})."
-                    else:
-                        response = f"🗳️ **Vote counts for {candidate}:**\n\n"
-                        for _, row in votes_data.iterrows():
-                            status = "🏆 Won" if row['winner'] == 'Yes' else "📊"
-                            response += f"• {row['year']} - {row['constituency']}: {self.format_number(row['votes'])} votes {status}\n"
-                        return response
-            return "Please specify a candidate name. For example: 'How many votes did Suresh get in 2024?'"
+            response = f"🏛️ **Booth {details['booth_id']}** - {details['booth_name']}\n\n"
+            response += f"📍 Location: {details['constituency']}, {details['district']}\n"
+            response += f"👥 Total Voters: {self.format_number(details['total_voters'])}\n"
+            response += f"🗳️ Votes Polled: {self.format_number(details['votes_polled'])}\n\n"
+            if winner:
+                response += f"🏆 Winner: **{winner['candidate']}** ({winner['party']}) - {self.format_number(winner['votes'])} votes"
+            return response
+        else:
+            return f"❌ I couldn't find booth {booth_id} in the database. Try booth IDs between 1001-1140."
+    
+    def answer_winner(self, slots: Dict[str, Any]) -> Optional[str]:
+        """Winner of a constituency, or every winner in a district."""
+        year = slots['year'] or (max(self.years) if self.years else 2024)
+        district, constituency = slots['district'], slots['constituency']
         
-        if any(word in query_lower for word in ['margin', 'won by', 'victory margin', 'winning margin']):
-            if not year:
-                year = max(self.years) if self.years else 2024
+        winners = self.get_winner(year, district, constituency)
+        if winners is not None and not winners.empty:
             if constituency:
+                w = winners.iloc[0]
                 margin_data = self.get_margin(year, constituency)
-                if margin_data:
-                    return f"📊 **Margin in {constituency} ({year}):**\n\n🏆 Winner: **{margin_data['winner']}** ({margin_data['winner_party']}) - {self.format_number(margin_data['winner_votes'])} votes\n🥈 Runner-up: **{margin_data['runner_up']}** ({margin_data['runner_up_party']}) - {self.format_number(margin_data['runner_up_votes'])} votes\n\n📈 **Winning Margin: {self.format_number(margin_data['margin'])} votes**"
-            return "Please specify a constituency. For example: 'What was the margin in Kovalam in 2024?'"
-        
-        if any(word in query_lower for word in ['closest', 'narrowest', 'tightest', 'nail-biter']):
-            closest = self.get_closest_contest(year)
-            if closest:
-                return f"🔥 **Closest Contest{f' in {year}' if year else ''}:**\n\n📍 **{closest['constituency']}** ({closest['year']})\n🏆 Winner: {closest['winner']}\n🥈 Runner-up: {closest['runner_up']}\n📊 Margin: **Only {self.format_number(closest['margin'])} votes!**"
-            return "❌ Couldn't find contest data."
-        
-        if any(word in query_lower for word in ['compare', 'comparison', 'vs', 'versus', 'difference between']):
-            years_found = re.findall(r'\b(2023|2024|2025)\b', query)
-            if len(years_found) >= 2 and constituency:
-                year1, year2 = int(years_found[0]), int(years_found[1])
-                comparison = self.compare_years(year1, year2, constituency)
-                if comparison:
-                    change = "🔄 Winner changed!" if comparison['winner1'] != comparison['winner2'] else "✅ Same winner"
-                    return f"📊 **Comparison: {constituency}**\n\n**{year1}:**\n🏆 {comparison['winner1']} ({comparison['party1']}) - {self.format_number(comparison['votes1'])} votes\n\n**{year2}:**\n🏆 {comparison['winner2']} ({comparison['party2']}) - {self.format_number(comparison['votes2'])} votes\n\n{change}"
-            return "Please specify two years and a constituency. For example: 'Compare 2023 and 2024 in Nemom'"
-        
-        if any(word in query_lower for word in ['party', 'seats', 'how many seats']):
-            if party:
-                perf = self.get_party_performance(party, year)
-                if perf:
-                    year_text = f" in {year}" if year else ""
-                    response = f"📊 **{party} Performance{year_text}:**\n\n🏆 Seats Won: **{perf['seats_won']}**\n🗳️ Total Votes: {self.format_number(perf['total_votes'])}"
-                    if perf['constituencies'] and len(perf['constituencies']) <= 5:
-                        response += f"\n\n📍 Won in: {', '.join(perf['constituencies'])}"
-                    return response
-            return "Please specify a party. For example: 'How many seats did CPI win in 2024?'"
-        
-        if any(word in query_lower for word in ['results for', 'show results', 'all results', 'district summary']):
-            if district:
-                summary = self.get_district_summary(district, year)
-                if summary:
-                    year_text = f" ({year})" if year else ""
-                    response = f"📊 **{district} District{year_text}:**\n\n"
-                    response += f"📍 Constituencies: {summary['total_constituencies']}\n\n"
-                    response += "**Party-wise Wins:**\n"
-                    for party, wins in summary['party_wins'].items():
-                        response += f"• {party}: {wins} seat(s)\n"
-                    return response
-            return "Please specify a district. For example: 'Show results for Kollam district'"
-        
-        if any(word in query_lower for word in ['exit poll', 'prediction', 'forecast']):
-            return "🔮 **Exit Poll Predictions:**\n\nI provide analysis based on actual election results data. For exit poll predictions, please check official news sources!\n\nI can help you with:\n• Historical results (2023-2025)\n• Winner information\n• Vote margins\n• Party performance"
-        
-        if any(word in query_lower for word in ['help', 'what can you', 'how to use']):
-            return self.get_help_message()
-        
+                margin_text = f" with a margin of {self.format_number(margin_data['margin'])} votes" if margin_data else ""
+                return f"🏆 **{w['candidate']}** ({w['party']}) won in **{constituency}** in {year}{margin_text}!\n\n🗳️ Total Votes: {self.format_number(w['votes'])}"
+            elif district:
+                response = f"🏆 **Winners in {district} District ({year}):**\n\n"
+                for _, w in winners.iterrows():
+                    response += f"• **{w['constituency']}**: {w['candidate']} ({w['party']}) - {self.format_number(w['votes'])} votes\n"
+                return response
+            else:
+                return f"Please specify a district or constituency. For example: 'Who won in Thiruvananthapuram in {year}?'"
+        else:
+            location = constituency or district or "the specified location"
+            return f"❌ I couldn't find winner data for {location} in {year}. Please check the location name."
+    
+    def answer_runner_up(self, slots: Dict[str, Any]) -> Optional[str]:
+        """Runner-up of a constituency."""
+        year = slots['year'] or (max(self.years) if self.years else 2024)
+        constituency = slots['constituency']
         if constituency:
-            if not year:
-                year = max(self.years) if self.years else 2024
             margin_data = self.get_margin(year, constituency)
             if margin_data:
-                return f"📊 **{constituency} ({year}):**\n\n🏆 Winner: **{margin_data['winner']}** ({margin_data['winner_party']})\n🗳️ Votes: {self.format_number(margin_data['winner_votes'])}\n📈 Margin: {self.format_number(margin_data['margin'])} votes"
-        
+                return f"🥈 **Runner-up in {constituency} ({year}):**\n\n**{margin_data['runner_up']}** ({margin_data['runner_up_party']})\n🗳️ Votes: {self.format_number(margin_data['runner_up_votes'])}\n\nLost to {margin_data['winner']} by {self.format_number(margin_data['margin'])} votes."
+        return "Please specify a constituency. For example: 'Who was the runner up in Nemom in 2024?'"
+    
+    def answer_votes(self, slots: Dict[str, Any]) -> Optional[str]:
+        """Votes a candidate received, per contest."""
+        candidate = slots['candidate']
+        if candidate:
+            votes_data = self.get_candidate_votes(candidate, slots['year'], slots['constituency'], slots['party'])
+            if votes_data is not None and not votes_data.empty:
+                if len(votes_data) == 1:
+                    row = votes_data.iloc[0]
+                    return f"🗳️ **{candidate}** ({row['party']}) received **{self.format_number(row['votes'])}** votes in {row['constituency']} ({row['year']})."
+                else:
+                    people = votes_data.groupby(['party', 'home_district'], observed=True, sort=False)
+                    response = f"🗳️ **Vote counts for {candidate}:**\n\n"
+                    if people.ngroups > 1:
+                        response += f"_{people.ngroups} different candidates stood as {candidate}._\n\n"
+                    for (person_party, home), contests in people:
+                        if people.ngroups > 1:
+                            response += f"**{candidate} ({person_party}, {home})**\n"
+                        for _, row in contests.iterrows():
+                            status = "🏆 Won" if row['winner'] else f"📊 #{row['rank']}, {self.format_number(row['deficit'])} behind"
+                            response += f"• {row['year']} - {row['constituency']}: {self.format_number(row['votes'])} votes ({row['share']:.1f}%) {status}\n"
+                        response += "\n"
+                    return response.rstrip("\n") + "\n"
+        return "Please specify a candidate name. For example: 'How many votes did Suresh get in 2024?'"
+    
+    def answer_landslide(self, slots: Dict[str, Any]) -> Optional[str]:
+        """Contests with the largest winning margins."""
+        year, district = slots['year'], slots['district']
+        contests = self.get_top_contests('margin', year, district, largest=True, k=slots['count'] or 5)
+        if contests:
+            scope = ''.join(f' in {place}' for place in (district, year) if place)
+            response = f"🏆 **Biggest Wins{scope}:**\n\n"
+            for rank, c in enumerate(contests, 1):
+                response += f"{rank}. **{c['constituency']}** ({c['year']}): {c['winner']} ({c['winner_party']}) by {self.format_number(c['margin'])} votes\n"
+            return response
+        return "❌ Couldn't find contest data."
+    
+    def answer_turnout(self, slots: Dict[str, Any]) -> Optional[str]:
+        """Booths with the highest (or lowest) turnout."""
+        year, district = slots['year'], slots['district']
+        lowest = slots['lowest']
+        booths = self.get_top_booths('booth_turnout', year, district, largest=not lowest, k=slots['count'] or 5)
+        if booths:
+            scope = ''.join(f' in {place}' for place in (district, year) if place)
+            response = f"🗳️ **{'Lowest' if lowest else 'Highest'} Turnout Booths{scope}:**\n\n"
+            for rank, b in enumerate(booths, 1):
+                response += f"{rank}. **{b['booth_name']}** (ID {b['booth_id']}), {b['constituency']} ({b['year']}): {b['turnout']}%\n"
+            return response
+        return "❌ Couldn't find booth data."
+    
+    def answer_margin(self, slots: Dict[str, Any]) -> Optional[str]:
+        """Winner, runner-up and margin of a constituency."""
+        year = slots['year'] or (max(self.years) if self.years else 2024)
+        constituency = slots['constituency']
+        if constituency:
+            margin_data = self.get_margin(year, constituency)
+            if margin_data:
+                return f"📊 **Margin in {constituency} ({year}):**\n\n🏆 Winner: **{margin_data['winner']}** ({margin_data['winner_party']}) - {self.format_number(margin_data['winner_votes'])} votes\n🥈 Runner-up: **{margin_data['runner_up']}** ({margin_data['runner_up_party']}) - {self.format_number(margin_data['runner_up_votes'])} votes\n\n📈 **Winning Margin: {self.format_number(margin_data['margin'])} votes**"
+        return "Please specify a constituency. For example: 'What was the margin in Kovalam in 2024?'"
+    
+    def answer_closest(self, slots: Dict[str, Any]) -> Optional[str]:
+        """The closest contest, or the closest few when a count is asked for."""
+        year, district, count = slots['year'], slots['district'], slots['count']
+        if count and count > 1:
+            contests = self.get_top_contests('margin', year, district, largest=False, k=count)
+            if contests:
+                scope = ''.join(f' in {place}' for place in (district, year) if place)
+                response = f"🔥 **Closest Contests{scope}:**\n\n"
+                for rank, c in enumerate(contests, 1):
+                    response += f"{rank}. **{c['constituency']}** ({c['year']}): {c['winner']} beat {c['runner_up']} by {self.format_number(c['margin'])} votes\n"
+                return response
+        closest = self.get_closest_contest(year)
+        if closest:
+            return f"🔥 **Closest Contest{f' in {year}' if year else ''}:**\n\n📍 **{closest['constituency']}** ({closest['year']})\n🏆 Winner: {closest['winner']}\n🥈 Runner-up: {closest['runner_up']}\n📊 Margin: **Only {self.format_number(closest['margin'])} votes!**"
+        return "❌ Couldn't find contest data."
+    
+    def answer_compare(self, slots: Dict[str, Any]) -> Optional[str]:
+        """A constituency's winners in two years."""
+        constituency = slots['constituency']
+        if slots['year_pair'] and constituency:
+            year1, year2 = slots['year_pair']
+            comparison = self.compare_years(year1, year2, constituency)
+            if comparison:
+                change = "🔄 Winner changed!" if comparison['winner1'] != comparison['winner2'] else "✅ Same winner"
+                return f"📊 **Comparison: {constituency}**\n\n**{year1}:**\n🏆 {comparison['winner1']} ({comparison['party1']}) - {self.format_number(comparison['votes1'])} votes\n\n**{year2}:**\n🏆 {comparison['winner2']} ({comparison['party2']}) - {self.format_number(comparison['votes2'])} votes\n\n{change}"
+        return "Please specify two years and a constituency. For example: 'Compare 2023 and 2024 in Nemom'"
+    
+    def answer_party(self, slots: Dict[str, Any]) -> Optional[str]:
+        """Seats and votes of a party."""
+        year, party = slots['year'], slots['party']
+        if party:
+            perf = self.get_party_performance(party, year)
+            if perf:
+                year_text = f" in {year}" if year else ""
+                response = f"📊 **{party} Performance{year_text}:**\n\n🏆 Seats Won: **{perf['seats_won']}**\n🗳️ Total Votes: {self.format_number(perf['total_votes'])}"
+                if perf['constituencies'] and len(perf['constituencies']) <= 5:
+                    response += f"\n\n📍 Won in: {', '.join(perf['constituencies'])}"
+                return response
+        return "Please specify a party. For example: 'How many seats did CPI win in 2024?'"
+    
+    def answer_district_results(self, slots: Dict[str, Any]) -> Optional[str]:
+        """Seats won by each party in a district."""
+        year, district = slots['year'], slots['district']
         if district:
             summary = self.get_district_summary(district, year)
             if summary:
                 year_text = f" ({year})" if year else ""
                 response = f"📊 **{district} District{year_text}:**\n\n"
-                response += f"📍 {summary['total_constituencies']} constituencies\n\n"
+                response += f"📍 Constituencies: {summary['total_constituencies']}\n\n"
+                response += "**Party-wise Wins:**\n"
                 for party, wins in summary['party_wins'].items():
                     response += f"• {party}: {wins} seat(s)\n"
                 return response
-        
-        return self.get_fallback_response()
+        return "Please specify a district. For example: 'Show results for Kollam district'"
+    
+    def answer_projection(self, slots: Dict[str, Any]) -> Optional[str]:
+        """Simulated seats, or one constituency's win chances, under the swings in the query."""
+        constituency = slots['constituency']
+        swings = dict(slots['swing'])
+        projection = self.get_projection(slots['year'], swings)
+        if projection:
+            swing_text = ", ".join(f"{p} {v:+.1f} pts" for p, v in swings.items()) or "no swing"
+            if constituency:
+                seat = projection['win_probability']
+                seat = seat[seat['constituency'] == constituency]
+                if not seat.empty:
+                    row = seat.iloc[0]
+                    response = f"🔮 **{constituency} Projection** (from {projection['year']}, {swing_text}):\n\n"
+                    for p in projection['seats']['party']:
+                        response += f"• {p}: {row[p] * 100:.1f}% chance of winning\n"
+                    return response
+            response = f"🔮 **Seat Projection from {projection['year']}** ({swing_text}, "
+            response += f"{self.format_number(projection['draws'])} simulated elections):\n\n"
+            for _, row in projection['seats'].iterrows():
+                response += f"• {row['party']}: {row['mean_seats']:.1f} seats (90% range {row['p5']}-{row['p95']}), "
+                response += f"majority in {row['majority_probability'] * 100:.1f}% of runs\n"
+            response += f"\n🎯 Majority: {projection['majority']} seats"
+            if not projection['tipping_point'].empty:
+                tipping = projection['tipping_point'].iloc[0]
+                response += f"\n⚖️ Likeliest tipping-point seat: {tipping['constituency']} ({tipping['district']})"
+            return response
+        return None
+    
+    def answer_exit_poll(self, slots: Dict[str, Any]) -> Optional[str]:
+        """Exit polls are out of scope."""
+        return "🔮 **Exit Poll Predictions:**\n\nI provide analysis based on actual election results data. For exit poll predictions, please check official news sources!\n\nI can help you with:\n• Historical results (2023-2025)\n• Winner information\n• Vote margins\n• Party performance"
+    
+    def answer_help(self, slots: Dict[str, Any]) -> Optional[str]:
+        """The help message."""
+        return self.get_help_message()
+    
+    def answer_constituency(self, slots: Dict[str, Any]) -> Optional[str]:
+        """Short result of a constituency named on its own."""
+        year = slots['year'] or (max(self.years) if self.years else 2024)
+        constituency = slots['constituency']
+        margin_data = self.get_margin(year, constituency)
+        if margin_data:
+            return f"📊 **{constituency} ({year}):**\n\n🏆 Winner: **{margin_data['winner']}** ({margin_data['winner_party']})\n🗳️ Votes: {self.format_number(margin_data['winner_votes'])}\n📈 Margin: {self.format_number(margin_data['margin'])} votes"
+        return None
+    
+    def answer_district(self, slots: Dict[str, Any]) -> Optional[str]:
+        """Short party tally of a district named on its own."""
+        year, district = slots['year'], slots['district']
+        summary = self.get_district_summary(district, year)
+        if summary:
+            year_text = f" ({year})" if year else ""
+            response = f"📊 **{district} District{year_text}:**\n\n"
+            response += f"📍 {summary['total_constituencies']} constituencies\n\n"
+            for party, wins in summary['party_wins'].items():
+                response += f"• {party}: {wins} seat(s)\n"
+            return response
+        return None
+    
+    def get_projection(self, year: int = None, swing: Dict[str, float] = None,
+                       draws: int = CHAT_PROJECTION_DRAWS) -> Optional[Dict[str, Any]]:
+        """Simulated seat projection from a year's results under the given party swings.
+
+        Uses ``projector(year, draws, swing_pairs)`` when one was given (the
+        app passes its cached projection), else simulates in place.
+        """
+        year = int(year or max(self.swing.years))
+        if year not in self.swing.years:
+            return None
+        if self.projector is not None:
+            projection = self.projector(year, draws, tuple(sorted((swing or {}).items())))
+        else:
+            if year not in self.simulators:
+                self.simulators[year] = SeatSimulator(self.swing, year)
+            projection = self.simulators[year].run(draws=draws, swing=swing)
+        return dict(projection, year=year)
     
     def get_help_message(self) -> str:
         """Return help message."""
@@ -445,9 +636,15 @@ I can answer questions about Kerala election data! Here's what you can ask:
 
 **🔍 Special Queries:**
 • "Which constituency had the closest contest?"
+• "Top 5 biggest wins in 2024"
+• "Highest turnout booths in Kollam"
 • "Who was the runner up in Alappuzha?"
 • "Tell me about booth 1001"
 
+**🔮 What-if Projections:**
+• "What if BJP gains 3 points?"
+• "Simulate a 2 point swing to INC from 2024"
+
 Just type your question naturally! 💬"""
     
     def get_fallback_response(self) -> str:
@@ -0,0 +1,226 @@
+import io
+import threading
+import time
+from bisect import bisect_right
+from pathlib import Path
+import pandas as pd
+from typing import Optional, List, Dict, Tuple, Any
+
+CONTEST_KEY = ['district', 'constituency']
+ROUND_COLUMNS = ['round'] + CONTEST_KEY + ['candidate', 'party', 'votes']
+STATUS_COLUMNS = CONTEST_KEY + ['round', 'leader', 'leader_party', 'leader_votes', 'runner_up', 'runner_up_party',
+                                'margin', 'total_votes', 'candidates', 'leader_changed']
+
+
+class CountingFeed:
+    """New counting rows from an append-only CSV file or a drop directory of CSV files.
+
+    A file is read from where the previous poll stopped, up to its last
+    complete line, so rows still being written are picked up next time. In
+    a directory every new ``*.csv`` file is read once, in name order; files
+    should be written elsewhere and moved in, so they land complete; one
+    that does not parse is read again on the next poll.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._offset = 0
+        self._header: Optional[bytes] = None
+        self._seen: set = set()
+
+    def poll(self) -> List[pd.DataFrame]:
+        """Rows that arrived since the last poll, one frame per file or appended block."""
+        if self.path.is_dir():
+            batches = []
+            for file in sorted(self.path.glob('*.csv')):
+                if file.name in self._seen:
+                    continue
+                try:
+                    batches.append(pd.read_csv(file))
+                except (pd.errors.ParserError, pd.errors.EmptyDataError, UnicodeDecodeError, OSError):
+                    # Still being written or broken; tried again on the next poll.
+                    continue
+                self._seen.add(file.name)
+            return batches
+        if not self.path.is_file():
+            return []
+        if self.path.stat().st_size < self._offset:
+            # The file was replaced; start again from its header.
+            self._offset, self._header = 0, None
+        with open(self.path, 'rb') as f:
+            f.seek(self._offset)
+            data = f.read()
+        end = data.rfind(b'\n') + 1
+        if not end:
+            return []
+        self._offset += end
+        data = data[:end]
+        if self._header is None:
+            self._header, _, data = data.partition(b'\n')
+        if not data.strip():
+            return []
+        return [pd.read_csv(io.BytesIO(self._header + b'\n' + data))]
+
+
+class CountingState:
+    """Running counting-day totals, updated one round of rows at a time.
+
+    Each round's rows add to the vote counts of their candidates, and only
+    the constituencies those rows touch have their leader, runner-up,
+    margin and total recomputed, so applying a round costs the size of the
+    round, not of everything counted so far. Every recomputed status is
+    also kept per constituency with its round number, so the state as of
+    any earlier round can be read back. A round that arrives after a later
+    one (round 2 landing after round 3) is slotted into place, and the
+    statuses of the contests it touches are replayed from their per-round
+    votes. Frames read back are cached per round until the state changes.
+    """
+
+    def __init__(self):
+        self.round = 0
+        self.version = 0
+        self._votes: Dict[Tuple[str, str], Dict[Tuple[str, str], int]] = {}
+        self._history: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self._history_rounds: Dict[Tuple[str, str], List[int]] = {}
+        self._round_votes: Dict[Tuple[str, str], Dict[int, Dict[Tuple[str, str], int]]] = {}
+        self._frames: Dict[Tuple[str, int], pd.DataFrame] = {}
+        self._frames_version = 0
+        self.rounds: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _status(contest: Tuple[str, str], round_no: int, tally: Dict[Tuple[str, str], int],
+                previous: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        ranked = sorted(tally.items(), key=lambda item: (-item[1], item[0]))
+        (leader, leader_party), leader_votes = ranked[0]
+        (runner_up, runner_up_party), runner_up_votes = ranked[1] if len(ranked) > 1 else ((None, None), 0)
+        return {
+            'district': contest[0],
+            'constituency': contest[1],
+            'round': round_no,
+            'leader': leader,
+            'leader_party': leader_party,
+            'leader_votes': leader_votes,
+            'runner_up': runner_up,
+            'runner_up_party': runner_up_party,
+            'margin': leader_votes - runner_up_votes,
+            'total_votes': sum(votes for _, votes in ranked),
+            'candidates': len(ranked),
+            'leader_changed': previous is not None and previous['leader_party'] != leader_party,
+        }
+
+    def apply(self, rows: pd.DataFrame) -> List[Tuple[str, str]]:
+        """Add a batch of counting rows; rows without a ``round`` column count as the next round.
+
+        Rows missing their votes, round or a name are left out. Returns the
+        (district, constituency) of every contest whose status changed.
+        """
+        rows = rows.assign(votes=pd.to_numeric(rows['votes'], errors='coerce'))
+        required = ['votes'] + CONTEST_KEY + ['candidate', 'party'] + (['round'] if 'round' in rows.columns else [])
+        rows = rows.dropna(subset=required)
+        if rows.empty:
+            return []
+        rows = rows.assign(**{col: rows[col].astype(str) for col in ['district', 'constituency', 'candidate', 'party']})
+        touched = set()
+        with self._lock:
+            if 'round' not in rows.columns:
+                rows = rows.assign(round=self.round + 1)
+            for round_no, batch in rows.groupby('round', sort=True):
+                round_no = int(round_no)
+                # One addition per candidate, however many rows the round repeats them in.
+                totals = batch.groupby(CONTEST_KEY + ['candidate', 'party'], sort=False)['votes'].sum()
+                contests = set()
+                for (district, constituency, candidate, party), votes in totals.items():
+                    contest = (district, constituency)
+                    for tally in (self._votes.setdefault(contest, {}),
+                                  self._round_votes.setdefault(contest, {}).setdefault(round_no, {})):
+                        tally[(candidate, party)] = tally.get((candidate, party), 0) + int(votes)
+                    contests.add(contest)
+                for contest in contests:
+                    history = self._history.setdefault(contest, [])
+                    rounds = self._history_rounds.setdefault(contest, [])
+                    if rounds and round_no < rounds[-1]:
+                        self._replay(contest)
+                    elif rounds and round_no == rounds[-1]:
+                        history[-1] = self._status(contest, round_no, self._votes[contest],
+                                                   history[-2] if len(history) > 1 else None)
+                    else:
+                        history.append(self._status(contest, round_no, self._votes[contest],
+                                                    history[-1] if history else None))
+                        rounds.append(round_no)
+                self.round = max(self.round, round_no)
+                self.rounds.append({'round': round_no, 'received': time.time(), 'rows': len(batch),
+                                    'contests': len(contests)})
+                touched |= contests
+            self.version += 1
+        return sorted(touched)
+
+    def _replay(self, contest: Tuple[str, str]):
+        """Rebuild one contest's statuses round by round from its per-round votes."""
+        tally: Dict[Tuple[str, str], int] = {}
+        history, rounds = [], []
+        for round_no in sorted(self._round_votes[contest]):
+            for key, votes in self._round_votes[contest][round_no].items():
+                tally[key] = tally.get(key, 0) + votes
+            history.append(self._status(contest, round_no, tally, history[-1] if history else None))
+            rounds.append(round_no)
+        self._history[contest] = history
+        self._history_rounds[contest] = rounds
+
+    def _cached(self, kind: str, round_no: Optional[int], build) -> pd.DataFrame:
+        round_no = self.round if round_no is None else int(round_no)
+        with self._lock:
+            if self._frames_version != self.version:
+                self._frames, self._frames_version = {}, self.version
+            frame = self._frames.get((kind, round_no))
+            if frame is None:
+                frame = self._frames[(kind, round_no)] = build(round_no)
+        return frame
+
+    def as_of(self, round_no: Optional[int] = None) -> pd.DataFrame:
+        """Every reporting constituency's leader, margin and total as of a round (the latest by default)."""
+        return self._cached('as_of', round_no, self._as_of)
+
+    def _as_of(self, round_no: int) -> pd.DataFrame:
+        statuses = []
+        for contest, rounds in self._history_rounds.items():
+            position = bisect_right(rounds, round_no)
+            if position:
+                statuses.append(self._history[contest][position - 1])
+        frame = pd.DataFrame(statuses, columns=STATUS_COLUMNS)
+        return frame.sort_values(CONTEST_KEY, kind='mergesort').reset_index(drop=True)
+
+    def leads(self, round_no: Optional[int] = None) -> pd.DataFrame:
+        """Constituencies led by each party as of a round, most first."""
+        return self._cached('leads', round_no, self._leads)
+
+    def _leads(self, round_no: int) -> pd.DataFrame:
+        status = self._as_of(round_no)
+        leads = status.groupby('leader_party', sort=False).size().rename('leading').reset_index()
+        leads = leads.rename(columns={'leader_party': 'party'})
+        return leads.sort_values(['leading', 'party'], ascending=[False, True], kind='mergesort').reset_index(drop=True)
+
+    def contest(self, district: str, constituency: str) -> pd.DataFrame:
+        """Current vote count of every candidate in one constituency, leader first."""
+        with self._lock:
+            tally = dict(self._votes.get((district, constituency), {}))
+        frame = pd.DataFrame([(candidate, party, votes) for (candidate, party), votes in tally.items()],
+                             columns=['candidate', 'party', 'votes'])
+        return frame.sort_values(['votes', 'candidate'], ascending=[False, True], kind='mergesort').reset_index(drop=True)
+
+
+class LiveCount:
+    """A counting feed and the state it keeps up to date; ``refresh`` applies whatever has landed."""
+
+    def __init__(self, path: Path):
+        self.feed = CountingFeed(path)
+        self.state = CountingState()
+        self._lock = threading.Lock()
+
+    def refresh(self) -> List[Tuple[str, str]]:
+        """Poll the feed once and apply the new rows; safe to call from every session."""
+        with self._lock:
+            touched = set()
+            for batch in self.feed.poll():
+                touched.update(self.state.apply(batch))
+        return sorted(touched)
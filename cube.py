@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+from typing import Optional, List, Dict, Any
+
+CUBE_KEYS = ['party', 'year', 'district']
+CUBE_MEASURES = ['seats', 'votes', 'contested', 'total_votes']
+
+
+def party_cube_frame(results: pd.DataFrame) -> pd.DataFrame:
+    """Seats, votes and contested seats per (party, year, district) cell, from candidate rows.
+
+    ``total_votes`` is the vote total of the cell's (year, district), the
+    denominator of the vote share. A party fielding several candidates in a
+    constituency contests it once. Built in one pass of bincounts over the
+    cell codes.
+    """
+    if results.empty:
+        return pd.DataFrame(columns=CUBE_KEYS + CUBE_MEASURES)
+
+    party_codes, parties = pd.factorize(results['party'], sort=True)
+    year_codes, years = pd.factorize(results['year'], sort=True)
+    district_codes, districts = pd.factorize(results['district'], sort=True)
+    shape = (len(parties), len(years), len(districts))
+    cell = np.ravel_multi_index((party_codes, year_codes, district_codes), shape)
+    size = int(np.prod(shape))
+
+    votes = results['votes'].to_numpy().astype(np.int64)
+    cell_votes = np.bincount(cell, weights=votes, minlength=size)
+    seats = np.bincount(cell, weights=results['winner'].to_numpy().astype(np.int64), minlength=size)
+    contest = results.groupby(['year', 'district', 'constituency'], observed=True, sort=False).ngroup().to_numpy()
+    contested_cells = np.unique(cell.astype(np.int64) * (contest.max() + 1) + contest) // (contest.max() + 1)
+    contested = np.bincount(contested_cells, minlength=size)
+    area_votes = cell_votes.reshape(shape).sum(axis=0)
+
+    present = np.flatnonzero(np.bincount(cell, minlength=size))
+    p, y, d = np.unravel_index(present, shape)
+    return pd.DataFrame({
+        'party': pd.Categorical.from_codes(p, categories=parties.astype(str)),
+        'year': np.asarray(years)[y].astype(results['year'].dtype),
+        'district': pd.Categorical.from_codes(d, categories=districts.astype(str)),
+        'seats': seats[present].astype(np.int32),
+        'votes': cell_votes[present].astype(np.int64),
+        'contested': contested[present].astype(np.int32),
+        'total_votes': area_votes[y, d].astype(np.int64),
+    })
+
+
+class PartyCube:
+    """Dense party x year x district arrays of seats, votes and contested seats.
+
+    The district axis has an extra last slot holding the statewide rollup,
+    so any (party, year, district) slice, or all years at once, is answered
+    from arrays sized by parties, years and districts; the number of
+    constituencies or candidate rows never enters a query.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        self.parties: List[str] = sorted(str(p) for p in pd.unique(frame['party'].astype(str)))
+        self.years: List[int] = sorted(int(y) for y in pd.unique(frame['year']))
+        self.districts: List[str] = sorted(str(d) for d in pd.unique(frame['district'].astype(str)))
+        self._party = {p: i for i, p in enumerate(self.parties)}
+        self._year = {y: i for i, y in enumerate(self.years)}
+        self._district = {d: i for i, d in enumerate(self.districts)}
+
+        shape = (len(self.parties), len(self.years), len(self.districts) + 1)
+        self.seats = np.zeros(shape, dtype=np.int64)
+        self.votes = np.zeros(shape, dtype=np.int64)
+        self.contested = np.zeros(shape, dtype=np.int64)
+        self.total_votes = np.zeros(shape[1:], dtype=np.int64)
+        if frame.empty:
+            return
+
+        p = np.array([self._party[str(v)] for v in frame['party']], dtype=np.int64)
+        y = np.array([self._year[int(v)] for v in frame['year']], dtype=np.int64)
+        d = np.array([self._district[str(v)] for v in frame['district']], dtype=np.int64)
+        for name in ('seats', 'votes', 'contested'):
+            target = getattr(self, name)
+            np.add.at(target, (p, y, d), frame[name].to_numpy())
+            target[:, :, -1] = target[:, :, :-1].sum(axis=2)
+        self.total_votes[y, d] = frame['total_votes'].to_numpy()
+        self.total_votes[:, -1] = self.total_votes[:, :-1].sum(axis=1)
+
+    def _cells(self, year: Optional[int], district: Optional[str]):
+        years = slice(None) if year is None else self._year.get(int(year))
+        districts = -1 if district is None else self._district.get(district)
+        return years, districts
+
+    def slice(self, year: Optional[int] = None, district: Optional[str] = None) -> pd.DataFrame:
+        """Per-party seats, votes, contested seats and vote share, most seats first.
+
+        ``year=None`` adds up every year and ``district=None`` is the statewide rollup.
+        """
+        years, districts = self._cells(year, district)
+        if years is None or districts is None:
+            return pd.DataFrame(columns=['party', 'seats', 'votes', 'contested', 'vote_share'])
+        seats = self.seats[:, years, districts]
+        votes = self.votes[:, years, districts]
+        contested = self.contested[:, years, districts]
+        total = self.total_votes[years, districts]
+        if year is None:
+            seats, votes, contested, total = seats.sum(axis=1), votes.sum(axis=1), contested.sum(axis=1), total.sum()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            share = np.where(total > 0, votes / total * 100, 0.0)
+        tally = pd.DataFrame({'party': self.parties, 'seats': seats, 'votes': votes,
+                              'contested': contested, 'vote_share': share})
+        tally = tally[tally['contested'] > 0]
+        return tally.sort_values(['seats', 'votes'], ascending=False, kind='mergesort').reset_index(drop=True)
+
+    def party(self, party: str, year: Optional[int] = None, district: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Seats, votes, contested seats and vote share of one party, or None if it did not contest."""
+        position = self._party.get(party)
+        years, districts = self._cells(year, district)
+        if position is None or years is None or districts is None:
+            return None
+        contested = int(np.sum(self.contested[position, years, districts]))
+        if contested == 0:
+            return None
+        votes = int(np.sum(self.votes[position, years, districts]))
+        total = int(np.sum(self.total_votes[years, districts]))
+        return {
+            'party': party,
+            'seats': int(np.sum(self.seats[position, years, districts])),
+            'votes': votes,
+            'contested': contested,
+            'vote_share': votes / total * 100 if total else 0.0,
+        }
@@ -0,0 +1,349 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Optional, Dict, Any, Callable
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+FORMAT_VERSION = 1
+HASH_CHUNK_BYTES = 1 << 20
+# Frame attrs kept in the schema: the compaction report and the year partition catalog.
+PERSISTED_ATTRS = ('memory', 'partitions')
+
+
+def sidecar_path(csv_path: Path) -> Path:
+    """Directory holding the columnar copy of a CSV, next to the source file."""
+    csv_path = Path(csv_path)
+    return csv_path.with_name(f".{csv_path.stem}.columns")
+
+
+def content_hash(path: Path) -> str:
+    """BLAKE2 digest of a file, read in fixed-size chunks."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_fingerprint(path: Path, with_hash: bool = True) -> Dict[str, Any]:
+    """Size, mtime and (optionally) content hash identifying a source file."""
+    stat = os.stat(path)
+    fingerprint = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    if with_hash:
+        fingerprint['hash'] = content_hash(path)
+    return fingerprint
+
+
+def read_meta(directory: Path) -> Optional[Dict[str, Any]]:
+    """Read a sidecar's metadata, or None if it is missing or from another format version."""
+    try:
+        with open(Path(directory) / "meta.json", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta.get('format') != FORMAT_VERSION:
+        return None
+    return meta
+
+
+def _write_meta(directory: Path, meta: Dict[str, Any]):
+    tmp_path = Path(directory) / "meta.json.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, Path(directory) / "meta.json")
+
+
+def save_columns(df: pd.DataFrame, directory: Path, fingerprint: Dict[str, Any],
+                 attrs: Dict[str, Any] = None):
+    """Write each column of a frame as a .npy file plus a JSON schema.
+
+    Categorical columns are stored as their integer codes with the categories
+    kept in the schema. The directory is built under a temporary name and
+    swapped in, so readers never see a half-written sidecar.
+    """
+    directory = Path(directory)
+    tmp_dir = directory.with_name(f"{directory.name}.tmp{os.getpid()}")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+
+    columns = []
+    for position, col in enumerate(df.columns):
+        series = df[col]
+        filename = f"{position}.npy"
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            np.save(tmp_dir / filename, series.cat.codes.to_numpy())
+            columns.append({'name': col, 'file': filename, 'kind': 'category',
+                            'categories': series.cat.categories.tolist()})
+        elif pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+            np.save(tmp_dir / filename, series.to_numpy())
+            columns.append({'name': col, 'file': filename, 'kind': 'array'})
+        else:
+            codes, uniques = pd.factorize(series.astype(object), sort=True)
+            np.save(tmp_dir / filename, codes.astype(np.int32))
+            columns.append({'name': col, 'file': filename, 'kind': 'category',
+                            'categories': [str(u) for u in uniques]})
+
+    meta = {
+        'format': FORMAT_VERSION,
+        'rows': len(df),
+        'source': fingerprint,
+        'columns': columns,
+        'attrs': dict({key: value for key, value in df.attrs.items() if key in PERSISTED_ATTRS}, **(attrs or {})),
+    }
+    _write_meta(tmp_dir, meta)
+
+    shutil.rmtree(directory, ignore_errors=True)
+    os.replace(tmp_dir, directory)
+
+
+def _load_array(path: Path, column: Dict[str, Any], rows: int, mmap_mode: Optional[str]) -> np.ndarray:
+    if 'dtype' not in column:
+        return np.load(path, mmap_mode=mmap_mode)
+    # Raw append-only column written by ColumnAppender.
+    dtype = np.dtype(column['dtype'])
+    if rows == 0:
+        return np.empty(0, dtype=dtype)
+    if mmap_mode:
+        return np.memmap(path, dtype=dtype, mode=mmap_mode, shape=(rows,))
+    return np.fromfile(path, dtype=dtype, count=rows)
+
+
+class ColumnAppender:
+    """Append-only columnar writer for data that arrives in chunks.
+
+    Each column is a raw binary file with a fixed dtype; string columns are
+    dictionary-encoded against a dictionary that grows as new values arrive.
+    The result is readable with load_columns once close() has written the schema.
+    """
+
+    def __init__(self, directory: Path, dtypes: Dict[str, Any], fingerprint: Dict[str, Any]):
+        self.directory = Path(directory)
+        self.tmp_dir = self.directory.with_name(f"{self.directory.name}.tmp{os.getpid()}")
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+        self.tmp_dir.mkdir(parents=True)
+        self.dtypes = dtypes
+        self.fingerprint = fingerprint
+        self.rows = 0
+        self.dictionaries: Dict[str, Dict[Any, int]] = {
+            col: {} for col, dtype in dtypes.items() if dtype == 'category'
+        }
+        self.files = {
+            col: open(self.tmp_dir / f"{position}.bin", "wb")
+            for position, col in enumerate(dtypes)
+        }
+
+    def _encode(self, col: str, series: pd.Series) -> np.ndarray:
+        dictionary = self.dictionaries[col]
+        codes, uniques = pd.factorize(series.astype(object))
+        mapping = np.empty(len(uniques), dtype=np.int32)
+        for i, value in enumerate(uniques):
+            mapping[i] = dictionary.setdefault(value, len(dictionary))
+        return mapping[codes]
+
+    def append(self, chunk: pd.DataFrame):
+        """Append a chunk of rows to every column file."""
+        for col, dtype in self.dtypes.items():
+            if dtype == 'category':
+                values = self._encode(col, chunk[col])
+            else:
+                values = chunk[col].to_numpy()
+                if np.issubdtype(np.dtype(dtype), np.integer) and len(values):
+                    limits = np.iinfo(dtype)
+                    if values.min() < limits.min or values.max() > limits.max:
+                        raise OverflowError(f"Column '{col}' does not fit in {dtype}")
+                values = values.astype(dtype, copy=False)
+            values.tofile(self.files[col])
+        self.rows += len(chunk)
+
+    def close(self, attrs: Dict[str, Any] = None):
+        """Flush the column files, write the schema and publish the directory."""
+        columns = []
+        for position, (col, dtype) in enumerate(self.dtypes.items()):
+            self.files[col].close()
+            column = {'name': col, 'file': f"{position}.bin"}
+            if dtype == 'category':
+                column.update(kind='category', dtype='int32',
+                              categories=list(self.dictionaries[col]))
+            else:
+                column.update(kind='array', dtype=np.dtype(dtype).str)
+            columns.append(column)
+        _write_meta(self.tmp_dir, {
+            'format': FORMAT_VERSION,
+            'rows': self.rows,
+            'source': self.fingerprint,
+            'columns': columns,
+            'attrs': attrs or {},
+        })
+        shutil.rmtree(self.directory, ignore_errors=True)
+        os.replace(self.tmp_dir, self.directory)
+
+
+def load_columns(directory: Path, meta: Optional[Dict[str, Any]] = None, mmap: bool = True) -> pd.DataFrame:
+    """Rebuild a frame from a sidecar, memory-mapping the column files by default."""
+    directory = Path(directory)
+    meta = meta or read_meta(directory)
+    if meta is None:
+        raise FileNotFoundError(f"No columnar data in {directory}")
+
+    mmap_mode = 'r' if mmap else None
+    data = {}
+    for column in meta['columns']:
+        values = _load_array(directory / column['file'], column, meta['rows'], mmap_mode)
+        if column['kind'] == 'category':
+            dtype = pd.CategoricalDtype(column['categories'])
+            data[column['name']] = pd.Categorical.from_codes(values, dtype=dtype, validate=False)
+        else:
+            data[column['name']] = values
+    df = pd.DataFrame(data, copy=False)
+    df.attrs.update(meta.get('attrs', {}))
+    return df
+
+
+def fresh_meta(directory: Path, source_path: Path) -> Optional[Dict[str, Any]]:
+    """Return a sidecar's metadata if it was built from the current source file, else None.
+
+    A matching size and mtime is trusted directly. Otherwise the content hash
+    decides, and an unchanged file (e.g. a fresh checkout) only refreshes the
+    stored fingerprint.
+    """
+    meta = read_meta(directory)
+    if meta is None:
+        return None
+    source = meta['source']
+    quick = file_fingerprint(source_path, with_hash=False)
+    if source['size'] != quick['size']:
+        return None
+    if source['mtime_ns'] == quick['mtime_ns']:
+        return meta
+    if source['hash'] != content_hash(source_path):
+        return None
+    meta['source'] = dict(quick, hash=source['hash'])
+    try:
+        _write_meta(directory, meta)
+    except OSError:
+        pass
+    return meta
+
+
+def cached_read_csv(csv_path: Path, prepare: Callable[[pd.DataFrame], pd.DataFrame] = None,
+                    cache_dir: Path = None) -> pd.DataFrame:
+    """Read a CSV through its columnar sidecar, rebuilding the sidecar when the CSV changes.
+
+    Timings are recorded in ``df.attrs['load']``.
+    """
+    started = time.perf_counter()
+    csv_path = Path(csv_path)
+    cache_dir = Path(cache_dir) if cache_dir else sidecar_path(csv_path)
+
+    meta = fresh_meta(cache_dir, csv_path)
+    if meta is not None:
+        df = load_columns(cache_dir, meta)
+        df.attrs['load'] = {'source': 'cache', 'seconds': time.perf_counter() - started}
+        return df
+
+    fingerprint = file_fingerprint(csv_path)
+    df = pd.read_csv(csv_path)
+    if prepare is not None:
+        df = prepare(df)
+    parsed = time.perf_counter()
+    try:
+        save_columns(df, cache_dir, fingerprint)
+    except OSError:
+        # A read-only data directory only costs us the warm start.
+        pass
+    df.attrs['load'] = {'source': 'csv', 'seconds': parsed - started,
+                        'write_seconds': time.perf_counter() - parsed}
+    return df
+
+
+def load_report(df: pd.DataFrame) -> str:
+    """Describe where a frame was loaded from and how long it took."""
+    load = df.attrs.get('load')
+    if not load:
+        return "No load timing available"
+    report = f"loaded from {load['source']} in {load['seconds'] * 1000:,.1f} ms"
+    if 'write_seconds' in load:
+        report += f" (+{load['write_seconds'] * 1000:,.1f} ms writing the columnar cache)"
+    return report
+
+
+def shared_root() -> Path:
+    """Host-wide directory for published column stores (RAM-backed /dev/shm when available)."""
+    configured = os.environ.get("POLLYTICS_SHARED_DIR")
+    if configured:
+        return Path(configured)
+    if os.path.isdir("/dev/shm"):
+        return Path("/dev/shm") / "pollytics"
+    return Path(tempfile.gettempdir()) / "pollytics"
+
+
+def source_version(path: Path) -> str:
+    """Cheap version string for a source file, from its size and mtime."""
+    stat = os.stat(path)
+    return f"{stat.st_size:x}-{stat.st_mtime_ns:x}"
+
+
+@contextmanager
+def file_lock(lock_path: Path):
+    """Hold an exclusive advisory lock on ``lock_path`` for the duration of the block."""
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def shared_frames(name: str, version: str, build: Callable[[], Dict[str, pd.DataFrame]],
+                  root: Path = None) -> Dict[str, pd.DataFrame]:
+    """Attach read-only to frames published once per host, publishing them on first use.
+
+    The first process to ask for ``name`` at ``version`` builds the frames and
+    writes them as column files under the shared root; every process
+    (including that one) then memory-maps those files, so the data is held
+    once in the page cache no matter how many server processes attach.
+    Older versions of the same store are removed when a new one is published;
+    processes still mapping them keep their view until they reload.
+    """
+    root = Path(root) if root else shared_root()
+    directory = root / f"{name}-{version}"
+    with file_lock(root / f"{name}.lock"):
+        published = read_meta(directory)
+        if published is None:
+            frames = build()
+            tmp_dir = root / f"{name}-{version}.tmp{os.getpid()}"
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            for key, df in frames.items():
+                save_columns(df, tmp_dir / key, {'version': version})
+            _write_meta(tmp_dir, {'format': FORMAT_VERSION, 'frames': list(frames), 'version': version})
+            os.replace(tmp_dir, directory)
+            published = read_meta(directory)
+            for stale in root.glob(f"{name}-*"):
+                if stale != directory and stale.is_dir():
+                    shutil.rmtree(stale, ignore_errors=True)
+    return {key: load_columns(directory / key) for key in published['frames']}
+
+
+def read_only_view(df: pd.DataFrame) -> pd.DataFrame:
+    """Per-caller handle on a shared frame that can be modified without touching the shared copy.
+
+    No data is copied. The handle shares the column arrays (read-only maps
+    for frames from the column store) and pandas copy-on-write copies a
+    column only when the caller writes to it, while added, dropped or
+    renamed columns and edited attrs stay with the handle.
+    """
+    return df.copy(deep=False)
@@ -0,0 +1,153 @@
+from typing import Dict, Iterable, List, Optional, Set, Union
+
+DEFAULT_MAX_DISTANCE = 2
+# Only the first characters of a name are indexed; longer names are checked in full on lookup.
+DEFAULT_PREFIX_LENGTH = 7
+
+
+def edit_budget(length: int) -> int:
+    """Edits allowed for a word of this length: none below 3 characters, 1 below 6, else 2.
+
+    This keeps short common words ("many", "show") from matching short
+    names two edits away, much like difflib's 0.6 similarity cut-off.
+    """
+    return 0 if length < 3 else 1 if length < 6 else 2
+
+
+def _deletes(word: str, distance: int) -> List[Set[str]]:
+    """Strings made by deleting exactly 0, 1, ... ``distance`` characters from ``word``, by depth."""
+    levels = [{word}]
+    seen = {word}
+    for _ in range(distance):
+        frontier = {w[:i] + w[i + 1:] for w in levels[-1] for i in range(len(w))} - seen
+        seen |= frontier
+        levels.append(frontier)
+    return levels
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance (adjacent swaps count as one edit), or ``limit + 1`` beyond it.
+
+    The common prefix and suffix are skipped, only the band of cells
+    within ``limit`` of the diagonal is computed, and the scan stops as
+    soon as a whole row is over the limit.
+    """
+    beyond = limit + 1
+    if abs(len(a) - len(b)) > limit:
+        return beyond
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    stop = 0
+    while stop < len(a) - start and stop < len(b) - start and a[-1 - stop] == b[-1 - stop]:
+        stop += 1
+    a, b = a[start:len(a) - stop], b[start:len(b) - stop]
+    n, m = len(a), len(b)
+    if not n or not m:
+        return n + m if n + m <= limit else beyond
+    previous2: List[int] = []
+    previous = [j if j <= limit else beyond for j in range(m + 1)]
+    for i in range(1, n + 1):
+        current = [beyond] * (m + 1)
+        if i <= limit:
+            current[0] = i
+        row_min = current[0]
+        char = a[i - 1]
+        for j in range(max(1, i - limit), min(m, i + limit) + 1):
+            other = b[j - 1]
+            value = previous[j - 1] + (char != other)
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if i > 1 and j > 1 and char == b[j - 2] and a[i - 2] == other and previous2[j - 2] + 1 < value:
+                value = previous2[j - 2] + 1
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > limit:
+            return beyond
+        previous2, previous = previous, current
+    return previous[m] if previous[m] <= limit else beyond
+
+
+class FuzzyIndex:
+    """Symmetric-delete (SymSpell-style) index for finding the closest name to a misspelt word.
+
+    Every name's lowercase prefix is stored under each string reachable by
+    deleting up to ``max_distance`` characters from it, grouped by how many
+    were deleted. A lookup generates the same deletions of the word and
+    only compares against names sharing one, first within one edit and
+    only then within two, so it costs a few dictionary probes and
+    edit-distance checks whatever the number of names. Built once per name
+    list.
+    """
+
+    def __init__(self, names: Iterable[str], max_distance: int = DEFAULT_MAX_DISTANCE,
+                 prefix_length: int = DEFAULT_PREFIX_LENGTH):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self._names: Dict[str, str] = {}
+        for name in names:
+            self._names.setdefault(str(name).lower().strip(), name)
+        self._keys: List[str] = list(self._names)
+        # deletes[depth][variant]: names that give the variant after deleting ``depth`` characters.
+        # Single entries are stored as an int to keep the index small.
+        self._deletes: List[Dict[str, Union[int, List[int]]]] = [{} for _ in range(max_distance + 1)]
+        for position, key in enumerate(self._keys):
+            for depth, variants in enumerate(_deletes(key[:prefix_length], max_distance)):
+                deletes = self._deletes[depth]
+                for variant in variants:
+                    entry = deletes.get(variant)
+                    if entry is None:
+                        deletes[variant] = position
+                    elif isinstance(entry, int):
+                        deletes[variant] = [entry, position]
+                    else:
+                        entry.append(position)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def lookup(self, word: str, max_distance: Optional[int] = None) -> Optional[str]:
+        """The name closest to ``word`` within its edit budget, or None.
+
+        Ties go to the name closest in length, then to the first in the
+        original order.
+        """
+        word = word.lower().strip()
+        if word in self._names:
+            return self._names[word]
+        budget = min(self.max_distance if max_distance is None else max_distance, edit_budget(len(word)))
+        if budget <= 0:
+            return None
+        levels = _deletes(word[:self.prefix_length], budget)
+        distances: Dict[int, int] = {}
+        for limit in range(1, budget + 1):
+            # Names within ``limit`` edits share a string with the word after at most ``limit`` deletions each.
+            candidates: Set[int] = set()
+            for variants in levels[:limit + 1]:
+                for variant in variants:
+                    for deletes in self._deletes[:limit + 1]:
+                        entry = deletes.get(variant)
+                        if entry is None:
+                            continue
+                        if isinstance(entry, int):
+                            candidates.add(entry)
+                        else:
+                            candidates.update(entry)
+            best = None
+            for position in candidates:
+                key = self._keys[position]
+                if abs(len(key) - len(word)) > limit:
+                    continue
+                distance = distances.get(position)
+                if distance is None:
+                    distance = distances[position] = edit_distance(word, key, budget)
+                if distance <= limit:
+                    rank = (distance, abs(len(key) - len(word)), position)
+                    if best is None or rank < best:
+                        best = rank
+            if best:
+                return self._names[self._keys[best[2]]]
+        return None
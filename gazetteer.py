@@ -0,0 +1,74 @@
+import re
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+# Trie key marking the end of an entity name; never a token.
+_END = ''
+
+
+def tokenize(text: str) -> List[Tuple[str, int, int]]:
+    """Lowercase alphanumeric tokens of ``text`` with their character offsets."""
+    return [(match.group(), match.start(), match.end()) for match in TOKEN_PATTERN.finditer(text.lower())]
+
+
+class Span(NamedTuple):
+    """An entity mention: its character range in the query and the entity it names, per kind."""
+    start: int
+    end: int
+    entities: Dict[str, str]
+
+
+class Gazetteer:
+    """Token trie over entity names (districts, constituencies, candidates, parties, ...).
+
+    Names are split into lowercase alphanumeric tokens, so "KC(M)" and
+    "kc m" are the same key and a name only matches whole words. ``find``
+    walks the query's tokens once: at each token it follows the trie as far
+    as the query allows and keeps the longest name that ends there, so
+    "CPIM" is not read as "CPI" and a constituency named after its district
+    beats the district when the longer name is written. The cost depends on
+    the query length and the longest name, not on the number of names.
+    """
+
+    def __init__(self, entities: Dict[str, Iterable[str]]):
+        self._root: Dict = {}
+        for kind, names in entities.items():
+            for name in names:
+                tokens = [token for token, _, _ in tokenize(str(name))]
+                if not tokens:
+                    continue
+                node = self._root
+                for token in tokens:
+                    node = node.setdefault(token, {})
+                # The first name of a kind keeps a key when several normalize alike.
+                node.setdefault(_END, {}).setdefault(kind, name)
+
+    def find(self, text: str) -> List[Span]:
+        """Every entity mention in ``text``, left to right, longest match first and not overlapping."""
+        tokens = tokenize(text)
+        spans = []
+        i = 0
+        while i < len(tokens):
+            node = self._root
+            best = None
+            j = i
+            while j < len(tokens) and tokens[j][0] in node:
+                node = node[tokens[j][0]]
+                j += 1
+                if _END in node:
+                    best = (j, node[_END])
+            if best is None:
+                i += 1
+                continue
+            stop, entities = best
+            spans.append(Span(tokens[i][1], tokens[stop - 1][2], entities))
+            i = stop
+        return spans
+
+    @staticmethod
+    def first(spans: List[Span], kind: str):
+        """The first entity of a kind among the spans, or None."""
+        for span in spans:
+            if kind in span.entities:
+                return span.entities[kind]
+        return None
@@ -0,0 +1,173 @@
+import time
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Optional, Dict, Any, Callable
+
+from datastore import (ColumnAppender, file_fingerprint, fresh_meta, load_columns,
+                       save_columns)
+from summary import constituency_summary
+
+CONTEST_KEYS = ['year', 'district', 'constituency']
+RESULT_KEYS = CONTEST_KEYS + ['candidate', 'party']
+DEFAULT_MEMORY_BUDGET_MB = 256
+# Parsed chunks, groupby temporaries and the encoded copy all live at once.
+CHUNK_OVERHEAD = 4
+MIN_CHUNK_ROWS = 1_000
+SAMPLE_ROWS = 2_000
+WINNER_VALUES = ('yes', 'true', '1')
+# Stored types of the known numeric columns; others are typed from the first chunk.
+DECLARED_DTYPES = {'year': 'int32', 'votes': 'int32'}
+
+
+def store_path(csv_path: Path) -> Path:
+    """Directory holding the spilled raw rows and aggregates of a CSV."""
+    csv_path = Path(csv_path)
+    return csv_path.with_name(f".{csv_path.stem}.rows")
+
+
+def estimate_chunk_rows(csv_path: Path, memory_budget_mb: float) -> int:
+    """Rows per chunk that keep a parsed chunk and its temporaries within the budget."""
+    sample = pd.read_csv(csv_path, nrows=SAMPLE_ROWS)
+    if sample.empty:
+        return MIN_CHUNK_ROWS
+    bytes_per_row = sample.memory_usage(deep=True).sum() / len(sample)
+    budget = memory_budget_mb * 1024 * 1024
+    return max(MIN_CHUNK_ROWS, int(budget / (bytes_per_row * CHUNK_OVERHEAD)))
+
+
+def _raw_dtypes(sample: pd.DataFrame) -> Dict[str, str]:
+    dtypes = {}
+    for col in sample.columns:
+        series = sample[col]
+        if pd.api.types.is_bool_dtype(series):
+            dtypes[col] = 'bool'
+        elif pd.api.types.is_integer_dtype(series):
+            dtypes[col] = 'int32'
+        elif pd.api.types.is_float_dtype(series):
+            dtypes[col] = 'float64'
+        else:
+            dtypes[col] = 'category'
+        dtypes[col] = DECLARED_DTYPES.get(col, dtypes[col])
+    return dtypes
+
+
+def _check_chunk(chunk: pd.DataFrame, dtypes: Dict[str, str], first_row: int):
+    """Raise ValueError if a chunk does not fit the column types chosen from the first chunk.
+
+    Types are fixed once raw rows start being spilled, so a later chunk with
+    missing or non-numeric values in an integer column, or a missing key,
+    is rejected rather than cast or dropped.
+    """
+    rows = f"rows {first_row + 1}-{first_row + len(chunk)}"
+    missing = [col for col in dtypes if col not in chunk.columns]
+    if missing:
+        raise ValueError(f"Columns {missing} are missing in {rows}")
+    for col, dtype in dtypes.items():
+        series = chunk[col]
+        if dtype == 'category':
+            continue
+        if dtype == 'bool':
+            valid = pd.api.types.is_bool_dtype(series)
+        elif dtype == 'float64':
+            valid = pd.api.types.is_numeric_dtype(series)
+        else:
+            valid = pd.api.types.is_integer_dtype(series) or (
+                pd.api.types.is_float_dtype(series) and series.notna().all()
+                and bool((series == np.floor(series)).all()))
+        if not valid:
+            raise ValueError(f"Column '{col}' has missing or non-{dtype} values in {rows}")
+    null_keys = chunk[RESULT_KEYS].isna().any(axis=1)
+    if null_keys.any():
+        raise ValueError(f"{int(null_keys.sum())} rows with a missing {'/'.join(RESULT_KEYS)} value in {rows}")
+
+
+def _winner_flag(series: pd.Series) -> pd.Series:
+    """The CSV's 'Yes'/'No' winner column as bool."""
+    if pd.api.types.is_bool_dtype(series):
+        return series
+    return series.astype(str).str.strip().str.lower().isin(WINNER_VALUES)
+
+
+def stream_ingest(csv_path: Path, memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB,
+                  prepare: Callable[[pd.DataFrame], pd.DataFrame] = None,
+                  store_dir: Path = None) -> Dict[str, Any]:
+    """Ingest a results CSV in bounded chunks.
+
+    Raw rows are spilled to an append-only columnar store while only the
+    per-candidate vote totals are kept in memory, so peak memory is set by the
+    budget and the number of contests rather than the file size. Winners and
+    the constituency summary are derived from the totals. Aggregates are saved
+    in the store and reused while the CSV is unchanged.
+    """
+    started = time.perf_counter()
+    csv_path = Path(csv_path)
+    store_dir = Path(store_dir) if store_dir else store_path(csv_path)
+    results_dir = store_dir / "results"
+    summary_dir = store_dir / "summary"
+
+    meta = fresh_meta(results_dir, csv_path)
+    if meta is not None and fresh_meta(summary_dir, csv_path) is not None:
+        results = load_columns(results_dir, meta)
+        return {
+            'results': results,
+            'summary': load_columns(summary_dir),
+            'store': store_dir,
+            'rows': meta['attrs'].get('rows', 0),
+            'chunks': 0,
+            'chunk_rows': 0,
+            'seconds': time.perf_counter() - started,
+        }
+
+    fingerprint = file_fingerprint(csv_path)
+    chunk_rows = estimate_chunk_rows(csv_path, memory_budget_mb)
+    appender = None
+    totals: Optional[pd.Series] = None
+    wins: Optional[pd.Series] = None
+    rows = chunks = 0
+
+    for chunk in pd.read_csv(csv_path, chunksize=chunk_rows):
+        if appender is None:
+            appender = ColumnAppender(store_dir, _raw_dtypes(chunk), fingerprint)
+        _check_chunk(chunk, appender.dtypes, rows)
+        appender.append(chunk)
+        groups = chunk.groupby(RESULT_KEYS, sort=False)
+        chunk_totals = groups['votes'].sum()
+        totals = chunk_totals if totals is None else totals.add(chunk_totals, fill_value=0)
+        if 'winner' in chunk.columns:
+            chunk_wins = _winner_flag(chunk['winner']).groupby([chunk[key] for key in RESULT_KEYS],
+                                                               sort=False).sum()
+            wins = chunk_wins if wins is None else wins.add(chunk_wins, fill_value=0)
+        rows += len(chunk)
+        chunks += 1
+
+    if appender is None:
+        return {'results': pd.DataFrame(), 'summary': pd.DataFrame(), 'store': store_dir,
+                'rows': 0, 'chunks': 0, 'chunk_rows': chunk_rows,
+                'seconds': time.perf_counter() - started}
+    appender.close(attrs={'rows': rows})
+
+    results = totals.astype(np.int64).rename('votes').reset_index()
+    if wins is not None:
+        results['winner'] = wins.reindex(totals.index, fill_value=0).to_numpy() > 0
+    else:
+        winner_rows = results.groupby(CONTEST_KEYS, sort=False)['votes'].idxmax()
+        results['winner'] = False
+        results.loc[winner_rows.to_numpy(), 'winner'] = True
+    if prepare is not None:
+        results = prepare(results)
+    summary = constituency_summary(results)
+
+    save_columns(results, results_dir, dict(fingerprint), attrs={'rows': rows})
+    save_columns(summary, summary_dir, dict(fingerprint))
+
+    return {
+        'results': results,
+        'summary': summary,
+        'store': store_dir,
+        'rows': rows,
+        'chunks': chunks,
+        'chunk_rows': chunk_rows,
+        'seconds': time.perf_counter() - started,
+    }
+
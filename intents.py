@@ -0,0 +1,69 @@
+from typing import Any, Dict, Iterable, List, NamedTuple, Tuple
+
+from gazetteer import Gazetteer
+
+# Added to an intent's phrase score when every entity it needs is in the query.
+ENTITY_BONUS = 0.5
+
+
+class Intent(NamedTuple):
+    """A kind of question: weighted phrases that suggest it and the entity slots its answer needs.
+
+    An intent without phrases is chosen on its entities alone, scoring
+    ``base`` when all of them are present.
+    """
+    name: str
+    phrases: Dict[str, float]
+    requires: Tuple[str, ...] = ()
+    base: float = 0.0
+
+
+class IntentMatch(NamedTuple):
+    """A scored intent: its share of all intent scores as confidence, and the required slots left empty."""
+    intent: str
+    score: float
+    confidence: float
+    missing: Tuple[str, ...]
+
+
+class IntentClassifier:
+    """Scores every intent in one pass over a query's tokens.
+
+    All intents' phrases go into one token trie (a ``Gazetteer`` keyed by
+    intent), so a query is walked once whatever the number of phrases,
+    and the longest phrase wins where phrases overlap ("closest margin" is
+    not also read as "margin"). Each matched phrase adds its weight to the
+    intents it belongs to; intents whose required slots are all filled get
+    ``ENTITY_BONUS`` on top. Ties go to the intent declared first.
+    """
+
+    def __init__(self, intents: Iterable[Intent]):
+        self.intents: List[Intent] = list(intents)
+        self._by_name = {intent.name: (order, intent) for order, intent in enumerate(self.intents)}
+        self._based = [(order, intent) for order, intent in enumerate(self.intents) if intent.base]
+        self._trie = Gazetteer({intent.name: intent.phrases for intent in self.intents})
+
+    def scores(self, text: str) -> Dict[str, float]:
+        """Summed phrase weights per intent for the phrases in ``text``."""
+        scores: Dict[str, float] = {}
+        for span in self._trie.find(text):
+            for name, phrase in span.entities.items():
+                scores[name] = scores.get(name, 0.0) + self._by_name[name][1].phrases[phrase]
+        return scores
+
+    def classify(self, text: str, slots: Dict[str, Any]) -> List[IntentMatch]:
+        """Intents that apply to ``text`` given its extracted slots, best first."""
+        scores = self.scores(text)
+        ranked = []
+        for name, score in scores.items():
+            order, intent = self._by_name[name]
+            missing = tuple(slot for slot in intent.requires if not slots.get(slot))
+            if intent.requires and not missing:
+                score += ENTITY_BONUS
+            ranked.append((-score, order, name, missing))
+        for order, intent in self._based:
+            if intent.name not in scores and all(slots.get(slot) for slot in intent.requires):
+                ranked.append((-intent.base, order, intent.name, ()))
+        ranked.sort()
+        total = -sum(score for score, _, _, _ in ranked)
+        return [IntentMatch(name, -score, -score / total, missing) for score, _, name, missing in ranked]
@@ -0,0 +1,75 @@
+import threading
+import numpy as np
+import pandas as pd
+from typing import Optional, Dict, Tuple, Sequence
+
+# name -> (source table, ranked column, label, unit)
+LEADERBOARDS = {
+    'margin': ('contests', 'margin', "Winning margin", "votes"),
+    'winner_share': ('contests', 'winner_share', "Winner's vote share", "%"),
+    'booth_margin': ('booths', 'margin', "Booth winning margin", "votes"),
+    'booth_turnout': ('booths', 'turnout_percentage', "Booth turnout", "%"),
+}
+
+
+class Leaderboard:
+    """Rows of a table ranked by one column, filterable by year and district.
+
+    The ranked order of every (year, district) scope is computed once, on
+    its first use, with a single sort of that scope's rows; after that a
+    top-K query is a slice of the cached order, whatever the table size.
+    Equal values are ranked by the ``ties`` columns and then by row order.
+    """
+
+    def __init__(self, frame: pd.DataFrame, column: str, ties: Sequence[str] = ()):
+        self.frame = frame
+        self.column = column
+        self._values = frame[column].to_numpy(dtype=np.float64)
+        self._ties = [frame[col].to_numpy() if pd.api.types.is_numeric_dtype(frame[col])
+                      else frame[col].astype(str).to_numpy(dtype=str) for col in ties]
+        self._years = frame['year'].to_numpy()
+        self._districts = frame['district'].astype(str).to_numpy()
+        self._ranked: Dict[Tuple, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def _order(self, year: Optional[int], district: Optional[str], largest: bool) -> np.ndarray:
+        key = (year, district, largest)
+        ranked = self._ranked.get(key)
+        if ranked is None:
+            scope = np.ones(len(self._values), dtype=bool)
+            if year is not None:
+                scope &= self._years == year
+            if district is not None:
+                scope &= self._districts == district
+            positions = np.flatnonzero(scope)
+            values = self._values[positions]
+            # Missing values rank last either way.
+            primary = np.where(np.isnan(values), np.inf, -values if largest else values)
+            ties = [tie[positions] for tie in reversed(self._ties)]
+            ranked = positions[np.lexsort([positions] + ties + [primary])]
+            with self._lock:
+                self._ranked[key] = ranked
+        return ranked
+
+    def top(self, k: int = 10, year: Optional[int] = None, district: Optional[str] = None,
+            largest: bool = True) -> pd.DataFrame:
+        """The ``k`` rows with the largest (or smallest) values, best first, with a 1-based ``rank`` column."""
+        positions = self._order(None if year is None else int(year), district or None, largest)[:max(int(k), 0)]
+        top = self.frame.iloc[positions].reset_index(drop=True)
+        top.insert(0, 'rank', np.arange(1, len(top) + 1))
+        return top
+
+
+def build_leaderboards(summary: pd.DataFrame, booths: Optional[pd.DataFrame] = None) -> Dict[str, Leaderboard]:
+    """Leaderboards over the constituency summary and, when given, the booth table.
+
+    Contest boards only rank contests with a runner-up; ties go to the
+    alphabetically first constituency, then the earliest year.
+    """
+    sources = {'contests': (summary[summary['candidates'] >= 2].reset_index(drop=True), ('constituency', 'year'))}
+    if booths is not None:
+        sources['booths'] = (booths.reset_index(drop=True), ('booth_id', 'year'))
+    return {
+        name: Leaderboard(sources[source][0], column, sources[source][1])
+        for name, (source, column, _, _) in LEADERBOARDS.items() if source in sources
+    }
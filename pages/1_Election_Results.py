@@ -1,7 +1,7 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-from utils import setup_page, load_data, render_page_header, render_breadcrumb, render_footer
+from utils import setup_page, render_year_selector, get_election_index, get_summary_index, get_leaderboards, render_page_header, render_breadcrumb, render_footer
 
 setup_page("Election Results - Pollytics")
 
@@ -15,7 +15,9 @@ with col1:
 
 render_page_header("Election Results", "Explore constituency-wise election results with detailed analysis", "📊")
 
-df = load_data()
+index = get_election_index()
+summary = get_summary_index()
+leaderboards = get_leaderboards()
 
 if 'selected_year' not in st.session_state:
     st.session_state.selected_year = None
@@ -29,25 +31,7 @@ if st.session_state.selected_year is None:
     <p style="color: #6b7280; margin-bottom: 1.5rem;">Select an election year to begin exploring the results.</p>
     """, unsafe_allow_html=True)
     
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown('<div class="year-box"><h2>2023</h2><p>Assembly Election</p></div>', unsafe_allow_html=True)
-        if st.button("Select 2023", key="e_2023", use_container_width=True, type="primary"):
-            st.session_state.selected_year = 2023
-            st.rerun()
-    
-    with col2:
-        st.markdown('<div class="year-box"><h2>2024</h2><p>Assembly Election</p></div>', unsafe_allow_html=True)
-        if st.button("Select 2024", key="e_2024", use_container_width=True, type="primary"):
-            st.session_state.selected_year = 2024
-            st.rerun()
-    
-    with col3:
-        st.markdown('<div class="year-box"><h2>2025</h2><p>Assembly Election</p></div>', unsafe_allow_html=True)
-        if st.button("Select 2025", key="e_2025", use_container_width=True, type="primary"):
-            st.session_state.selected_year = 2025
-            st.rerun()
+    render_year_selector(index.years, 'selected_year', "e_{year}")
 
 elif st.session_state.selected_constituency is None:
     render_breadcrumb([f"{st.session_state.selected_year} Election", "Select Location"])
@@ -56,8 +40,6 @@ elif st.session_state.selected_constituency is None:
         st.session_state.selected_year = None
         st.rerun()
     
-    year_df = df[df['year'] == st.session_state.selected_year]
-    
     st.markdown("""
     <div class="filter-section">
         <div class="filter-section-title">Select Location</div>
@@ -66,7 +48,7 @@ elif st.session_state.selected_constituency is None:
     col1, col2 = st.columns(2)
     
     with col1:
-        districts = sorted(year_df['district'].unique())
+        districts = index.districts(st.session_state.selected_year)
         selected_district = st.selectbox(
             "District",
             options=[""] + list(districts),
@@ -76,7 +58,7 @@ elif st.session_state.selected_constituency is None:
     
     with col2:
         if selected_district and selected_district != "":
-            constituencies = sorted(year_df[year_df['district'] == selected_district]['constituency'].unique())
+            constituencies = index.constituencies(st.session_state.selected_year, selected_district)
             selected_constituency = st.selectbox(
                 "Constituency",
                 options=[""] + list(constituencies),
@@ -100,6 +82,33 @@ elif st.session_state.selected_constituency is None:
                 st.session_state.selected_district = selected_district
                 st.session_state.selected_constituency = selected_constituency
                 st.rerun()
+    
+    year = st.session_state.selected_year
+    st.markdown("---")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(f"##### Closest Contests of {year}")
+        closest = leaderboards['margin'].top(5, year=year, largest=False)
+        for _, row in closest.iterrows():
+            st.markdown(f"""
+            <div class="comparison-card">
+                <div class="constituency">{row['rank']}. {row['constituency']}</div>
+                <div class="winner">🏆 {row['winner_candidate']} ({row['winner_party']}) • won by {row['margin']:,} votes</div>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"##### Biggest Wins of {year}")
+        biggest = leaderboards['margin'].top(5, year=year, largest=True)
+        for _, row in biggest.iterrows():
+            st.markdown(f"""
+            <div class="comparison-card">
+                <div class="constituency">{row['rank']}. {row['constituency']}</div>
+                <div class="winner">🏆 {row['winner_candidate']} ({row['winner_party']}) • won by {row['margin']:,} votes</div>
+            </div>
+            """, unsafe_allow_html=True)
 
 else:
     year = st.session_state.selected_year
@@ -115,26 +124,24 @@ else:
             st.session_state.selected_constituency = None
             st.rerun()
     
-    const_data = df[(df['year'] == year) &
-                    (df['district'] == district) &
-                    (df['constituency'] == constituency)].copy()
+    const_data = index.select(year=year, district=district, constituency=constituency).copy()
+    contest = summary.select(year=year, district=district, constituency=constituency)
     
-    if not const_data.empty:
-        winner = const_data[const_data['winner'] == 'Yes'].iloc[0]
-        runner_up = const_data[const_data['winner'] == 'No'].sort_values('votes', ascending=False).iloc[0]
+    if not const_data.empty and not contest.empty:
+        contest = contest.iloc[0]
         
         st.markdown(f"""
         <div class="winner-card">
             <h2>🏆 WINNER</h2>
-            <div class="candidate-name">{winner['candidate']}</div>
-            <div class="party">{winner['party']}</div>
-            <div class="votes">{winner['votes']:,} Votes</div>
+            <div class="candidate-name">{contest['winner_candidate']}</div>
+            <div class="party">{contest['winner_party']}</div>
+            <div class="votes">{contest['winner_votes']:,} Votes</div>
         </div>
         """, unsafe_allow_html=True)
         
-        total_votes = const_data['votes'].sum()
-        margin = winner['votes'] - runner_up['votes']
-        vote_share = (winner['votes'] / total_votes) * 100
+        total_votes = contest['total_votes']
+        margin = contest['margin']
+        vote_share = contest['winner_share']
         
         col1, col2, col3, col4 = st.columns(4)
         
@@ -163,7 +170,7 @@ else:
             st.markdown(f'''
             <div class="metric-card">
                 <div class="label">Runner Up</div>
-                <div class="value" style="font-size: 1.1rem;">{runner_up["candidate"]}</div>
+                <div class="value" style="font-size: 1.1rem;">{contest["runner_up_candidate"]}</div>
             </div>
             ''', unsafe_allow_html=True)
         
@@ -209,19 +216,17 @@ else:
         st.markdown("---")
         st.markdown(f"##### Other Constituencies in {district} District")
         
-        others = df[(df['year'] == year) &
-                    (df['district'] == district) &
-                    (df['constituency'] != constituency)]
+        district_contests = summary.select(year=year, district=district)
+        others = district_contests[district_contests['constituency'] != constituency]
         
         if not others.empty:
-            other_winners = others[others['winner'] == 'Yes']
             cols = st.columns(2)
-            for i, (_, row) in enumerate(other_winners.iterrows()):
+            for i, (_, row) in enumerate(others.iterrows()):
                 with cols[i % 2]:
                     st.markdown(f"""
                     <div class="comparison-card">
                         <div class="constituency">{row['constituency']}</div>
-                        <div class="winner">🏆 {row['candidate']} ({row['party']}) • {row['votes']:,} votes</div>
+                        <div class="winner">🏆 {row['winner_candidate']} ({row['winner_party']}) • {row['winner_votes']:,} votes</div>
                     </div>
                     """, unsafe_allow_html=True)
         
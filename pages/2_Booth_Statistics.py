@@ -1,7 +1,7 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-from utils import setup_page, create_booth_data, render_page_header, render_breadcrumb, render_footer
+from utils import setup_page, render_year_selector, get_booth_store, get_booth_index, get_booth_rollup, get_leaderboards, get_booth_swing, get_booth_anomalies, render_page_header, render_breadcrumb, render_footer
 
 setup_page("Booth Statistics - Pollytics")
 
@@ -12,7 +12,12 @@ with col1:
 
 render_page_header("Booth Statistics", "Granular booth-level analysis with turnout and polling data", "🏛️")
 
-booth_df = create_booth_data()
+booth_tables = get_booth_store()
+booth_index = get_booth_index()
+booth_rollup = get_booth_rollup()
+leaderboards = get_leaderboards()
+booth_swing = get_booth_swing()
+booth_anomalies = get_booth_anomalies()
 
 if 'booth_selected_year' not in st.session_state:
     st.session_state.booth_selected_year = None
@@ -26,25 +31,7 @@ if st.session_state.booth_selected_year is None:
     <p style="color: #6b7280; margin-bottom: 1.5rem;">Select an election year to view booth-level statistics.</p>
     """, unsafe_allow_html=True)
     
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown('<div class="year-box"><h2>2023</h2><p>Assembly Election</p></div>', unsafe_allow_html=True)
-        if st.button("Select 2023", key="booth_2023", use_container_width=True, type="primary"):
-            st.session_state.booth_selected_year = 2023
-            st.rerun()
-    
-    with col2:
-        st.markdown('<div class="year-box"><h2>2024</h2><p>Assembly Election</p></div>', unsafe_allow_html=True)
-        if st.button("Select 2024", key="booth_2024", use_container_width=True, type="primary"):
-            st.session_state.booth_selected_year = 2024
-            st.rerun()
-    
-    with col3:
-        st.markdown('<div class="year-box"><h2>2025</h2><p>Assembly Election</p></div>', unsafe_allow_html=True)
-        if st.button("Select 2025", key="booth_2025", use_container_width=True, type="primary"):
-            st.session_state.booth_selected_year = 2025
-            st.rerun()
+    render_year_selector(booth_index.years, 'booth_selected_year', "booth_{year}")
 
 elif st.session_state.booth_selected_constituency is None:
     render_breadcrumb([f"{st.session_state.booth_selected_year} Election", "Select Location"])
@@ -53,8 +40,6 @@ elif st.session_state.booth_selected_constituency is None:
         st.session_state.booth_selected_year = None
         st.rerun()
     
-    year_df = booth_df[booth_df['year'] == st.session_state.booth_selected_year]
-    
     st.markdown("""
     <div class="filter-section">
         <div class="filter-section-title">Select Location</div>
@@ -63,7 +48,7 @@ elif st.session_state.booth_selected_constituency is None:
     col1, col2 = st.columns(2)
     
     with col1:
-        districts = sorted(year_df['district'].unique())
+        districts = booth_index.districts(st.session_state.booth_selected_year)
         selected_district = st.selectbox(
             "District",
             options=[""] + list(districts),
@@ -73,7 +58,7 @@ elif st.session_state.booth_selected_constituency is None:
     
     with col2:
         if selected_district and selected_district != "":
-            constituencies = sorted(year_df[year_df['district'] == selected_district]['constituency'].unique())
+            constituencies = booth_index.constituencies(st.session_state.booth_selected_year, selected_district)
             selected_constituency = st.selectbox(
                 "Constituency",
                 options=[""] + list(constituencies),
@@ -112,32 +97,25 @@ else:
             st.session_state.booth_selected_constituency = None
             st.rerun()
     
-    booth_data = booth_df[(booth_df['year'] == year) &
-                          (booth_df['district'] == district) &
-                          (booth_df['constituency'] == constituency)]
-    
-    unique_booths = booth_data[['booth_id', 'booth_name', 'total_voters', 'votes_polled',
-                                 'previous_error', 'postal_votes', 'tendered_votes']].drop_duplicates()
-    
-    booth_winners = booth_data[booth_data['winner'] == 'Yes'][['booth_id', 'candidate', 'party', 'margin']]
-    
-    booth_summary = unique_booths.merge(booth_winners, on='booth_id', how='left')
-    booth_summary['turnout_percentage'] = (booth_summary['votes_polled'] / booth_summary['total_voters'] * 100).round(1)
+    booth_summary = booth_tables.with_names(booth_index.select(year=year, district=district, constituency=constituency))
     
-    tab1, tab2, tab3 = st.tabs(["📋 Booth List", "🔍 Booth Details", "📊 Polling Analysis"])
+    tab1, tab2, tab3, tab4 = st.tabs(["📋 Booth List", "🔍 Booth Details", "📊 Polling Analysis", "🔄 Booth Swing"])
     
     with tab1:
         st.markdown(f"##### Booths in {constituency}")
         
         display_cols = ['booth_id', 'booth_name', 'total_voters', 'votes_polled', 'turnout_percentage',
-                       'candidate', 'party', 'margin']
+                       'winner_candidate', 'winner_party', 'margin']
         display_df = booth_summary[display_cols].copy()
         
         display_df['turnout_percentage'] = display_df['turnout_percentage'].astype(str) + '%'
         display_df['margin'] = display_df['margin'].astype(str) + ' votes'
+        scores = booth_anomalies.scores(display_df['booth_id'], year)
+        display_df['score'] = scores['score'].to_numpy()
+        display_df['flags'] = scores['flags'].replace('', '-').to_numpy()
         
         display_df.columns = ['Booth ID', 'Booth Name', 'Total Voters', 'Votes Polled',
-                             'Turnout %', 'Winner', 'Party', 'Margin']
+                             'Turnout %', 'Winner', 'Party', 'Margin', 'Anomaly Score', 'Flags']
         
         st.dataframe(display_df, use_container_width=True, hide_index=True)
         st.info(f"Showing {len(display_df)} booths in {constituency}")
@@ -150,7 +128,7 @@ else:
             selected_booth = st.selectbox("Select a Booth", booth_options, key="booth_detail_select")
             
             booth_id = int(selected_booth.split(' - ')[0])
-            booth_detail = booth_summary[booth_summary['booth_id'] == booth_id].iloc[0]
+            booth_detail = booth_tables.find(booth_id, year=year)
             
             col1, col2, col3 = st.columns(3)
             
@@ -189,8 +167,8 @@ else:
                 <div class="stat-box">
                     <div class="stat-icon">🏆</div>
                     <div class="stat-label">Winner</div>
-                    <div class="stat-value" style="font-size: 1.1rem;">{booth_detail['candidate']}</div>
-                    <div class="stat-sublabel">{booth_detail['party']}</div>
+                    <div class="stat-value" style="font-size: 1.1rem;">{booth_detail['winner_candidate']}</div>
+                    <div class="stat-sublabel">{booth_detail['winner_party']}</div>
                 </div>
                 ''', unsafe_allow_html=True)
                 st.markdown(f'''
@@ -202,7 +180,7 @@ else:
             
             st.markdown("<div style='height: 1rem;'></div>", unsafe_allow_html=True)
             
-            booth_candidates = booth_data[booth_data['booth_id'] == booth_id]
+            booth_candidates = booth_tables.booth_results(booth_detail['booth_key'])
             
             st.markdown("##### Candidate-wise Vote Split")
             
@@ -224,45 +202,88 @@ else:
     with tab3:
         st.markdown("##### Polling Analysis")
         
-        if not booth_summary.empty:
+        constituency_totals = booth_rollup.node(year, district, constituency)
+        
+        if not booth_summary.empty and constituency_totals is not None:
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
-                avg_turnout = booth_summary['turnout_percentage'].mean()
                 st.markdown(f'''
                 <div class="metric-card">
-                    <div class="label">Avg Turnout</div>
-                    <div class="value">{avg_turnout:.1f}%</div>
+                    <div class="label">Turnout</div>
+                    <div class="value">{constituency_totals['turnout']:.1f}%</div>
                 </div>
                 ''', unsafe_allow_html=True)
             
             with col2:
-                total_voters = booth_summary['total_voters'].sum()
                 st.markdown(f'''
                 <div class="metric-card">
                     <div class="label">Total Voters</div>
-                    <div class="value">{total_voters:,}</div>
+                    <div class="value">{constituency_totals['total_voters']:,}</div>
                 </div>
                 ''', unsafe_allow_html=True)
             
             with col3:
-                total_votes = booth_summary['votes_polled'].sum()
                 st.markdown(f'''
                 <div class="metric-card">
                     <div class="label">Total Votes</div>
-                    <div class="value">{total_votes:,}</div>
+                    <div class="value">{constituency_totals['votes_polled']:,}</div>
                 </div>
                 ''', unsafe_allow_html=True)
             
             with col4:
-                total_postal = booth_summary['postal_votes'].sum()
                 st.markdown(f'''
                 <div class="metric-card">
                     <div class="label">Postal Votes</div>
-                    <div class="value">{total_postal}</div>
+                    <div class="value">{constituency_totals['postal_votes']:,}</div>
                 </div>
                 ''', unsafe_allow_html=True)
             
+            st.markdown("<div style='height: 1.5rem;'></div>", unsafe_allow_html=True)
+            st.markdown("##### Constituency, District and State")
+            
+            levels = [(constituency, constituency_totals), (f"{district} District", booth_rollup.node(year, district)),
+                      ("Kerala", booth_rollup.node(year))]
+            level_table = pd.DataFrame([{
+                'Area': name,
+                'Booths': totals['booths'],
+                'Total Voters': f"{totals['total_voters']:,}",
+                'Votes Polled': f"{totals['votes_polled']:,}",
+                'Turnout %': f"{totals['turnout']:.1f}%",
+                'Postal Votes': f"{totals['postal_votes']:,}",
+                'Tendered Votes': f"{totals['tendered_votes']:,}",
+                'Leading Party': next(iter(totals['party_votes']), '-'),
+            } for name, totals in levels])
+            st.dataframe(level_table, use_container_width=True, hide_index=True)
+            
+            district_constituencies = booth_rollup.children(year, district)
+            
+            fig_district = px.bar(district_constituencies, x='constituency', y='turnout',
+                                  color_discrete_sequence=['#234d3c'])
+            fig_district.update_layout(
+                title=f"Turnout across {district} District",
+                xaxis_title="Constituency",
+                yaxis_title="Turnout %",
+                showlegend=False,
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)'
+            )
+            st.plotly_chart(fig_district, use_container_width=True)
+            
+            st.markdown(f"##### Turnout Extremes in {district} District")
+            
+            col1, col2 = st.columns(2)
+            for column, largest, title in ((col1, True, "Highest Turnout"), (col2, False, "Lowest Turnout")):
+                with column:
+                    extremes = booth_tables.with_names(leaderboards['booth_turnout'].top(5, year=year, district=district,
+                                                                                        largest=largest))
+                    st.markdown(f"**{title}**")
+                    st.dataframe(pd.DataFrame({
+                        'Booth': extremes['booth_name'],
+                        'Constituency': extremes['constituency'],
+                        'Turnout %': extremes['turnout_percentage'].map(lambda x: f"{x}%"),
+                    }), use_container_width=True, hide_index=True)
+            
             st.markdown("<div style='height: 1.5rem;'></div>", unsafe_allow_html=True)
             st.markdown("##### Turnout Comparison Across Booths")
             
@@ -280,4 +301,70 @@ else:
             )
             st.plotly_chart(fig, use_container_width=True)
 
+    with tab4:
+        st.markdown(f"##### Booth Swing in {constituency}")
+        
+        other_years = [y for y in booth_swing.years if y != year]
+        if other_years:
+            compare_year = st.selectbox("Compare with", other_years, key="booth_swing_year")
+            earlier, later = sorted((year, compare_year))
+            booth_changes = booth_swing.compare(earlier, later, district, constituency)
+            
+            if not booth_changes.empty:
+                col1, col2, col3 = st.columns(3)
+                
+                with col1:
+                    st.markdown(f'''
+                    <div class="metric-card">
+                        <div class="label">Booths Compared</div>
+                        <div class="value">{len(booth_changes)}</div>
+                    </div>
+                    ''', unsafe_allow_html=True)
+                
+                with col2:
+                    st.markdown(f'''
+                    <div class="metric-card">
+                        <div class="label">Winner Changed</div>
+                        <div class="value">{int(booth_changes['winner_changed'].sum())}</div>
+                    </div>
+                    ''', unsafe_allow_html=True)
+                
+                with col3:
+                    st.markdown(f'''
+                    <div class="metric-card">
+                        <div class="label">Avg Turnout Change</div>
+                        <div class="value">{booth_changes['turnout_change'].mean():+.1f} pts</div>
+                    </div>
+                    ''', unsafe_allow_html=True)
+                
+                st.markdown("<div style='height: 1.5rem;'></div>", unsafe_allow_html=True)
+                
+                display_changes = pd.DataFrame({
+                    'Booth No.': booth_changes['booth_serial'],
+                    f'Booth ID {earlier}': booth_changes[f'booth_id_{earlier}'],
+                    f'Booth ID {later}': booth_changes[f'booth_id_{later}'],
+                    f'Turnout {earlier}': booth_changes[f'turnout_{earlier}'].map(lambda x: f"{x}%"),
+                    f'Turnout {later}': booth_changes[f'turnout_{later}'].map(lambda x: f"{x}%"),
+                    'Turnout Change': booth_changes['turnout_change'].map(lambda x: f"{x:+.1f} pts"),
+                    f'Winner {earlier}': booth_changes[f'winner_{earlier}'],
+                    f'Winner {later}': booth_changes[f'winner_{later}'],
+                    'Margin Change': booth_changes['margin_change'],
+                })
+                st.dataframe(display_changes, use_container_width=True, hide_index=True)
+                
+                fig_swing = px.bar(booth_changes.assign(booth=booth_changes['booth_serial'].astype(str)),
+                                   x='booth', y='turnout_change',
+                                   color=booth_changes['winner_changed'].map({True: 'Winner changed', False: 'Same winner'}),
+                                   color_discrete_map={'Winner changed': '#d4a03c', 'Same winner': '#234d3c'})
+                fig_swing.update_layout(
+                    xaxis_title="Booth No.",
+                    yaxis_title=f"Turnout change {earlier} to {later} (pts)",
+                    legend_title_text="",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)'
+                )
+                st.plotly_chart(fig_swing, use_container_width=True)
+            else:
+                st.info(f"No booths of {constituency} appear in both {earlier} and {later}")
+
 render_footer()
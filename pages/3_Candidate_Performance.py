@@ -1,7 +1,7 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-from utils import setup_page, load_data, render_page_header, render_breadcrumb, render_footer
+from utils import setup_page, render_year_selector, get_election_index, get_summary_index, get_candidate_index, render_page_header, render_breadcrumb, render_footer
 
 setup_page("Candidate Performance - Pollytics")
 
@@ -16,7 +16,9 @@ with col1:
 
 render_page_header("Candidate Performance", "Analyze individual candidate performance across constituencies", "👥")
 
-df = load_data()
+index = get_election_index()
+summary = get_summary_index()
+careers = get_candidate_index()
 
 if 'cand_year' not in st.session_state:
     st.session_state.cand_year = None
@@ -32,25 +34,7 @@ if st.session_state.cand_year is None:
     <p style="color: #6b7280; margin-bottom: 1.5rem;">Select an election year to analyze candidate performance.</p>
     """, unsafe_allow_html=True)
     
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown('<div class="year-box"><h2>2023</h2><p>Assembly Election</p></div>', unsafe_allow_html=True)
-        if st.button("Select 2023", key="cand_2023", use_container_width=True, type="primary"):
-            st.session_state.cand_year = 2023
-            st.rerun()
-    
-    with col2:
-        st.markdown('<div class="year-box"><h2>2024</h2><p>Assembly Election</p></div>', unsafe_allow_html=True)
-        if st.button("Select 2024", key="cand_2024", use_container_width=True, type="primary"):
-            st.session_state.cand_year = 2024
-            st.rerun()
-    
-    with col3:
-        st.markdown('<div class="year-box"><h2>2025</h2><p>Assembly Election</p></div>', unsafe_allow_html=True)
-        if st.button("Select 2025", key="cand_2025", use_container_width=True, type="primary"):
-            st.session_state.cand_year = 2025
-            st.rerun()
+    render_year_selector(index.years, 'cand_year', "cand_{year}")
 
 elif st.session_state.cand_constituency is None:
     render_breadcrumb([f"{st.session_state.cand_year} Election", "Select Location"])
@@ -59,8 +43,6 @@ elif st.session_state.cand_constituency is None:
         st.session_state.cand_year = None
         st.rerun()
     
-    year_df = df[df['year'] == st.session_state.cand_year]
-    
     st.markdown("""
     <div class="filter-section">
         <div class="filter-section-title">Select Location</div>
@@ -69,7 +51,7 @@ elif st.session_state.cand_constituency is None:
     col1, col2 = st.columns(2)
     
     with col1:
-        districts = sorted(year_df['district'].unique())
+        districts = index.districts(st.session_state.cand_year)
         selected_district = st.selectbox(
             "District",
             options=[""] + list(districts),
@@ -79,7 +61,7 @@ elif st.session_state.cand_constituency is None:
     
     with col2:
         if selected_district and selected_district != "":
-            constituencies = sorted(year_df[year_df['district'] == selected_district]['constituency'].unique())
+            constituencies = index.constituencies(st.session_state.cand_year, selected_district)
             selected_constituency = st.selectbox(
                 "Constituency",
                 options=[""] + list(constituencies),
@@ -112,9 +94,9 @@ elif st.session_state.cand_candidate is None:
         st.session_state.cand_constituency = None
         st.rerun()
     
-    candidates_df = df[(df['year'] == st.session_state.cand_year) &
-                       (df['district'] == st.session_state.cand_district) &
-                       (df['constituency'] == st.session_state.cand_constituency)]
+    candidates_df = index.select(year=st.session_state.cand_year,
+                                 district=st.session_state.cand_district,
+                                 constituency=st.session_state.cand_constituency)
     
     st.markdown(f"""
     <p style="color: #6b7280; margin-bottom: 1rem;">
@@ -125,7 +107,7 @@ elif st.session_state.cand_candidate is None:
     cols = st.columns(2)
     for i, (_, row) in enumerate(candidates_df.sort_values('votes', ascending=False).iterrows()):
         with cols[i % 2]:
-            if row['winner'] == 'Yes':
+            if row['winner']:
                 st.markdown(f"""
                 <div class="candidate-card candidate-card-winner">
                     <div style="font-size: 1.5rem; margin-bottom: 0.5rem;">🏆</div>
@@ -161,20 +143,16 @@ else:
             st.session_state.cand_candidate = None
             st.rerun()
     
-    candidate_data = df[(df['year'] == year) &
-                       (df['district'] == district) &
-                       (df['constituency'] == constituency) &
-                       (df['candidate'] == candidate_name)].iloc[0]
+    candidate_data = index.select(year=year, district=district, constituency=constituency,
+                                  candidate=candidate_name).iloc[0]
     
-    all_candidates = df[(df['year'] == year) &
-                       (df['district'] == district) &
-                       (df['constituency'] == constituency)]
+    all_candidates = index.select(year=year, district=district, constituency=constituency)
+    contest = summary.select(year=year, district=district, constituency=constituency).iloc[0]
     
-    is_winner = candidate_data['winner'] == 'Yes'
-    total_votes = all_candidates['votes'].sum()
+    is_winner = bool(candidate_data['winner'])
+    total_votes = contest['total_votes']
     vote_share = (candidate_data['votes'] / total_votes) * 100
-    sorted_candidates = all_candidates.sort_values('votes', ascending=False).reset_index()
-    rank = sorted_candidates[sorted_candidates['candidate'] == candidate_name].index[0] + 1
+    rank = int((all_candidates['votes'] > candidate_data['votes']).sum()) + 1
     
     if is_winner:
         st.markdown(f"""
@@ -186,9 +164,8 @@ else:
         </div>
         """, unsafe_allow_html=True)
     else:
-        winner_name = sorted_candidates.iloc[0]['candidate']
-        winner_votes = sorted_candidates.iloc[0]['votes']
-        margin = winner_votes - candidate_data['votes']
+        winner_name = contest['winner_candidate']
+        margin = contest['winner_votes'] - candidate_data['votes']
         
         st.markdown(f"""
         <div style="background: #f8fafc; padding: 1.5rem; border-radius: 16px; text-align: center; border: 1px solid #e2e8f0; margin-bottom: 1.5rem;">
@@ -209,7 +186,7 @@ else:
             <div class="stat-icon">📊</div>
             <div class="stat-label">Position</div>
             <div class="stat-value">#{rank}</div>
-            <div class="stat-sublabel">out of {len(all_candidates)} candidates</div>
+            <div class="stat-sublabel">out of {contest['candidates']} candidates</div>
         </div>
         ''', unsafe_allow_html=True)
     
@@ -267,7 +244,7 @@ else:
     
     table_data = []
     for _, row in all_candidates.sort_values('votes', ascending=False).iterrows():
-        winner_star = "🏆 " if row['winner'] == 'Yes' else ""
+        winner_star = "🏆 " if row['winner'] else ""
         table_data.append({
             "Candidate": f"{winner_star}{row['candidate']}",
             "Party": row['party'],
@@ -276,12 +253,45 @@ else:
     
     st.dataframe(pd.DataFrame(table_data), use_container_width=True, hide_index=True)
     
+    st.markdown("---")
+    st.markdown("##### Career Timeline")
+    
+    party = str(candidate_data['party'])
+    home = str(careers.contests(candidate_name, year, constituency, party)['home_district'].iloc[0])
+    career = careers.career(candidate_name, party, home)
+    namesakes = len(careers.identities(candidate_name)) - 1
+    
+    if namesakes:
+        st.caption(f"{namesakes} other candidate(s) named {candidate_name} stood for a different party or district; "
+                   f"this timeline only follows {candidate_name} ({party}, {home}).")
+    
+    career_table = pd.DataFrame({
+        'Year': career['year'],
+        'Constituency': career['constituency'],
+        'Votes': career['votes'].map(lambda x: f"{x:,}"),
+        'Vote Share': career['share'].map(lambda x: f"{x:.1f}%"),
+        'Position': career['rank'].astype(str) + " of " + career['candidates'].astype(str),
+        'Result': [("🏆 Won" if won else f"Lost by {deficit:,}") for won, deficit in zip(career['winner'], career['deficit'])],
+    })
+    st.dataframe(career_table, use_container_width=True, hide_index=True)
+    
+    if len(career) > 1:
+        fig_career = px.line(career, x='year', y='share', markers=True, hover_data=['constituency', 'votes', 'rank'],
+                             color_discrete_sequence=['#234d3c'])
+        fig_career.update_layout(
+            xaxis_title="Year",
+            yaxis_title="Vote Share %",
+            xaxis=dict(tickmode='array', tickvals=career['year'].tolist()),
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)'
+        )
+        st.plotly_chart(fig_career, use_container_width=True)
+    
     st.markdown("---")
     
     if is_winner:
-        runner_up = sorted_candidates.iloc[1]['candidate']
-        runner_up_votes = sorted_candidates.iloc[1]['votes']
-        margin = candidate_data['votes'] - runner_up_votes
+        runner_up = contest['runner_up_candidate']
+        margin = contest['margin']
         st.success(f"**{candidate_name}** won by **{margin:,}** votes against **{runner_up}**")
     else:
         if rank == 2:
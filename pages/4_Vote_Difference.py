@@ -1,8 +1,9 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from utils import setup_page, load_data, render_page_header, render_breadcrumb, render_footer
+from utils import setup_page, render_year_selector, get_election_index, get_party_cube, get_swing_engine, get_seat_simulator, get_seat_projection, render_page_header, render_breadcrumb, render_footer
 
 setup_page("Vote Difference Analysis - Pollytics")
 
@@ -17,7 +18,9 @@ with col1:
 
 render_page_header("Vote Difference Analysis", "Compare election results between two different years", "📈")
 
-df = load_data()
+index = get_election_index()
+cube = get_party_cube()
+swing = get_swing_engine()
 
 if 'vote_year1' not in st.session_state:
     st.session_state.vote_year1 = None
@@ -33,25 +36,7 @@ if st.session_state.vote_year1 is None:
     <p style="color: #6b7280; margin-bottom: 1.5rem;">Select the first election year for comparison.</p>
     """, unsafe_allow_html=True)
     
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown('<div class="year-box"><h2>2023</h2><p>Assembly Election</p></div>', unsafe_allow_html=True)
-        if st.button("Select 2023", key="vote_2023_1", use_container_width=True, type="primary"):
-            st.session_state.vote_year1 = 2023
-            st.rerun()
-    
-    with col2:
-        st.markdown('<div class="year-box"><h2>2024</h2><p>Assembly Election</p></div>', unsafe_allow_html=True)
-        if st.button("Select 2024", key="vote_2024_1", use_container_width=True, type="primary"):
-            st.session_state.vote_year1 = 2024
-            st.rerun()
-    
-    with col3:
-        st.markdown('<div class="year-box"><h2>2025</h2><p>Assembly Election</p></div>', unsafe_allow_html=True)
-        if st.button("Select 2025", key="vote_2025_1", use_container_width=True, type="primary"):
-            st.session_state.vote_year1 = 2025
-            st.rerun()
+    render_year_selector(index.years, 'vote_year1', "vote_{year}_1")
 
 elif st.session_state.vote_year2 is None:
     render_breadcrumb([f"{st.session_state.vote_year1} Selected", "Select Second Year"])
@@ -64,20 +49,8 @@ elif st.session_state.vote_year2 is None:
     <p style="color: #6b7280; margin-bottom: 1.5rem;">Select the second year to compare with <strong>{st.session_state.vote_year1}</strong>.</p>
     """, unsafe_allow_html=True)
     
-    col1, col2, col3 = st.columns(3)
-    available_years = [y for y in [2023, 2024, 2025] if y != st.session_state.vote_year1]
-    
-    cols = [col1, col2, col3]
-    col_idx = 0
-    
-    for year in [2023, 2024, 2025]:
-        if year in available_years:
-            with cols[col_idx]:
-                st.markdown(f'<div class="year-box"><h2>{year}</h2><p>Assembly Election</p></div>', unsafe_allow_html=True)
-                if st.button(f"Select {year}", key=f"vote_{year}_2", use_container_width=True, type="primary"):
-                    st.session_state.vote_year2 = year
-                    st.rerun()
-            col_idx += 1
+    available_years = [y for y in index.years if y != st.session_state.vote_year1]
+    render_year_selector(available_years, 'vote_year2', "vote_{year}_2")
 
 elif st.session_state.vote_constituency is None:
     render_breadcrumb([f"{st.session_state.vote_year1} vs {st.session_state.vote_year2}", "Select Location"])
@@ -87,10 +60,10 @@ elif st.session_state.vote_constituency is None:
         st.session_state.vote_year2 = None
         st.rerun()
     
-    year1_df = df[df['year'] == st.session_state.vote_year1]
-    year2_df = df[df['year'] == st.session_state.vote_year2]
+    year1 = st.session_state.vote_year1
+    year2 = st.session_state.vote_year2
     
-    common_districts = set(year1_df['district'].unique()) & set(year2_df['district'].unique())
+    common_districts = set(index.districts(year1)) & set(index.districts(year2))
     
     st.markdown("""
     <div class="filter-section">
@@ -110,8 +83,8 @@ elif st.session_state.vote_constituency is None:
     
     with col2:
         if selected_district and selected_district != "":
-            year1_const = set(year1_df[year1_df['district'] == selected_district]['constituency'].unique())
-            year2_const = set(year2_df[year2_df['district'] == selected_district]['constituency'].unique())
+            year1_const = set(index.constituencies(year1, selected_district))
+            year2_const = set(index.constituencies(year2, selected_district))
             common_constituencies = sorted(list(year1_const & year2_const))
             
             selected_constituency = st.selectbox(
@@ -137,6 +110,195 @@ elif st.session_state.vote_constituency is None:
                 st.session_state.vote_district = selected_district
                 st.session_state.vote_constituency = selected_constituency
                 st.rerun()
+    
+    st.markdown("---")
+    st.markdown(f"##### Statewide Swing: {year1} to {year2}")
+    
+    seat_changes = swing.seat_changes(year1, year2)
+    constituency_swing = swing.compare(year1, year2)
+    party_a, party_b = swing.main_parties(year1, year2)
+    statewide = swing.party_swing(year1, year2).set_index('party')['swing']
+    butler = (statewide.get(party_a, 0) - statewide.get(party_b, 0)) / 2
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown(f'''
+        <div class="metric-card">
+            <div class="label">Seats Compared</div>
+            <div class="value">{len(constituency_swing)}</div>
+        </div>
+        ''', unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f'''
+        <div class="metric-card">
+            <div class="label">Seats Changing Hands</div>
+            <div class="value">{int(constituency_swing['flipped'].sum())}</div>
+        </div>
+        ''', unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(f'''
+        <div class="metric-card">
+            <div class="label">Swing {party_b} to {party_a}</div>
+            <div class="value">{butler:+.2f} pts</div>
+        </div>
+        ''', unsafe_allow_html=True)
+    
+    st.markdown("<div style='height: 1.5rem;'></div>", unsafe_allow_html=True)
+    
+    display_seats = seat_changes.rename(columns={
+        'party': 'Party', f'seats_{year1}': f'Seats {year1}', f'seats_{year2}': f'Seats {year2}',
+        'retained': 'Retained', 'gained': 'Gained', 'lost': 'Lost', 'net': 'Net'
+    })
+    st.dataframe(display_seats, use_container_width=True, hide_index=True)
+    
+    st.markdown("##### Vote Share Swing by District")
+    
+    district_swing = swing.district_swing(year1, year2)
+    limit = max(float(np.abs(district_swing.to_numpy()).max()), 0.01) if not district_swing.empty else 1.0
+    fig_swing = px.imshow(
+        district_swing,
+        color_continuous_scale='RdYlGn',
+        zmin=-limit,
+        zmax=limit,
+        text_auto='+.2f',
+        aspect='auto',
+        labels=dict(x="Party", y="District", color="Swing (pts)")
+    )
+    fig_swing.update_layout(plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)')
+    st.plotly_chart(fig_swing, use_container_width=True)
+    
+    st.markdown("##### Constituency Swing")
+    
+    display_swing = pd.DataFrame({
+        'Constituency': constituency_swing['constituency'],
+        'District': constituency_swing['district'],
+        f'Winner {year1}': constituency_swing[f'winner_{year1}'],
+        f'Winner {year2}': constituency_swing[f'winner_{year2}'],
+        'Changed Hands': constituency_swing['flipped'].map({True: 'Yes', False: 'No'}),
+        'Vote Change': constituency_swing['vote_change'],
+        'Holder Swing': constituency_swing['holder_swing'].map(lambda x: f"{x:+.2f} pts"),
+        f'Swing to {party_a}': constituency_swing['butler_swing'].map(lambda x: f"{x:+.2f} pts"),
+    })
+    st.dataframe(display_swing, use_container_width=True, hide_index=True)
+
+    st.markdown("---")
+    st.markdown(f"##### Seat Projection from {year2}")
+    st.caption("What if the parties' vote shares moved from here? Each simulated election adds your swing plus random statewide, district and seat-level error to every party's share.")
+
+    simulator = get_seat_simulator(year2)
+    projected_parties = [p for p in simulator.parties if simulator.contested[:, simulator.parties.index(p)].any()]
+
+    swing_columns = st.columns(len(projected_parties))
+    uniform_swing = {}
+    for column, party in zip(swing_columns, projected_parties):
+        with column:
+            uniform_swing[party] = st.number_input(f"{party} swing (pts)", min_value=-20.0, max_value=20.0,
+                                                   value=0.0, step=0.5, key=f"project_swing_{party}")
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        swing_district = st.selectbox("District swing", options=[""] + simulator.districts, key="project_district",
+                                      format_func=lambda x: "None" if x == "" else x)
+    with col2:
+        swing_party = st.selectbox("Party", options=projected_parties, key="project_district_party",
+                                   disabled=swing_district == "")
+    with col3:
+        district_points = st.number_input("District swing (pts)", min_value=-20.0, max_value=20.0, value=0.0,
+                                          step=0.5, key="project_district_points", disabled=swing_district == "")
+    with col4:
+        draws = st.selectbox("Simulations", options=[10000, 50000, 200000], key="project_draws",
+                             format_func=lambda n: f"{n:,}")
+
+    uncertainty = st.slider("Seat-level uncertainty (pts)", min_value=0.0, max_value=10.0, value=2.0, step=0.5,
+                            key="project_noise")
+
+    projection = get_seat_projection(
+        year2,
+        draws,
+        tuple(uniform_swing.items()),
+        (((swing_district, swing_party), district_points),) if swing_district else (),
+        seat_noise=uncertainty
+    )
+    projected_seats = projection['seats']
+    favourite = projected_seats.iloc[0]
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown(f'''
+        <div class="metric-card">
+            <div class="label">Seats for Majority</div>
+            <div class="value">{projection['majority']}</div>
+        </div>
+        ''', unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(f'''
+        <div class="metric-card">
+            <div class="label">Projected Largest Party</div>
+            <div class="value">{favourite['party']} ({favourite['mean_seats']:.1f})</div>
+        </div>
+        ''', unsafe_allow_html=True)
+
+    with col3:
+        st.markdown(f'''
+        <div class="metric-card">
+            <div class="label">{favourite['party']} Majority Chance</div>
+            <div class="value">{favourite['majority_probability'] * 100:.1f}%</div>
+        </div>
+        ''', unsafe_allow_html=True)
+
+    st.markdown("<div style='height: 1.5rem;'></div>", unsafe_allow_html=True)
+
+    display_projection = pd.DataFrame({
+        'Party': projected_seats['party'],
+        f'Seats {year2}': projected_seats['base_seats'],
+        'Projected Seats': projected_seats['mean_seats'],
+        '90% Range': projected_seats['p5'].astype(str) + " - " + projected_seats['p95'].astype(str),
+        'Majority Chance': projected_seats['majority_probability'].map(lambda x: f"{x * 100:.1f}%"),
+    })
+    st.dataframe(display_projection, use_container_width=True, hide_index=True)
+
+    distribution = projection['seat_distribution'].T.reset_index().melt(
+        id_vars='index', var_name='Party', value_name='Probability'
+    ).rename(columns={'index': 'Seats'})
+    distribution = distribution[distribution['Probability'] > 0]
+    fig_projection = px.bar(distribution, x='Seats', y='Probability', color='Party', barmode='overlay', opacity=0.7)
+    fig_projection.add_vline(x=projection['majority'] - 0.5, line_dash='dash', line_color='#234d3c')
+    fig_projection.update_layout(
+        xaxis_title="Seats won",
+        yaxis_title="Probability",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    st.plotly_chart(fig_projection, use_container_width=True)
+
+    col1, col2 = st.columns([3, 2])
+
+    with col1:
+        st.markdown("##### Win Probability by Constituency")
+        win_probability = projection['win_probability']
+        display_probability = pd.DataFrame({
+            'Constituency': win_probability['constituency'],
+            'District': win_probability['district'],
+            f'Winner {year2}': win_probability[f'winner_{year2}'],
+            'Favourite': win_probability['favourite'],
+            'Chance': win_probability['favourite_probability'].map(lambda x: f"{x * 100:.1f}%"),
+        })
+        st.dataframe(display_probability, use_container_width=True, hide_index=True)
+
+    with col2:
+        st.markdown("##### Tipping-Point Seats")
+        tipping_point = projection['tipping_point'].head(10)
+        display_tipping = pd.DataFrame({
+            'Constituency': tipping_point['constituency'],
+            'District': tipping_point['district'],
+            'Decides Majority': tipping_point['probability'].map(lambda x: f"{x * 100:.1f}%"),
+        })
+        st.dataframe(display_tipping, use_container_width=True, hide_index=True)
 
 else:
     year1 = st.session_state.vote_year1
@@ -153,36 +315,13 @@ else:
             st.session_state.vote_constituency = None
             st.rerun()
     
-    data_year1 = df[(df['year'] == year1) &
-                    (df['district'] == district) &
-                    (df['constituency'] == constituency)].copy()
+    data_year1 = index.select(year=year1, district=district, constituency=constituency)
     
-    data_year2 = df[(df['year'] == year2) &
-                    (df['district'] == district) &
-                    (df['constituency'] == constituency)].copy()
+    data_year2 = index.select(year=year2, district=district, constituency=constituency)
     
     if not data_year1.empty and not data_year2.empty:
-        winner1 = data_year1[data_year1['winner'] == 'Yes'].iloc[0].copy()
-        
-        candidates_year2 = data_year2['candidate'].tolist()
-        different_candidates = [c for c in candidates_year2 if c != winner1['candidate']]
-        
-        if different_candidates:
-            new_winner_name = different_candidates[0]
-            new_winner_idx = data_year2[data_year2['candidate'] == new_winner_name].index[0]
-            current_winner_idx = data_year2[data_year2['winner'] == 'Yes'].index[0]
-            
-            data_year2.loc[new_winner_idx, 'winner'] = 'Yes'
-            data_year2.loc[current_winner_idx, 'winner'] = 'No'
-            
-            current_winner_votes = data_year2.loc[current_winner_idx, 'votes']
-            new_winner_votes = data_year2.loc[new_winner_idx, 'votes']
-            
-            data_year2.loc[new_winner_idx, 'votes'] = current_winner_votes + 500
-            data_year2.loc[current_winner_idx, 'votes'] = new_winner_votes - 500
-        
-        winner1 = data_year1[data_year1['winner'] == 'Yes'].iloc[0]
-        winner2 = data_year2[data_year2['winner'] == 'Yes'].iloc[0]
+        winner1 = data_year1[data_year1['winner']].iloc[0]
+        winner2 = data_year2[data_year2['winner']].iloc[0]
         
         total1 = data_year1['votes'].sum()
         total2 = data_year2['votes'].sum()
@@ -263,22 +402,18 @@ else:
         st.markdown("---")
         st.markdown("##### Party-wise Vote Comparison")
         
-        party_comparison = pd.merge(
-            data_year1[['party', 'votes']].groupby('party').sum().reset_index(),
-            data_year2[['party', 'votes']].groupby('party').sum().reset_index(),
-            on='party',
-            how='outer',
-            suffixes=(f'_{year1}', f'_{year2}')
-        ).fillna(0)
+        party_comparison = swing.party_swing(year1, year2, district, constituency)
         
-        party_comparison[f'votes_{year1}'] = party_comparison[f'votes_{year1}'].astype(int)
-        party_comparison[f'votes_{year2}'] = party_comparison[f'votes_{year2}'].astype(int)
-        party_comparison['Difference'] = party_comparison[f'votes_{year2}'] - party_comparison[f'votes_{year1}']
-        party_comparison['Change %'] = (party_comparison['Difference'] / party_comparison[f'votes_{year1}'] * 100).round(1)
-        party_comparison['Change %'] = party_comparison['Change %'].fillna(0).apply(lambda x: f"{x:+.1f}%")
+        change_percent = party_comparison['vote_change'] / party_comparison[f'votes_{year1}'] * 100
         
-        display_party = party_comparison.copy()
-        display_party.columns = ['Party', f'Votes {year1}', f'Votes {year2}', 'Difference', 'Change %']
+        display_party = pd.DataFrame({
+            'Party': party_comparison['party'],
+            f'Votes {year1}': party_comparison[f'votes_{year1}'],
+            f'Votes {year2}': party_comparison[f'votes_{year2}'],
+            'Difference': party_comparison['vote_change'],
+            'Change %': change_percent.replace([np.inf, -np.inf], np.nan).fillna(0).map(lambda x: f"{x:+.1f}%"),
+            'Share Swing': party_comparison['swing'].map(lambda x: f"{x:+.2f} pts"),
+        })
         
         st.dataframe(display_party, use_container_width=True, hide_index=True)
         
@@ -322,6 +457,29 @@ else:
             fig2.update_traces(textposition='inside', textinfo='percent+label')
             fig2.update_layout(showlegend=False, margin=dict(t=40, b=20, l=20, r=20))
             st.plotly_chart(fig2, use_container_width=True)
+        
+        st.markdown("---")
+        st.markdown(f"##### Party Standing in {district} District")
+        
+        district_comparison = pd.merge(
+            cube.slice(year1, district)[['party', 'seats', 'vote_share']],
+            cube.slice(year2, district)[['party', 'seats', 'vote_share']],
+            on='party',
+            how='outer',
+            suffixes=(f'_{year1}', f'_{year2}')
+        ).fillna(0)
+        district_comparison = district_comparison.sort_values([f'seats_{year2}', f'vote_share_{year2}'], ascending=False)
+        
+        display_district = pd.DataFrame({
+            'Party': district_comparison['party'],
+            f'Seats {year1}': district_comparison[f'seats_{year1}'].astype(int),
+            f'Seats {year2}': district_comparison[f'seats_{year2}'].astype(int),
+            f'Vote Share {year1}': district_comparison[f'vote_share_{year1}'].map(lambda x: f"{x:.1f}%"),
+            f'Vote Share {year2}': district_comparison[f'vote_share_{year2}'].map(lambda x: f"{x:.1f}%"),
+            'Swing': (district_comparison[f'vote_share_{year2}'] - district_comparison[f'vote_share_{year1}']).map(lambda x: f"{x:+.1f} pts"),
+        })
+        
+        st.dataframe(display_district, use_container_width=True, hide_index=True)
     
     else:
         st.error(f"No data available for comparison between {year1} and {year2} in {constituency}")
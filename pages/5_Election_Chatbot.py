@@ -1,22 +1,26 @@
 import streamlit as st
 import re
-from utils import setup_page, load_data, create_booth_data
+from utils import setup_page, load_data, get_booth_store, get_election_index, get_summary_index, get_party_cube, get_leaderboards, get_candidate_index, get_swing_engine, get_seat_projection, data_version
 from chatbot import ElectionChatbot
 
 setup_page("Election Chatbot - Pollytics")
 
 df = load_data()
-booth_df = create_booth_data()
+booth_tables = get_booth_store()
 
 if df.empty:
     st.error("Could not load election data. Please check your data file.")
     st.stop()
 
-@st.cache_resource
-def get_chatbot(_df, _booth_df):
-    return ElectionChatbot(_df, _booth_df)
+# One chatbot per data version; the previous one and its answers are dropped with it.
+@st.cache_resource(max_entries=1)
+def get_chatbot(_df, _booth_tables, version):
+    return ElectionChatbot(_df, _booth_tables, index=get_election_index(), summary=get_summary_index(),
+                         cube=get_party_cube(), leaderboards=get_leaderboards(), careers=get_candidate_index(),
+                         swing=get_swing_engine(), data_version=version,
+                         projector=get_seat_projection)
 
-chatbot = get_chatbot(df, booth_df)
+chatbot = get_chatbot(df, booth_tables, data_version())
 
 if 'chat_history' not in st.session_state:
     st.session_state.chat_history = []
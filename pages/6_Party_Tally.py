@@ -0,0 +1,131 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from utils import setup_page, render_year_selector, get_party_cube, render_page_header, render_breadcrumb, render_footer
+
+setup_page("Party Tally - Pollytics")
+
+col1, col2 = st.columns([1, 5])
+with col1:
+    if st.button("← Home", key="tally_back_home", use_container_width=True):
+        st.session_state.tally_year = None
+        st.switch_page("app.py")
+
+render_page_header("Party Tally", "Statewide and district-wise party standings: seats, votes and vote share", "🏆")
+
+cube = get_party_cube()
+
+if 'tally_year' not in st.session_state:
+    st.session_state.tally_year = None
+
+if st.session_state.tally_year is None:
+    st.markdown("""
+    <p style="color: #6b7280; margin-bottom: 1.5rem;">Select an election year to see how every party fared.</p>
+    """, unsafe_allow_html=True)
+
+    render_year_selector(cube.years, 'tally_year', "tally_{year}")
+
+else:
+    year = st.session_state.tally_year
+
+    render_breadcrumb([f"{year} Election", "Party Tally"])
+
+    if st.button("← Change Year", key="tally_back_year"):
+        st.session_state.tally_year = None
+        st.rerun()
+
+    scope = st.selectbox(
+        "Region",
+        options=[""] + cube.districts,
+        key="tally_district_dropdown",
+        format_func=lambda x: "All of Kerala" if x == "" else x
+    )
+    district = scope or None
+    region = district or "Kerala"
+
+    tally = cube.slice(year, district)
+
+    if tally.empty:
+        st.error(f"No results available for {region} in {year}")
+    else:
+        leader = tally.iloc[0]
+
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            st.markdown(f'''
+            <div class="metric-card">
+                <div class="label">Seats</div>
+                <div class="value">{int(tally['seats'].sum()):,}</div>
+            </div>
+            ''', unsafe_allow_html=True)
+
+        with col2:
+            st.markdown(f'''
+            <div class="metric-card">
+                <div class="label">Votes Polled</div>
+                <div class="value">{int(tally['votes'].sum()):,}</div>
+            </div>
+            ''', unsafe_allow_html=True)
+
+        with col3:
+            st.markdown(f'''
+            <div class="metric-card">
+                <div class="label">Parties</div>
+                <div class="value">{len(tally)}</div>
+            </div>
+            ''', unsafe_allow_html=True)
+
+        with col4:
+            st.markdown(f'''
+            <div class="metric-card">
+                <div class="label">Largest Party</div>
+                <div class="value">{leader['party']}</div>
+            </div>
+            ''', unsafe_allow_html=True)
+
+        st.markdown("<div style='height: 1.5rem;'></div>", unsafe_allow_html=True)
+        st.markdown(f"##### Party Standings in {region}")
+
+        display_tally = pd.DataFrame({
+            'Party': tally['party'],
+            'Seats Won': tally['seats'],
+            'Seats Contested': tally['contested'],
+            'Votes': tally['votes'].map(lambda x: f"{x:,}"),
+            'Vote Share': tally['vote_share'].map(lambda x: f"{x:.1f}%"),
+        })
+
+        st.dataframe(display_tally, use_container_width=True, hide_index=True)
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("##### Seats Won")
+            fig_seats = px.bar(
+                tally[tally['seats'] > 0],
+                x='party',
+                y='seats',
+                color_discrete_sequence=['#234d3c']
+            )
+            fig_seats.update_layout(
+                xaxis_title="Party",
+                yaxis_title="Seats",
+                template='plotly_white',
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)'
+            )
+            st.plotly_chart(fig_seats, use_container_width=True)
+
+        with col2:
+            st.markdown("##### Vote Share")
+            fig_share = px.pie(
+                tally,
+                values='votes',
+                names='party',
+                color_discrete_sequence=['#234d3c', '#2d6a4f', '#40916c', '#52b788', '#74c69d', '#d4a03c']
+            )
+            fig_share.update_traces(textposition='inside', textinfo='percent+label')
+            fig_share.update_layout(showlegend=False, margin=dict(t=20, b=20, l=20, r=20))
+            st.plotly_chart(fig_share, use_container_width=True)
+
+render_footer()
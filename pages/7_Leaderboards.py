@@ -0,0 +1,106 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from utils import setup_page, get_leaderboards, render_page_header, render_footer
+from leaderboard import LEADERBOARDS
+from booths import BoothTables
+
+setup_page("Leaderboards - Pollytics")
+
+col1, col2 = st.columns([1, 5])
+with col1:
+    if st.button("← Home", key="board_back_home", use_container_width=True):
+        st.switch_page("app.py")
+
+render_page_header("Leaderboards", "Narrowest margins, biggest landslides and turnout extremes across Kerala", "🥇")
+
+leaderboards = get_leaderboards()
+
+st.markdown("""
+<div class="filter-section">
+    <div class="filter-section-title">Choose a Leaderboard</div>
+""", unsafe_allow_html=True)
+
+col1, col2, col3, col4 = st.columns(4)
+
+with col1:
+    board_name = st.selectbox(
+        "Leaderboard",
+        options=[name for name in LEADERBOARDS if name in leaderboards],
+        key="board_name",
+        format_func=lambda name: LEADERBOARDS[name][2]
+    )
+
+board = leaderboards[board_name]
+source, column, label, unit = LEADERBOARDS[board_name]
+
+with col2:
+    years = sorted(int(y) for y in pd.unique(board.frame['year']))
+    year = st.selectbox(
+        "Year",
+        options=[None] + years,
+        key="board_year",
+        format_func=lambda y: "All years" if y is None else str(y)
+    )
+
+with col3:
+    districts = sorted(str(d) for d in pd.unique(board.frame['district'].astype(str)))
+    district = st.selectbox(
+        "District",
+        options=[""] + districts,
+        key="board_district",
+        format_func=lambda x: "All of Kerala" if x == "" else x
+    )
+
+with col4:
+    direction = st.radio("Show", ["Highest", "Lowest"], key="board_direction", horizontal=True)
+
+st.markdown("</div>", unsafe_allow_html=True)
+
+k = st.slider("Entries", min_value=5, max_value=50, value=10, step=5, key="board_k")
+
+top = board.top(k, year=year, district=district or None, largest=direction == "Highest")
+
+if top.empty:
+    st.info("No entries for this selection")
+else:
+    value_text = top[column].map(lambda x: f"{x:,.1f}%" if unit == "%" else f"{int(x):,} votes")
+    if source == 'contests':
+        top['entry'] = top['constituency'].astype(str) + " (" + top['year'].astype(str) + ")"
+        display = pd.DataFrame({
+            'Rank': top['rank'],
+            'Constituency': top['constituency'],
+            'District': top['district'],
+            'Year': top['year'],
+            'Winner': top['winner_candidate'].astype(str) + " (" + top['winner_party'].astype(str) + ")",
+            'Runner-up': top['runner_up_candidate'],
+            label: value_text,
+        })
+    else:
+        top = BoothTables.with_names(top)
+        top['entry'] = top['booth_id'].astype(str) + " (" + top['year'].astype(str) + ")"
+        display = pd.DataFrame({
+            'Rank': top['rank'],
+            'Booth ID': top['booth_id'],
+            'Booth': top['booth_name'],
+            'Constituency': top['constituency'],
+            'Year': top['year'],
+            'Winner': top['winner_candidate'].astype(str) + " (" + top['winner_party'].astype(str) + ")",
+            label: value_text,
+        })
+
+    st.markdown(f"##### {direction} {label}")
+    st.dataframe(display, use_container_width=True, hide_index=True)
+
+    fig = px.bar(top, x='entry', y=column, color_discrete_sequence=['#234d3c'])
+    fig.update_layout(
+        xaxis_title="",
+        yaxis_title=label,
+        xaxis={'categoryorder': 'array', 'categoryarray': top['entry'].tolist()},
+        showlegend=False,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+render_footer()
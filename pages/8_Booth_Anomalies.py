@@ -0,0 +1,119 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from utils import setup_page, get_booth_anomalies, render_page_header, render_footer
+from anomalies import ANOMALY_CHECKS, Z_THRESHOLD
+
+setup_page("Booth Anomalies - Pollytics")
+
+col1, col2 = st.columns([1, 5])
+with col1:
+    if st.button("← Home", key="anomaly_back_home", use_container_width=True):
+        st.switch_page("app.py")
+
+render_page_header("Booth Anomalies", "Booths whose turnout, vote share or postal and tendered votes stand out from their area", "🚩")
+
+report = get_booth_anomalies()
+check_labels = {check: label for check, (_, _, label) in ANOMALY_CHECKS.items()}
+
+st.markdown("""
+<div class="filter-section">
+    <div class="filter-section-title">Filter Booths</div>
+""", unsafe_allow_html=True)
+
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    year = st.selectbox(
+        "Year",
+        options=[None] + report.years,
+        key="anomaly_year",
+        format_func=lambda y: "All years" if y is None else str(y)
+    )
+
+with col2:
+    district = st.selectbox(
+        "District",
+        options=[""] + report.districts,
+        key="anomaly_district",
+        format_func=lambda x: "All of Kerala" if x == "" else x
+    )
+
+with col3:
+    k = st.slider("Booths", min_value=10, max_value=100, value=25, step=5, key="anomaly_k")
+
+st.markdown("</div>", unsafe_allow_html=True)
+
+scope = report.summary(year, district or None)
+
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    st.markdown(f'''
+    <div class="metric-card">
+        <div class="label">Booths Checked</div>
+        <div class="value">{scope['booths']:,}</div>
+    </div>
+    ''', unsafe_allow_html=True)
+
+with col2:
+    st.markdown(f'''
+    <div class="metric-card">
+        <div class="label">Flagged Booths</div>
+        <div class="value">{scope['flagged']:,}</div>
+    </div>
+    ''', unsafe_allow_html=True)
+
+with col3:
+    st.markdown(f'''
+    <div class="metric-card">
+        <div class="label">Flag Threshold</div>
+        <div class="value">|z| > {Z_THRESHOLD}</div>
+    </div>
+    ''', unsafe_allow_html=True)
+
+st.markdown("<div style='height: 1.5rem;'></div>", unsafe_allow_html=True)
+st.caption("Scores are robust z-scores: distance from the median of the booth's constituency or district in the same year, in units of the median absolute deviation.")
+
+top = report.top(k, year=year, district=district or None)
+
+if top.empty:
+    st.info("No booths are flagged for this selection")
+else:
+    st.markdown("##### Most Anomalous Booths")
+    display = pd.DataFrame({
+        'Rank': top['rank'],
+        'Booth ID': top['booth_id'],
+        'Constituency': top['constituency'],
+        'District': top['district'],
+        'Year': top['year'],
+        'Turnout %': top['turnout'],
+        "Winner's Share %": top['winner_share'],
+        'Postal %': top['postal_ratio'],
+        'Tendered %': top['tendered_ratio'],
+        'Score': top['score'],
+        'Flags': top['flags'].astype(str).map(
+            lambda flags: ", ".join(check_labels[check] for check in flags.split(", ") if check)
+        ),
+    })
+    st.dataframe(display, use_container_width=True, hide_index=True)
+
+counts = report.flag_counts(year)
+if district:
+    counts = counts.loc[[district]] if district in counts.index else counts.iloc[0:0]
+counts = counts.rename(columns=check_labels)
+
+if counts.to_numpy().sum() > 0:
+    st.markdown("##### Flags by District")
+    chart = counts.reset_index().melt(id_vars='district', var_name='Check', value_name='Booths')
+    chart = chart[chart['Booths'] > 0]
+    fig = px.bar(chart, x='district', y='Booths', color='Check', barmode='stack')
+    fig.update_layout(
+        xaxis_title="",
+        yaxis_title="Flagged booths",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+render_footer()
@@ -0,0 +1,108 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from utils import setup_page, get_live_count, render_page_header, render_footer, LIVE_PATH
+
+setup_page("Counting Day - Pollytics")
+
+col1, col2 = st.columns([1, 5])
+with col1:
+    if st.button("← Home", key="live_back_home", use_container_width=True):
+        st.switch_page("app.py")
+
+render_page_header("Counting Day", "Live leads and margins, updated as each round of counting lands", "⏱️")
+
+live = get_live_count()
+
+
+@st.fragment(run_every="1s")
+def live_board():
+    live.refresh()
+    state = live.state
+
+    if not state.round:
+        st.info(f"Waiting for counting rounds. Append rows (round, district, constituency, candidate, party, votes) "
+                f"to {LIVE_PATH} or drop round CSV files into it.")
+        return
+
+    follow = st.toggle("Follow the latest round", value=True, key="live_follow")
+    if follow:
+        round_no = state.round
+    else:
+        round_no = st.slider("As of round", min_value=1, max_value=state.round, value=state.round,
+                             key="live_round")
+
+    status = state.as_of(round_no)
+    leads = state.leads(round_no)
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown(f'''
+        <div class="metric-card">
+            <div class="label">As of Round</div>
+            <div class="value">{round_no} / {state.round}</div>
+        </div>
+        ''', unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(f'''
+        <div class="metric-card">
+            <div class="label">Constituencies Reporting</div>
+            <div class="value">{len(status)}</div>
+        </div>
+        ''', unsafe_allow_html=True)
+
+    with col3:
+        leader = leads.iloc[0] if not leads.empty else None
+        st.markdown(f'''
+        <div class="metric-card">
+            <div class="label">Leading Party</div>
+            <div class="value">{leader['party'] if leader is not None else "-"} ({leader['leading'] if leader is not None else 0})</div>
+        </div>
+        ''', unsafe_allow_html=True)
+
+    st.markdown("<div style='height: 1.5rem;'></div>", unsafe_allow_html=True)
+
+    col1, col2 = st.columns([3, 2])
+
+    with col1:
+        st.markdown("##### Constituency Leads")
+        display = pd.DataFrame({
+            'Constituency': status['constituency'],
+            'District': status['district'],
+            'Leading': status['leader'].astype(str) + " (" + status['leader_party'].astype(str) + ")",
+            'Trailing': status['runner_up'].fillna("-").astype(str),
+            'Margin': status['margin'],
+            'Votes Counted': status['total_votes'],
+            'Updated in Round': status['round'],
+            'Lead Changed': status['leader_changed'].map({True: 'Yes', False: 'No'}),
+        })
+        st.dataframe(display, use_container_width=True, hide_index=True)
+
+    with col2:
+        st.markdown("##### Leads by Party")
+        fig = px.bar(leads, x='party', y='leading', color='party', text='leading')
+        fig.update_layout(
+            xaxis_title="",
+            yaxis_title="Constituencies leading",
+            showlegend=False,
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)'
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    contests = list(zip(status['district'], status['constituency']))
+    contest = st.selectbox(
+        "Current count in",
+        options=[None] + contests,
+        key="live_contest",
+        format_func=lambda x: "Choose a constituency..." if x is None else f"{x[1]} ({x[0]})"
+    )
+    if contest:
+        st.dataframe(state.contest(*contest), use_container_width=True, hide_index=True)
+
+
+live_board()
+
+render_footer()
@@ -0,0 +1,79 @@
+import re
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from gazetteer import Gazetteer, Span, tokenize
+
+YEAR_PATTERN = re.compile(r'\b((?:19|20)\d\d)\b')
+BOOTH_PATTERN = re.compile(r'booth\s*(?:id\s*)?(\d+)')
+COUNT_PATTERN = re.compile(r'\btop\s+(\d+)\b')
+NUMBER_PATTERN = re.compile(r'[+-]?\d+(?:\.\d+)?')
+# Words long enough to be worth a fuzzy lookup, and capitalized words that may be names.
+LOCATION_WORD_PATTERN = re.compile(r'\b[a-zA-Z]{4,}\b')
+NAME_WORD_PATTERN = re.compile(r'\b[A-Z][a-z]+\b')
+# A swing in points written after a party ("BJP gains 3 points") or before it ("2% swing to INC").
+SWING_AFTER_PATTERN = re.compile(r'((?:\s+\w+){0,3}?)\s+(?:by\s+)?([+-]?\d+(?:\.\d+)?)\s*(?:%|percent|points?|pts?)')
+SWING_BEFORE_PATTERN = re.compile(r'([+-]?\d+(?:\.\d+)?)\s*(?:%|percent|points?|pts?)\s+(?:swing\s+)?'
+                                  r'(to|towards|for|from|against)\s+$')
+LOSS_PATTERN = re.compile(r'lose|loses|losing|drop|drops|fall|falls|down|minus')
+
+# Query words that are never fuzzy-matched against place names.
+LOCATION_STOP_WORDS = frozenset([
+    'what', 'which', 'where', 'when', 'winner', 'votes', 'party', 'margin', 'results', 'show', 'tell', 'about',
+    'many', 'district', 'constituency', 'election', 'booth', 'compare', 'between',
+])
+
+
+@dataclass(frozen=True)
+class QueryFrame:
+    """A chat query parsed once: normalized text, tokens, numbers and entity mentions.
+
+    Built by ``parse_query`` and read by every extractor and intent check,
+    so the query is tokenized and scanned once however many of them run.
+    """
+    text: str
+    lower: str
+    tokens: Tuple[str, ...]
+    years: Tuple[int, ...]
+    booth_ids: Tuple[int, ...]
+    numbers: Tuple[float, ...]
+    count: Optional[int]
+    spans: Tuple[Span, ...]
+    location_words: Tuple[str, ...]
+    name_words: Tuple[str, ...]
+
+    def entity(self, kind: str) -> Optional[str]:
+        """The first mentioned entity of a kind (district, constituency, candidate, party), or None."""
+        return Gazetteer.first(self.spans, kind)
+
+    def entities(self, kind: str) -> Tuple[Span, ...]:
+        """Every mention of an entity kind, in query order."""
+        return tuple(span for span in self.spans if kind in span.entities)
+
+    def mentions(self, pattern: 're.Pattern') -> bool:
+        """Whether the normalized text matches a compiled phrase pattern."""
+        return pattern.search(self.lower) is not None
+
+
+def phrases(*words: str) -> 're.Pattern':
+    """One compiled pattern matching any of the phrases anywhere in the text."""
+    return re.compile('|'.join(re.escape(word) for word in words))
+
+
+def parse_query(text: str, gazetteer: Gazetteer) -> QueryFrame:
+    """Tokenize a query and pull out its years, booth IDs, numbers, list length and entity spans."""
+    lower = text.lower().strip()
+    count = COUNT_PATTERN.search(lower)
+    return QueryFrame(
+        text=text,
+        lower=lower,
+        tokens=tuple(token for token, _, _ in tokenize(lower)),
+        years=tuple(int(year) for year in YEAR_PATTERN.findall(text)),
+        booth_ids=tuple(int(booth) for booth in BOOTH_PATTERN.findall(lower)),
+        numbers=tuple(float(number) for number in NUMBER_PATTERN.findall(lower)),
+        count=max(1, min(int(count.group(1)), 50)) if count else None,
+        spans=tuple(gazetteer.find(lower)),
+        location_words=tuple(word for word in LOCATION_WORD_PATTERN.findall(text)
+                             if word.lower() not in LOCATION_STOP_WORDS),
+        name_words=tuple(NAME_WORD_PATTERN.findall(text)),
+    )
@@ -0,0 +1,74 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+DEFAULT_MAX_SIZE = 1024
+# Marks a missing entry, since a cached answer may itself be None.
+MISSING = object()
+
+
+class ResponseCache:
+    """Bounded least-recently-used cache of answers, tied to one dataset version.
+
+    Entries are kept in use order and the oldest is dropped once
+    ``max_size`` is reached. Every lookup names the dataset version it
+    expects; when that differs from the version the entries were stored
+    under, the whole cache is cleared first, so an answer is never served
+    from data that has since been replaced. ``hits`` and ``misses`` count
+    lookups since the cache was created.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, version: Optional[str] = None):
+        self.max_size = max_size
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _check_version(self, version: Optional[str]):
+        if version != self.version:
+            self._entries.clear()
+            self.version = version
+
+    def get(self, key: Hashable, version: Optional[str] = None) -> Any:
+        """The answer stored under ``key`` for this dataset version, or ``MISSING``."""
+        with self._lock:
+            self._check_version(version)
+            value = self._entries.get(key, MISSING)
+            if value is MISSING:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any, version: Optional[str] = None):
+        """Store an answer, dropping the least recently used one if the cache is full."""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._check_version(version)
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every entry; the counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hits, misses, hit rate, current size and capacity."""
+        lookups = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hits / lookups if lookups else 0.0,
+                'size': len(self._entries), 'max_size': self.max_size, 'version': self.version}
+
+
+def cache_key(intent: str, slots: Dict[str, Any], names: Tuple[str, ...]) -> Tuple:
+    """Canonical key for an answer: the intent and the values of the slots it can depend on."""
+    return (intent,) + tuple(slots.get(name) for name in names)
@@ -0,0 +1,189 @@
+import threading
+import numpy as np
+import pandas as pd
+from typing import Optional, List, Dict, Tuple, Any
+
+from booths import BoothTables
+
+ROLLUP_MEASURES = ['booths', 'total_voters', 'votes_polled', 'postal_votes', 'tendered_votes']
+# Booth -> constituency -> district -> state (one state node per year).
+ROLLUP_DEPTH = 3
+
+
+def _grow(array: np.ndarray, rows: int, columns: Optional[int] = None) -> np.ndarray:
+    """``array`` zero-padded to at least ``rows`` rows and ``columns`` columns.
+
+    Rows grow by at least doubling, and only when more are needed; a wider
+    array keeps its number of rows.
+    """
+    columns = array.shape[1] if columns is None else max(columns, array.shape[1])
+    if rows <= array.shape[0] and columns == array.shape[1]:
+        return array
+    rows = array.shape[0] if rows <= array.shape[0] else max(rows, 2 * array.shape[0])
+    grown = np.zeros((rows, columns), dtype=array.dtype)
+    grown[:array.shape[0], :array.shape[1]] = array
+    return grown
+
+
+class BoothRollup:
+    """Booth metrics and per-party votes summed at constituency, district and state level.
+
+    Every booth's own contribution is kept, so ``update`` with a batch of
+    new or corrected booths only subtracts the old and adds the new values
+    along each booth's path to the root (its constituency, district and
+    year), instead of re-aggregating every booth. Reads are a lookup of one
+    node, whatever the number of booths below it. Reads and updates share a
+    lock, since an update can grow (replace) the node arrays.
+    """
+
+    def __init__(self):
+        self.parties: List[str] = []
+        self.version = 0
+        self._party: Dict[str, int] = {}
+        self._nodes: Dict[Tuple, int] = {}
+        self._names: List[str] = []
+        self._children: Dict[int, List[int]] = {}
+        self._booths: Dict[Tuple[int, int], int] = {}
+        self._node_measures = np.zeros((0, len(ROLLUP_MEASURES)), dtype=np.int64)
+        self._node_party = np.zeros((0, 0), dtype=np.int64)
+        self._booth_measures = np.zeros((0, len(ROLLUP_MEASURES)), dtype=np.int64)
+        self._booth_party = np.zeros((0, 0), dtype=np.int64)
+        self._booth_path = np.zeros((0, ROLLUP_DEPTH), dtype=np.int64)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_tables(cls, tables: BoothTables) -> 'BoothRollup':
+        """Rollup of every booth in the tables."""
+        rollup = cls()
+        rollup.update(tables)
+        return rollup
+
+    def _node(self, key: Tuple) -> int:
+        position = self._nodes.get(key)
+        if position is None:
+            year, district, constituency = key
+            parent = None
+            if constituency is not None:
+                parent = self._node((year, district, None))
+            elif district is not None:
+                parent = self._node((year, None, None))
+            position = self._nodes[key] = len(self._names)
+            self._names.append(str(constituency or district or year))
+            if parent is not None:
+                self._children.setdefault(parent, []).append(position)
+        return position
+
+    def _path(self, year: int, district: str, constituency: str) -> List[int]:
+        return [self._node((year, district, constituency)), self._node((year, district, None)),
+                self._node((year, None, None))]
+
+    def update(self, tables: BoothTables):
+        """Add new booths, or replace corrected ones (same year and booth_id), and their ancestors.
+
+        ``tables`` holds the batch's booth rows and their candidate rows; a
+        booth appearing twice in the batch keeps its last row. Raises
+        ValueError, before anything is applied, when a candidate row's
+        booth is not in the batch.
+        """
+        booths, results = tables.booths, tables.results
+        if booths.empty:
+            return
+        if 'booth_key' in booths.columns:
+            booth_of_result = pd.Index(booths['booth_key']).get_indexer(results['booth_key'])
+        else:
+            booth_of_result = results['booth_key'].to_numpy()
+        unknown = (booth_of_result < 0) | (booth_of_result >= len(booths))
+        if unknown.any():
+            raise ValueError(f"{int(unknown.sum())} candidate rows have a booth_key that is not in the batch")
+
+        with self._lock:
+            parties = results['party'].astype(str)
+            for party in pd.unique(parties):
+                if party not in self._party:
+                    self._party[party] = len(self.parties)
+                    self.parties.append(party)
+            party_of_result = parties.map(self._party).to_numpy(dtype=np.int64)
+
+            # One path per (year, district, constituency) in the batch, not per booth.
+            leaves = booths.groupby(['year', 'district', 'constituency'], observed=True, sort=False).ngroup().to_numpy()
+            first = np.unique(leaves, return_index=True)[1]
+            leaf_paths = np.array([self._path(int(booths['year'].iloc[i]), str(booths['district'].iloc[i]),
+                                              str(booths['constituency'].iloc[i])) for i in first], dtype=np.int64)
+            paths = leaf_paths[leaves]
+
+            rows = np.empty(len(booths), dtype=np.int64)
+            added = []
+            for i, key in enumerate(zip(booths['year'].to_numpy().tolist(), booths['booth_id'].to_numpy().tolist())):
+                row = self._booths.get(key)
+                if row is None:
+                    row = self._booths[key] = len(self._booths)
+                    added.append(i)
+                rows[i] = row
+            last = len(rows) - 1 - np.unique(rows[::-1], return_index=True)[1]
+
+            n_booths, n_nodes, n_parties = len(self._booths), len(self._names), len(self.parties)
+            self._booth_measures = _grow(self._booth_measures, n_booths)
+            self._booth_party = _grow(self._booth_party, n_booths, n_parties)
+            self._booth_path = _grow(self._booth_path, n_booths)
+            self._node_measures = _grow(self._node_measures, n_nodes)
+            self._node_party = _grow(self._node_party, n_nodes, n_parties)
+            added = np.array(added, dtype=np.int64)
+            self._booth_path[rows[added]] = paths[added]
+
+            measures = np.column_stack([np.ones(len(booths), dtype=np.int64)] +
+                                       [booths[col].to_numpy().astype(np.int64) for col in ROLLUP_MEASURES[1:]])
+            party_votes = np.zeros((len(booths), self._booth_party.shape[1]), dtype=np.int64)
+            np.add.at(party_votes, (booth_of_result, party_of_result), results['votes'].to_numpy().astype(np.int64))
+
+            rows, paths, measures, party_votes = rows[last], paths[last], measures[last], party_votes[last]
+            old_paths = self._booth_path[rows].ravel()
+            np.subtract.at(self._node_measures, old_paths, np.repeat(self._booth_measures[rows], ROLLUP_DEPTH, axis=0))
+            np.subtract.at(self._node_party, old_paths, np.repeat(self._booth_party[rows], ROLLUP_DEPTH, axis=0))
+            np.add.at(self._node_measures, paths.ravel(), np.repeat(measures, ROLLUP_DEPTH, axis=0))
+            np.add.at(self._node_party, paths.ravel(), np.repeat(party_votes, ROLLUP_DEPTH, axis=0))
+            self._booth_measures[rows] = measures
+            self._booth_party[rows] = party_votes
+            self._booth_path[rows] = paths
+            self.version += 1
+
+    def _record(self, position: int) -> Dict[str, Any]:
+        record = dict(zip(ROLLUP_MEASURES, self._node_measures[position].tolist()))
+        electors = record['total_voters']
+        record['turnout'] = round(record['votes_polled'] / electors * 100, 1) if electors else 0.0
+        return record
+
+    def node(self, year: int, district: Optional[str] = None, constituency: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Totals of a constituency, a district or (with neither) the whole state, or None.
+
+        Holds the booth count, electors (``total_voters``), votes polled,
+        postal and tendered votes, turnout in percent and ``party_votes``,
+        a party -> votes dict with the largest first.
+        """
+        with self._lock:
+            position = self._nodes.get((int(year), district or None, constituency or None))
+            if position is None:
+                return None
+            record = self._record(position)
+            votes = self._node_party[position, :len(self.parties)].copy()
+            parties = list(self.parties)
+        order = np.argsort(-votes, kind='stable')
+        record['party_votes'] = {parties[i]: int(votes[i]) for i in order if votes[i] > 0}
+        return record
+
+    def children(self, year: int, district: Optional[str] = None) -> pd.DataFrame:
+        """One row of totals per district of the state, or per constituency of ``district``.
+
+        Per-party votes follow the measures, one column per party.
+        """
+        level = 'constituency' if district else 'district'
+        with self._lock:
+            parent = self._nodes.get((int(year), district or None, None))
+            positions = list(self._children.get(parent, [])) if parent is not None else []
+            records = [self._record(p) for p in positions]
+            names = [self._names[p] for p in positions]
+            parties = list(self.parties)
+            party_votes = self._node_party[positions][:, :len(parties)] if positions else \
+                np.zeros((0, len(parties)), dtype=np.int64)
+        frame = pd.DataFrame(records, columns=ROLLUP_MEASURES + ['turnout'])
+        frame.insert(0, level, names)
+        return pd.concat([frame, pd.DataFrame(party_votes, columns=parties)], axis=1)
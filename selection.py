@@ -0,0 +1,218 @@
+import threading
+import numpy as np
+import pandas as pd
+from typing import Optional, List, Dict, Tuple, Any
+
+KEYS = ('year', 'district', 'constituency')
+MEMBER_COLUMNS = ('candidate', 'party')
+
+
+class ElectionIndex:
+    """Precomputed row ranges for year/district/constituency/candidate lookups.
+
+    The frame is grouped once by (year, district, constituency), keeping the
+    source order of first appearance, so every key prefix maps to one
+    contiguous row range. Lookups are dict hits plus a binary search for
+    candidates and parties, so they do not scale with the row count.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        if df.empty or not all(key in df.columns for key in KEYS):
+            self.frame = df
+            self._ranges = {}
+            self._members = {}
+            self._constituency_district = {}
+            self.years = []
+            return
+
+        group_order = [df.groupby(list(KEYS[:depth]), observed=True, sort=False).ngroup().to_numpy()
+                       for depth in range(1, len(KEYS) + 1)]
+        order = np.lexsort(group_order[::-1])
+        # Frames already stored in group order (e.g. memory-mapped shared data) are used as-is.
+        self.frame = df if np.array_equal(order, np.arange(len(df))) else df.iloc[order]
+        self._ranges: Dict[Tuple, Tuple[int, int]] = {}
+        for depth in range(1, len(KEYS) + 1):
+            groups = self.frame.groupby(list(KEYS[:depth]), observed=True, sort=False).indices
+            for key, positions in groups.items():
+                key = key if isinstance(key, tuple) else (key,)
+                self._ranges[self._normalize(key)] = (int(positions[0]), int(positions[-1]) + 1)
+
+        # Sorted row positions of every candidate and party.
+        self._members: Dict[str, Dict[str, np.ndarray]] = {}
+        for column in MEMBER_COLUMNS:
+            if column in self.frame.columns:
+                groups = self.frame.groupby(column, observed=True, sort=False).indices
+                self._members[column] = {str(name): positions for name, positions in groups.items()}
+
+        self._constituency_district: Dict[str, str] = {}
+        for key in self._ranges:
+            if len(key) == 3:
+                self._constituency_district[key[2]] = key[1]
+
+        self.years: List[int] = sorted(key[0] for key in self._ranges if len(key) == 1)
+
+    @staticmethod
+    def _normalize(key: Tuple) -> Tuple:
+        return (int(key[0]),) + tuple(str(part) for part in key[1:])
+
+    def _year_ranges(self, year: Optional[int], district: Optional[str],
+                     constituency: Optional[str]) -> List[Tuple[int, int]]:
+        years = [int(year)] if year is not None else self.years
+        suffix = tuple(part for part in (district, constituency) if part is not None)
+        ranges = []
+        for y in years:
+            span = self._ranges.get((y,) + suffix)
+            if span:
+                ranges.append(span)
+        return sorted(ranges)
+
+    def select(self, year: Optional[int] = None, district: Optional[str] = None,
+               constituency: Optional[str] = None, candidate: Optional[str] = None,
+               party: Optional[str] = None) -> pd.DataFrame:
+        """Return the rows matching every given filter."""
+        if constituency is not None:
+            owner = self._constituency_district.get(constituency)
+            if owner is None or (district is not None and district != owner):
+                return self.frame.iloc[0:0]
+            district = owner
+
+        rows = None
+        for column, value in (('candidate', candidate), ('party', party)):
+            if value is None:
+                continue
+            found = self._members.get(column, {}).get(value)
+            if found is None:
+                return self.frame.iloc[0:0]
+            rows = found if rows is None else np.intersect1d(rows, found, assume_unique=True)
+
+        if year is None and district is None and rows is None:
+            return self.frame
+
+        ranges = self._year_ranges(year, district, constituency)
+        if rows is None:
+            if len(ranges) == 1:
+                start, stop = ranges[0]
+                return self.frame.iloc[start:stop]
+            positions = [np.arange(start, stop) for start, stop in ranges]
+        else:
+            if year is None and district is None:
+                return self.frame.iloc[rows]
+            positions = [rows[np.searchsorted(rows, start):np.searchsorted(rows, stop)]
+                         for start, stop in ranges]
+
+        if not positions:
+            return self.frame.iloc[0:0]
+        return self.frame.iloc[np.concatenate(positions)]
+
+    def span(self, year: int, district: Optional[str] = None,
+             constituency: Optional[str] = None) -> Optional[Tuple[int, int]]:
+        """Row range ``[start, stop)`` of one year (and district, and constituency) in ``frame``, or None."""
+        key = (int(year),) + tuple(str(part) for part in (district, constituency) if part is not None)
+        return self._ranges.get(key)
+
+    def districts(self, year: Optional[int] = None) -> List[str]:
+        """Districts with results in the given year (or any year)."""
+        found = {key[1] for key in self._ranges
+                 if len(key) == 2 and (year is None or key[0] == int(year))}
+        return sorted(found)
+
+    def constituencies(self, year: Optional[int] = None, district: Optional[str] = None) -> List[str]:
+        """Constituencies with results in the given year and district."""
+        found = {key[2] for key in self._ranges
+                 if len(key) == 3
+                 and (year is None or key[0] == int(year))
+                 and (district is None or key[1] == district)}
+        return sorted(found)
+
+    def district_of(self, constituency: str) -> Optional[str]:
+        """District a constituency belongs to."""
+        return self._constituency_district.get(constituency)
+
+
+def year_partitions(df: pd.DataFrame, bounds: Tuple[str, ...] = ()) -> List[Dict[str, Any]]:
+    """Catalog of the year row groups of a frame stored year by year, in stored order.
+
+    Each entry holds the year, its ``[start, stop)`` rows and the ``[min, max]``
+    of every column in ``bounds``, so lookups can skip years without reading them.
+    """
+    if df.empty or 'year' not in df.columns:
+        return []
+    years = df['year'].to_numpy()
+    starts = np.flatnonzero(np.r_[True, years[1:] != years[:-1]])
+    stops = np.r_[starts[1:], len(years)]
+    if len(np.unique(years[starts])) != len(starts):
+        raise ValueError("Rows are not grouped by year")
+    catalog = []
+    for start, stop in zip(starts, stops):
+        entry = {'year': int(years[start]), 'rows': [int(start), int(stop)]}
+        for column in bounds:
+            values = df[column].to_numpy()[start:stop]
+            entry[column] = [int(values.min()), int(values.max())]
+        catalog.append(entry)
+    return catalog
+
+
+class PartitionedIndex:
+    """ElectionIndex lookups over the year row groups of a frame, indexing each year on first use.
+
+    The catalog (``frame.attrs['partitions']`` when the frame comes from the
+    column store) lists the years without touching any rows, and a lookup for
+    one year only indexes and reads that year's rows. Lookups across years
+    visit every partition.
+    """
+
+    def __init__(self, frame: pd.DataFrame, partitions: List[Dict[str, Any]] = None):
+        self.frame = frame
+        if partitions is None:
+            partitions = frame.attrs.get('partitions') or year_partitions(frame)
+        self._rows: Dict[int, Tuple[int, int]] = {entry['year']: tuple(entry['rows']) for entry in partitions}
+        self._order = [entry['year'] for entry in partitions]
+        self._indexes: Dict[int, ElectionIndex] = {}
+        self._lock = threading.Lock()
+        self.years: List[int] = sorted(self._rows)
+
+    def partition(self, year: int) -> Optional[ElectionIndex]:
+        """Index over one year's rows, or None for a year not in the catalog."""
+        year = int(year)
+        if year not in self._rows:
+            return None
+        index = self._indexes.get(year)
+        if index is None:
+            with self._lock:
+                index = self._indexes.get(year)
+                if index is None:
+                    start, stop = self._rows[year]
+                    index = self._indexes[year] = ElectionIndex(self.frame.iloc[start:stop])
+        return index
+
+    def select(self, year: Optional[int] = None, district: Optional[str] = None,
+               constituency: Optional[str] = None, candidate: Optional[str] = None,
+               party: Optional[str] = None) -> pd.DataFrame:
+        """Return the rows matching every given filter."""
+        filters = dict(district=district, constituency=constituency, candidate=candidate, party=party)
+        if year is not None:
+            index = self.partition(year)
+            return index.select(year, **filters) if index is not None else self.frame.iloc[0:0]
+        if all(value is None for value in filters.values()):
+            return self.frame
+        parts = [self.partition(y).select(y, **filters) for y in self._order]
+        parts = [part for part in parts if not part.empty]
+        return pd.concat(parts) if parts else self.frame.iloc[0:0]
+
+    def districts(self, year: Optional[int] = None) -> List[str]:
+        """Districts with results in the given year (or any year)."""
+        years = [year] if year is not None else self._order
+        return sorted({d for y in years if self.partition(y) for d in self.partition(y).districts(y)})
+
+    def constituencies(self, year: Optional[int] = None, district: Optional[str] = None) -> List[str]:
+        """Constituencies with results in the given year and district."""
+        years = [year] if year is not None else self._order
+        return sorted({c for y in years if self.partition(y)
+                       for c in self.partition(y).constituencies(y, district)})
+
+    def district_of(self, constituency: str) -> Optional[str]:
+        """District a constituency belongs to (in the latest stored year that has it)."""
+        owner = None
+        for y in self._order:
+            owner = self.partition(y).district_of(constituency) or owner
+        return owner
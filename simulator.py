@@ -0,0 +1,169 @@
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from typing import Optional, List, Dict, Tuple, Any
+
+from swing import SwingEngine
+
+DEFAULT_DRAWS = 10000
+DEFAULT_CHUNK = 2000
+
+
+def _simulate(shares: np.ndarray, contested: np.ndarray, district_codes: np.ndarray, n_districts: int,
+              shift: np.ndarray, noise: Tuple[float, float, float], draws: int, seed, chunk: int) -> Dict[str, np.ndarray]:
+    """Run ``draws`` swing draws in chunks and return the summed seat, win and tipping-point counts."""
+    rng = np.random.default_rng(seed)
+    n_seats, n_parties = shares.shape
+    majority = n_seats // 2 + 1
+    state_noise, district_noise, seat_noise = noise
+    base = np.where(contested, shares + shift, -np.inf).astype(np.float32)
+    totals = {
+        'wins': np.zeros((n_seats, n_parties), dtype=np.int64),
+        'seat_counts': np.zeros((n_parties, n_seats + 1), dtype=np.int64),
+        'majorities': np.zeros(n_parties, dtype=np.int64),
+        'tipping': np.zeros(n_seats, dtype=np.int64),
+        'seats': np.zeros(n_parties, dtype=np.float64),
+    }
+    parties = np.arange(n_parties)
+    seat_offsets = np.arange(n_seats)[None, :] * n_parties
+    for start in range(0, draws, chunk):
+        size = min(chunk, draws - start)
+        # One per-seat, one per-district and one statewide normal error for every party.
+        simulated = rng.standard_normal((size, n_seats, n_parties), dtype=np.float32)
+        simulated *= seat_noise
+        simulated += (rng.standard_normal((size, n_districts, n_parties), dtype=np.float32)
+                      * district_noise)[:, district_codes]
+        simulated += rng.standard_normal((size, 1, n_parties), dtype=np.float32) * state_noise
+        simulated += base
+
+        winner = simulated.argmax(axis=2)
+        draw_offsets = np.arange(size)[:, None] * n_parties
+        seats = np.bincount((draw_offsets + winner).ravel(), minlength=size * n_parties).reshape(size, n_parties)
+        totals['wins'] += np.bincount((seat_offsets + winner).ravel(),
+                                      minlength=n_seats * n_parties).reshape(n_seats, n_parties)
+        totals['seats'] += seats.sum(axis=0)
+        totals['majorities'] += (seats >= majority).sum(axis=0)
+        totals['seat_counts'] += np.bincount((parties * (n_seats + 1) + seats).ravel(),
+                                             minlength=n_parties * (n_seats + 1)).reshape(n_parties, n_seats + 1)
+
+        # Tipping point: rank the seats by the draw's largest party's lead and take the one that makes its majority.
+        leader = seats.argmax(axis=1)
+        is_leader = (leader[:, None] == parties)[:, None, :]
+        leader_share = np.take_along_axis(simulated, leader[:, None, None], axis=2)[:, :, 0]
+        np.putmask(simulated, np.broadcast_to(is_leader, simulated.shape), -np.inf)
+        lead = np.nan_to_num(leader_share - simulated.max(axis=2), nan=0.0, posinf=1e9, neginf=-1e9)
+        tipping = np.argpartition(-lead, majority - 1, axis=1)[:, majority - 1]
+        totals['tipping'] += np.bincount(tipping, minlength=n_seats)
+    return totals
+
+
+class SeatSimulator:
+    """Monte Carlo seat projections from one year's (constituency x party) vote shares.
+
+    Each draw adds the requested party swings plus a statewide, a district
+    and a seat-level normal error (in percentage points) to every party's
+    share and gives each seat to the party with the largest share. Draws
+    run as batched array operations, a chunk at a time; ``workers > 1``
+    splits them across processes with independent random streams.
+    """
+
+    def __init__(self, engine: SwingEngine, year: int):
+        y = engine.years.index(int(year))
+        seats = np.flatnonzero(engine.totals[:, y] > 0)
+        self.year = int(year)
+        self.parties: List[str] = engine.parties
+        self.districts: List[str] = sorted(set(engine.districts[s] for s in seats))
+        self.seat_districts = [engine.districts[s] for s in seats]
+        self.constituencies = [engine.constituencies[s] for s in seats]
+        self.shares = engine.shares[seats, :, y]
+        self.contested = engine.votes[seats, :, y] > 0
+        self.base_winners = engine.winners[seats, y]
+        position = {district: i for i, district in enumerate(self.districts)}
+        self._district_codes = np.array([position[d] for d in self.seat_districts], dtype=np.int64)
+
+    def _shift(self, swing: Optional[Dict[str, float]],
+               district_swing: Optional[Dict[Tuple[str, str], float]]) -> np.ndarray:
+        shift = np.zeros(self.shares.shape)
+        for party, points in (swing or {}).items():
+            if party in self.parties:
+                shift[:, self.parties.index(party)] += points
+        for (district, party), points in (district_swing or {}).items():
+            if party in self.parties:
+                shift[np.array(self.seat_districts) == district, self.parties.index(party)] += points
+        return shift
+
+    def run(self, draws: int = DEFAULT_DRAWS, swing: Optional[Dict[str, float]] = None,
+            district_swing: Optional[Dict[Tuple[str, str], float]] = None, state_noise: float = 1.5,
+            district_noise: float = 1.0, seat_noise: float = 2.0, seed: int = 0, workers: int = 1,
+            chunk: int = DEFAULT_CHUNK) -> Dict[str, Any]:
+        """Project seats under a uniform party ``swing`` and per-(district, party) swings, in points.
+
+        Returns ``seats`` (per party: mean seats, 5th/50th/95th percentile
+        and majority probability), ``seat_distribution`` (probability of
+        each seat total, parties as rows), ``win_probability`` (per
+        constituency, each party's chance of winning) and ``tipping_point``
+        (how often each seat decided the majority), plus ``draws`` and
+        ``majority``.
+        """
+        shift = self._shift(swing, district_swing)
+        noise = (state_noise, district_noise, seat_noise)
+        args = (self.shares, self.contested, self._district_codes, len(self.districts), shift, noise)
+        streams = np.random.SeedSequence(seed).spawn(max(int(workers), 1))
+        if workers > 1:
+            sizes = [draws // workers + (1 if i < draws % workers else 0) for i in range(workers)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parts = list(pool.map(_simulate, *zip(*[args + (size, stream, chunk)
+                                                        for size, stream in zip(sizes, streams)])))
+            totals = {key: sum(part[key] for part in parts) for key in parts[0]}
+        else:
+            totals = _simulate(*args, draws, streams[0], chunk)
+        return self._summarize(totals, draws)
+
+    def _summarize(self, totals: Dict[str, np.ndarray], draws: int) -> Dict[str, Any]:
+        n_seats = len(self.constituencies)
+        distribution = totals['seat_counts'] / draws
+        cumulative = np.cumsum(distribution, axis=1)
+
+        def percentile(q):
+            return (cumulative < q).sum(axis=1)
+
+        seats = pd.DataFrame({
+            'party': self.parties,
+            'base_seats': np.bincount(self.base_winners[self.base_winners >= 0], minlength=len(self.parties)),
+            'mean_seats': np.round(totals['seats'] / draws, 2),
+            'p5': percentile(0.05),
+            'median': percentile(0.5),
+            'p95': percentile(0.95),
+            'majority_probability': totals['majorities'] / draws,
+        })
+        seats = seats[(seats['mean_seats'] > 0) | (seats['base_seats'] > 0)]
+        seats = seats.sort_values('mean_seats', ascending=False, kind='mergesort').reset_index(drop=True)
+
+        wins = totals['wins'] / draws
+        names = np.array(self.parties + [''], dtype=object)
+        win_probability = pd.DataFrame({
+            'district': self.seat_districts,
+            'constituency': self.constituencies,
+            f'winner_{self.year}': names[self.base_winners],
+            'favourite': names[wins.argmax(axis=1)],
+            'favourite_probability': wins.max(axis=1),
+        })
+        party_columns = pd.DataFrame(wins, columns=self.parties)[seats['party'].tolist()]
+        win_probability = pd.concat([win_probability, party_columns], axis=1)
+
+        tipping = pd.DataFrame({
+            'district': self.seat_districts,
+            'constituency': self.constituencies,
+            'probability': totals['tipping'] / draws,
+        })
+        tipping = tipping[tipping['probability'] > 0]
+        tipping = tipping.sort_values('probability', ascending=False, kind='mergesort').reset_index(drop=True)
+
+        return {
+            'draws': draws,
+            'majority': n_seats // 2 + 1,
+            'seats': seats,
+            'seat_distribution': pd.DataFrame(distribution, index=self.parties).loc[seats['party']],
+            'win_probability': win_probability,
+            'tipping_point': tipping,
+        }
@@ -0,0 +1,243 @@
+import json
+import os
+import sqlite3
+import threading
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Callable, Tuple
+
+from datastore import file_lock
+from booths import BoothTables
+
+SCHEMA_VERSION = 1
+LABEL_COLUMN = '_label'
+# Indexed lookups: (year, district, constituency) prefixes, members and booth IDs.
+TABLE_INDEXES = {
+    'results': [('year', 'district', 'constituency'), ('candidate',), ('party',)],
+    'summary': [('year', 'district', 'constituency')],
+    'booths': [('year', 'district', 'constituency'), ('booth_id',)],
+    'booth_results': [('booth_key',)],
+}
+
+
+def sqlite_path(csv_path: Path) -> Path:
+    """Database file kept next to a CSV."""
+    csv_path = Path(csv_path)
+    return csv_path.with_name(f".{csv_path.stem}.sqlite")
+
+
+def _dtype_spec(series: pd.Series) -> Dict[str, Any]:
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return {'kind': 'category', 'categories': [str(c) for c in series.cat.categories],
+                'ordered': bool(series.cat.ordered)}
+    return {'kind': 'plain', 'dtype': str(series.dtype)}
+
+
+def _column_dtype(spec: Dict[str, Any]):
+    if spec['kind'] == 'category':
+        return pd.CategoricalDtype(spec['categories'], ordered=spec['ordered'])
+    return np.dtype(spec['dtype'])
+
+
+def _restore(rows: List[Tuple], columns: List[str], dtypes: Dict[str, Any]) -> pd.DataFrame:
+    """Frame of rows read back from SQLite, with the dtypes of the frame they were written from."""
+    values = list(zip(*rows)) if rows else [()] * len(columns)
+    by_name = dict(zip(columns, values))
+    out = {}
+    for col, dtype in dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            out[col] = pd.Categorical(np.array(by_name[col], dtype=object), dtype=dtype)
+        else:
+            out[col] = np.array(by_name[col], dtype=dtype)
+    return pd.DataFrame(out, index=pd.Index(np.array(by_name[LABEL_COLUMN], dtype=np.int64)), copy=False)
+
+
+def _write_table(conn: sqlite3.Connection, name: str, df: pd.DataFrame):
+    plain = {LABEL_COLUMN: np.asarray(df.index)}
+    for col in df.columns:
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            plain[col] = series.astype(object).to_numpy()
+        elif pd.api.types.is_bool_dtype(series):
+            plain[col] = series.to_numpy().astype(np.int8)
+        else:
+            plain[col] = series.to_numpy()
+    pd.DataFrame(plain).to_sql(name, conn, index=False)
+    for number, columns in enumerate(TABLE_INDEXES.get(name, [])):
+        if all(col in df.columns for col in columns):
+            conn.execute(f'CREATE INDEX "{name}_idx{number}" ON "{name}" ({", ".join(columns)})')
+
+
+class SQLiteStore:
+    """A read-only SQLite copy of a set of frames, rebuilt when its version changes.
+
+    Categorical and boolean columns are stored as plain TEXT and INTEGER
+    values and the original dtypes are kept in a meta table, so query
+    results come back with the same dtypes and row labels as the frames
+    the database was built from.
+    """
+
+    def __init__(self, path: Path, version: str, build: Callable[[], Dict[str, pd.DataFrame]]):
+        self.path = Path(path)
+        self.version = version
+        with file_lock(self.path.with_name(self.path.name + ".lock")):
+            if self._stored_version() != version:
+                self._publish(build())
+        self._conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+        self._lock = threading.Lock()
+        meta = dict(self._conn.execute("SELECT key, value FROM meta").fetchall())
+        self.dtypes = {table: {col: _column_dtype(spec) for col, spec in specs.items()}
+                       for table, specs in json.loads(meta['dtypes']).items()}
+
+    def _stored_version(self) -> Optional[str]:
+        if not self.path.exists():
+            return None
+        try:
+            with sqlite3.connect(f"file:{self.path}?mode=ro", uri=True) as conn:
+                meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+        except sqlite3.Error:
+            return None
+        if meta.get('schema') != str(SCHEMA_VERSION):
+            return None
+        return meta.get('version')
+
+    def _publish(self, frames: Dict[str, pd.DataFrame]):
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp{os.getpid()}")
+        tmp_path.unlink(missing_ok=True)
+        conn = sqlite3.connect(tmp_path)
+        try:
+            for name, df in frames.items():
+                _write_table(conn, name, df)
+            dtypes = {name: {col: _dtype_spec(df[col]) for col in df.columns} for name, df in frames.items()}
+            conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+            conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+                ('schema', str(SCHEMA_VERSION)), ('version', self.version), ('dtypes', json.dumps(dtypes))])
+            conn.commit()
+        finally:
+            conn.close()
+        os.replace(tmp_path, self.path)
+
+    def query(self, table: str, where: List[Tuple[str, Any]] = (), order: str = "rowid",
+              limit: Optional[int] = None, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Rows of ``table`` matching every (column, value) equality, in stored order.
+
+        Only ``columns`` are read when given.
+        """
+        dtypes = self.dtypes[table] if columns is None else {col: self.dtypes[table][col] for col in columns}
+        selected = ", ".join(f'"{col}"' for col in [LABEL_COLUMN] + list(dtypes))
+        sql = f'SELECT {selected} FROM "{table}"'
+        if where:
+            sql += " WHERE " + " AND ".join(f'"{col}" = ?' for col, _ in where)
+        sql += f" ORDER BY {order}"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        params = [_sql_param(value) for _, value in where]
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            rows = cursor.fetchall()
+        return _restore(rows, [d[0] for d in cursor.description], dtypes)
+
+    def sum(self, table: str, by: List[str], column: str) -> pd.DataFrame:
+        """Total of ``column`` per group of ``by`` values, summed in SQL.
+
+        Groups come in order of their first stored row, labelled from 0,
+        with the ``by`` columns in their stored dtypes and the total as int64.
+        """
+        keys = ", ".join(f'"{col}"' for col in by)
+        rows = self.execute(f'SELECT {keys}, SUM("{column}") FROM "{table}" GROUP BY {keys} ORDER BY MIN(rowid)')
+        dtypes = {col: self.dtypes[table][col] for col in by}
+        dtypes[column] = np.dtype(np.int64)
+        return _restore([(i,) + row for i, row in enumerate(rows)], [LABEL_COLUMN] + by + [column], dtypes)
+
+    def execute(self, sql: str, params: List[Any] = ()) -> List[Tuple]:
+        """Raw rows of an arbitrary read-only query."""
+        with self._lock:
+            return self._conn.execute(sql, [_sql_param(value) for value in params]).fetchall()
+
+    def distinct(self, table: str, column: str, where: List[Tuple[str, Any]] = ()) -> List[Any]:
+        """Sorted distinct values of a column among the matching rows."""
+        sql = f'SELECT DISTINCT "{column}" FROM "{table}"'
+        if where:
+            sql += " WHERE " + " AND ".join(f'"{col}" = ?' for col, _ in where)
+        sql += f' ORDER BY "{column}"'
+        return [row[0] for row in self.execute(sql, [value for _, value in where])]
+
+
+def _sql_param(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class SQLiteIndex:
+    """ElectionIndex lookups answered by indexed queries against a SQLiteStore table.
+
+    Only the matching rows are read, in the same order and with the same
+    dtypes and row labels as ElectionIndex.select returns them, provided the
+    table was written from an ElectionIndex's ``frame``.
+    """
+
+    def __init__(self, store: SQLiteStore, table: str = 'results'):
+        self.store = store
+        self.table = table
+        self.years: List[int] = [int(y) for y in store.distinct(table, 'year')]
+        # Constituencies resolve to their district so lookups use the full (year, district, constituency) index.
+        self._constituency_district: Dict[str, str] = dict(store.execute(
+            f'SELECT constituency, district FROM "{table}" GROUP BY constituency, district ORDER BY MAX(rowid)'))
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """The whole table (reads every row)."""
+        return self.store.query(self.table)
+
+    def select(self, year: Optional[int] = None, district: Optional[str] = None,
+               constituency: Optional[str] = None, candidate: Optional[str] = None,
+               party: Optional[str] = None) -> pd.DataFrame:
+        """Return the rows matching every given filter."""
+        if constituency is not None:
+            owner = self._constituency_district.get(constituency)
+            if owner is None or (district is not None and district != owner):
+                return self.store.query(self.table, limit=0)
+            district = owner
+        where = [(col, value) for col, value in (('year', year), ('district', district),
+                                                 ('constituency', constituency), ('candidate', candidate),
+                                                 ('party', party))
+                 if value is not None]
+        return self.store.query(self.table, where)
+
+    def districts(self, year: Optional[int] = None) -> List[str]:
+        """Districts with results in the given year (or any year)."""
+        where = [('year', year)] if year is not None else []
+        return self.store.distinct(self.table, 'district', where)
+
+    def constituencies(self, year: Optional[int] = None, district: Optional[str] = None) -> List[str]:
+        """Constituencies with results in the given year and district."""
+        where = [(col, value) for col, value in (('year', year), ('district', district)) if value is not None]
+        return self.store.distinct(self.table, 'constituency', where)
+
+    def district_of(self, constituency: str) -> Optional[str]:
+        """District a constituency belongs to."""
+        return self._constituency_district.get(constituency)
+
+
+class SQLiteBoothTables:
+    """BoothTables lookups (booth by ID, a booth's candidates) answered from a SQLiteStore."""
+
+    with_names = staticmethod(BoothTables.with_names)
+    booth_name = BoothTables.booth_name
+
+    def __init__(self, store: SQLiteStore):
+        self.store = store
+
+    def booth_results(self, booth_key: int) -> pd.DataFrame:
+        """Candidate rows of one booth."""
+        return self.store.query('booth_results', [('booth_key', int(booth_key))])
+
+    def find(self, booth_id: int, year: Optional[int] = None) -> Optional[pd.Series]:
+        """Booth row for a booth ID (optionally only in the given year), or None."""
+        where = [('booth_id', int(booth_id))] + ([('year', int(year))] if year is not None else [])
+        rows = self.store.query('booths', where, limit=1)
+        if rows.empty:
+            return None
+        return rows.iloc[0]
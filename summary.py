@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+SUMMARY_KEYS = ['year', 'district', 'constituency']
+SUMMARY_COLUMNS = SUMMARY_KEYS + [
+    'winner_candidate', 'winner_party', 'winner_votes',
+    'runner_up_candidate', 'runner_up_party', 'runner_up_votes',
+    'margin', 'total_votes', 'winner_share', 'candidates', 'enp',
+]
+
+
+def _take(series: pd.Series, positions: np.ndarray) -> pd.Series:
+    """Values at row positions; -1 gives a missing value."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = np.where(positions >= 0, series.cat.codes.to_numpy()[np.maximum(positions, 0)], -1)
+        return pd.Categorical.from_codes(codes, dtype=series.dtype)
+    values = series.to_numpy(dtype=object)[np.maximum(positions, 0)]
+    values[positions < 0] = None
+    return values
+
+
+def constituency_summary(results: pd.DataFrame) -> pd.DataFrame:
+    """One row per (year, district, constituency) contest, in order of first appearance.
+
+    Holds the winner and runner-up (candidate, party, votes), the margin
+    between them, total votes, the winner's share of them in percent, the
+    number of candidates and the effective number of parties
+    (1 / sum of squared party vote shares). Everything is computed in one
+    sort of the candidate rows; contests with a single candidate have no
+    runner-up and a margin equal to the winner's votes.
+    """
+    if results.empty:
+        return pd.DataFrame(columns=SUMMARY_COLUMNS)
+
+    contest = results.groupby(SUMMARY_KEYS, observed=True, sort=False).ngroup().to_numpy()
+    votes = results['votes'].to_numpy().astype(np.int64)
+    # Contest by contest, candidates by votes (ties keep their row order).
+    order = np.lexsort((-votes, contest))
+    counts = np.bincount(contest)
+    starts = np.cumsum(counts) - counts
+    first = order[starts]
+    second = np.where(counts > 1, order[np.minimum(starts + 1, len(order) - 1)], -1)
+
+    winner_votes = votes[first]
+    runner_up_votes = np.where(second >= 0, votes[np.maximum(second, 0)], 0)
+    total_votes = np.add.reduceat(votes[order], starts)
+
+    # Candidates of the same party in a contest are pooled for the party shares.
+    party_codes = pd.factorize(results['party'])[0].astype(np.int64)
+    n_parties = int(party_codes.max()) + 1
+    contest_party, position = np.unique(contest * n_parties + party_codes, return_inverse=True)
+    party_votes = np.bincount(position, weights=votes)
+    party_contest = contest_party // n_parties
+    with np.errstate(divide='ignore', invalid='ignore'):
+        shares = party_votes / total_votes[party_contest]
+        enp = 1.0 / np.bincount(party_contest, weights=shares ** 2, minlength=len(counts))
+        winner_share = winner_votes / total_votes * 100
+
+    summary = pd.DataFrame({key: _take(results[key], first) for key in SUMMARY_KEYS})
+    summary['winner_candidate'] = _take(results['candidate'], first)
+    summary['winner_party'] = _take(results['party'], first)
+    summary['winner_votes'] = winner_votes.astype(results['votes'].dtype)
+    summary['runner_up_candidate'] = _take(results['candidate'], second)
+    summary['runner_up_party'] = _take(results['party'], second)
+    summary['runner_up_votes'] = runner_up_votes.astype(results['votes'].dtype)
+    summary['margin'] = (winner_votes - runner_up_votes).astype(results['votes'].dtype)
+    summary['total_votes'] = total_votes
+    summary['winner_share'] = winner_share
+    summary['candidates'] = counts.astype(np.int32)
+    summary['enp'] = enp
+    summary['year'] = summary['year'].astype(results['year'].dtype)
+    return summary
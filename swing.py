@@ -0,0 +1,177 @@
+import numpy as np
+import pandas as pd
+from typing import Optional, List, Tuple
+
+SWING_KEYS = ['district', 'constituency', 'party', 'year']
+
+
+def seat_party_frame(results: pd.DataFrame) -> pd.DataFrame:
+    """Votes and winner flag per (district, constituency, party, year), the rows SwingEngine reads.
+
+    Seats keep the order of their first candidate row, so an engine built
+    from this frame matches one built from the candidate rows.
+    """
+    if results.empty:
+        return pd.DataFrame(columns=SWING_KEYS + ['votes', 'winner'])
+    return (results.groupby(SWING_KEYS, observed=True, sort=False)
+            .agg(votes=('votes', 'sum'), winner=('winner', 'any'))
+            .reset_index())
+
+
+class SwingEngine:
+    """Votes and vote shares of every party in every constituency and year, as one dense tensor.
+
+    ``votes`` is a (constituency x party x year) array built once from the
+    candidate rows, together with the share swing and seat flips of every
+    pair of years; comparing two years is then a handful of array
+    operations over all constituencies at once: vote change, share swing,
+    winners in both years, flipped and retained seats and the Butler swing
+    between two parties. Constituencies are keyed by (district,
+    constituency) and a year pair only covers seats contested in both.
+    """
+
+    def __init__(self, results: pd.DataFrame):
+        seats = results.groupby(['district', 'constituency'], observed=True, sort=False).ngroup().to_numpy()
+        first = np.unique(seats, return_index=True)[1]
+        self.districts: List[str] = [str(d) for d in results['district'].to_numpy()[first]]
+        self.constituencies: List[str] = [str(c) for c in results['constituency'].to_numpy()[first]]
+        party_codes, parties = pd.factorize(results['party'].astype(str), sort=True)
+        year_codes, years = pd.factorize(results['year'], sort=True)
+        self.parties: List[str] = list(parties)
+        self.years: List[int] = [int(y) for y in years]
+        self._year = {year: i for i, year in enumerate(self.years)}
+        self._party = {party: i for i, party in enumerate(self.parties)}
+
+        shape = (len(first), len(self.parties), len(self.years))
+        votes = results['votes'].to_numpy().astype(np.int64)
+        self.votes = np.zeros(shape, dtype=np.int64)
+        np.add.at(self.votes, (seats, party_codes, year_codes), votes)
+        self.totals = self.votes.sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.shares = np.where(self.totals[:, None, :] > 0, self.votes / self.totals[:, None, :] * 100, 0.0)
+
+        # Winning party per seat and year, from the results' winner flag; -1 where not contested.
+        self.winners = np.full((shape[0], shape[2]), -1, dtype=np.int64)
+        won = results['winner'].to_numpy(dtype=bool)
+        self.winners[seats[won], year_codes[won]] = party_codes[won]
+
+        # Every year pair at once: [seat, party, y1, y2] is the share change from y1 to y2.
+        self.share_swing = self.shares[:, :, None, :] - self.shares[:, :, :, None]
+        self.flipped = self.winners[:, None, :] != self.winners[:, :, None]
+
+    def _pair(self, year1: int, year2: int) -> Tuple[int, int, np.ndarray]:
+        y1, y2 = self._year[int(year1)], self._year[int(year2)]
+        both = (self.totals[:, y1] > 0) & (self.totals[:, y2] > 0)
+        return y1, y2, both
+
+    def _area(self, district: Optional[str], constituency: Optional[str]) -> np.ndarray:
+        area = np.ones(len(self.constituencies), dtype=bool)
+        if district:
+            area &= np.array([d == district for d in self.districts])
+        if constituency:
+            area &= np.array([c == constituency for c in self.constituencies])
+        return area
+
+    def main_parties(self, year1: int, year2: int) -> Tuple[str, str]:
+        """The two parties with the most votes statewide over both years."""
+        y1, y2, _ = self._pair(year1, year2)
+        combined = self.votes[:, :, [y1, y2]].sum(axis=(0, 2))
+        top = np.argsort(-combined, kind='stable')[:2]
+        return self.parties[top[0]], self.parties[top[-1]]
+
+    def compare(self, year1: int, year2: int, parties: Optional[Tuple[str, str]] = None) -> pd.DataFrame:
+        """One row per constituency contested in both years.
+
+        Holds total votes in both years and their change, the winning party
+        in both years, whether the seat flipped, the share swing of the
+        ``year1`` winner's party (percentage points) and the Butler swing
+        from the second to the first of ``parties`` (the two largest
+        parties by default): half the change in the first party's share
+        minus the change in the second's.
+        """
+        y1, y2, both = self._pair(year1, year2)
+        party_a, party_b = parties or self.main_parties(year1, year2)
+        a, b = self._party.get(party_a), self._party.get(party_b)
+        seats = np.flatnonzero(both)
+
+        winner1, winner2 = self.winners[seats, y1], self.winners[seats, y2]
+        swing = self.share_swing[seats, :, y1, y2]
+        holder_swing = swing[np.arange(len(seats)), np.maximum(winner1, 0)]
+        butler = np.zeros(len(seats)) if a is None or b is None else (swing[:, a] - swing[:, b]) / 2
+        names = np.array(self.parties + [''], dtype=object)
+
+        return pd.DataFrame({
+            'district': np.array(self.districts, dtype=object)[seats],
+            'constituency': np.array(self.constituencies, dtype=object)[seats],
+            f'total_votes_{year1}': self.totals[seats, y1],
+            f'total_votes_{year2}': self.totals[seats, y2],
+            'vote_change': self.totals[seats, y2] - self.totals[seats, y1],
+            f'winner_{year1}': names[winner1],
+            f'winner_{year2}': names[winner2],
+            'flipped': self.flipped[seats, y1, y2],
+            'holder_swing': np.round(holder_swing, 2),
+            'butler_swing': np.round(butler, 2),
+        })
+
+    def party_swing(self, year1: int, year2: int, district: Optional[str] = None,
+                    constituency: Optional[str] = None) -> pd.DataFrame:
+        """Per-party votes, vote shares and their change between two years.
+
+        Covers the seats contested in both years within the district or
+        constituency (the whole state by default); parties with no votes in
+        either year are left out. Largest ``year2`` vote first.
+        """
+        y1, y2, both = self._pair(year1, year2)
+        seats = both & self._area(district, constituency)
+        votes1 = self.votes[seats, :, y1].sum(axis=0)
+        votes2 = self.votes[seats, :, y2].sum(axis=0)
+        total1, total2 = votes1.sum(), votes2.sum()
+        share1 = votes1 / total1 * 100 if total1 else np.zeros(len(self.parties))
+        share2 = votes2 / total2 * 100 if total2 else np.zeros(len(self.parties))
+        swing = pd.DataFrame({
+            'party': self.parties,
+            f'votes_{year1}': votes1,
+            f'votes_{year2}': votes2,
+            'vote_change': votes2 - votes1,
+            f'share_{year1}': np.round(share1, 2),
+            f'share_{year2}': np.round(share2, 2),
+            'swing': np.round(share2 - share1, 2),
+        })
+        swing = swing[(votes1 > 0) | (votes2 > 0)]
+        return swing.sort_values(f'votes_{year2}', ascending=False, kind='mergesort').reset_index(drop=True)
+
+    def seat_changes(self, year1: int, year2: int) -> pd.DataFrame:
+        """Per-party seats in both years over the seats contested in both, with retained, gained and lost seats."""
+        y1, y2, both = self._pair(year1, year2)
+        winner1, winner2 = self.winners[both, y1], self.winners[both, y2]
+        held = winner1 == winner2
+        size = len(self.parties) + 1
+        counts = {
+            f'seats_{year1}': np.bincount(winner1 + 1, minlength=size)[1:],
+            f'seats_{year2}': np.bincount(winner2 + 1, minlength=size)[1:],
+            'retained': np.bincount(winner1[held] + 1, minlength=size)[1:],
+            'gained': np.bincount(winner2[~held] + 1, minlength=size)[1:],
+            'lost': np.bincount(winner1[~held] + 1, minlength=size)[1:],
+        }
+        changes = pd.DataFrame({'party': self.parties, **counts})
+        changes['net'] = changes['gained'] - changes['lost']
+        changes = changes[(changes[f'seats_{year1}'] > 0) | (changes[f'seats_{year2}'] > 0)]
+        return changes.sort_values([f'seats_{year2}', 'net'], ascending=False, kind='mergesort').reset_index(drop=True)
+
+    def district_swing(self, year1: int, year2: int) -> pd.DataFrame:
+        """Share swing of every party in every district (districts as rows, parties as columns)."""
+        y1, y2, both = self._pair(year1, year2)
+        districts = sorted(set(self.districts))
+        position = {district: i for i, district in enumerate(districts)}
+        codes = np.array([position[d] for d in self.districts])[both]
+        votes1 = np.zeros((len(districts), len(self.parties)), dtype=np.int64)
+        votes2 = np.zeros_like(votes1)
+        np.add.at(votes1, codes, self.votes[both, :, y1])
+        np.add.at(votes2, codes, self.votes[both, :, y2])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            share1 = np.nan_to_num(votes1 / votes1.sum(axis=1, keepdims=True) * 100)
+            share2 = np.nan_to_num(votes2 / votes2.sum(axis=1, keepdims=True) * 100)
+        present = (votes1.sum(axis=0) > 0) | (votes2.sum(axis=0) > 0)
+        swing = pd.DataFrame(np.round(share2 - share1, 2)[:, present], index=districts,
+                             columns=[p for p, keep in zip(self.parties, present) if keep])
+        return swing[np.bincount(codes, minlength=len(districts)) > 0]
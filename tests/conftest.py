@@ -0,0 +1,29 @@
+import logging
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+logging.getLogger('streamlit').setLevel(logging.ERROR)
+
+from utils import DATA_PATH, compact_frame, generate_booth_tables  # noqa: E402
+
+
+@pytest.fixture(scope='session')
+def raw_results():
+    """The election CSV as plain pandas reads it: the baseline every engine is checked against."""
+    return pd.read_csv(DATA_PATH)
+
+
+@pytest.fixture(scope='session')
+def results(raw_results):
+    """The election CSV as the app loads it (categoricals, bool winner flag, downcast integers)."""
+    return compact_frame(raw_results)
+
+
+@pytest.fixture(scope='session')
+def booth_tables():
+    return generate_booth_tables(booths_per_constituency=3)
@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from anomalies import ANOMALY_CHECKS, ONE_SIDED, Z_THRESHOLD, AnomalyReport, booth_anomalies, robust_z
+
+
+def pandas_robust_z(values, groups):
+    """The same robust z-score from pandas groupby medians."""
+    frame = pd.DataFrame({'value': values, 'group': groups})
+    median = frame.groupby('group')['value'].transform('median')
+    deviation = (frame['value'] - median).abs()
+    mad = deviation.groupby(frame['group']).transform('median')
+    mean_ad = deviation.groupby(frame['group']).transform('mean')
+    scale = np.where(mad > 0, mad / 0.6745, mean_ad * 1.2533)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(scale > 0, (frame['value'] - median) / scale, 0.0)
+
+
+def test_robust_z_matches_pandas_medians():
+    rng = np.random.default_rng(3)
+    values = np.round(rng.normal(70, 5, 2000), 1)
+    groups = rng.integers(0, 40, 2000)
+    # A group with no spread and a group whose MAD is 0 but not its mean deviation.
+    values[groups == 0] = 50.0
+    values[groups == 1] = 60.0
+    values[np.flatnonzero(groups == 1)[:3]] = 90.0
+    assert np.allclose(robust_z(values, groups), pandas_robust_z(values, groups))
+
+
+@pytest.fixture(scope='module')
+def anomalies(booth_tables):
+    return booth_anomalies(booth_tables.booths, booth_tables.results)
+
+
+@pytest.fixture(scope='module')
+def report(anomalies):
+    return AnomalyReport(anomalies)
+
+
+def test_features_and_scores_match_pandas(anomalies, booth_tables):
+    booths = booth_tables.booths.reset_index(drop=True)
+    winner_votes = booth_tables.results.groupby('booth_key')['votes'].max()
+    share = winner_votes.reindex(booths['booth_key']).to_numpy() / booths['votes_polled'].to_numpy() * 100
+    assert np.allclose(anomalies['winner_share'], np.round(share, 2))
+
+    constituency = (booths['year'].astype(str) + booths['constituency'].astype(str)).to_numpy()
+    district = (booths['year'].astype(str) + booths['district'].astype(str)).to_numpy()
+    expected = pandas_robust_z(booths['turnout_percentage'].to_numpy(dtype=float), constituency)
+    assert np.allclose(anomalies['z_turnout_constituency'], np.round(expected, 2))
+    expected = pandas_robust_z(booths['previous_error'].to_numpy(dtype=float), district)
+    assert np.allclose(anomalies['z_previous_error'], np.round(expected, 2))
+
+    z = anomalies[[f'z_{check}' for check in ANOMALY_CHECKS]].to_numpy()
+    one_sided = np.array([check in ONE_SIDED for check in ANOMALY_CHECKS])
+    scores = np.where(one_sided, np.maximum(z, 0), np.abs(z))
+    assert np.allclose(anomalies['score'], scores.max(axis=1), atol=0.011)
+
+
+def test_report_lookups_match_boolean_masks(report, anomalies):
+    assert report.years == sorted(anomalies['year'].unique().tolist())
+    assert report.districts == sorted(anomalies['district'].astype(str).unique())
+    for year in [None] + report.years:
+        scope = anomalies if year is None else anomalies[anomalies['year'] == year]
+        for district in [None] + report.districts:
+            area = scope if district is None else scope[scope['district'].astype(str) == district]
+            assert report.summary(year, district) == {'booths': len(area),
+                                                      'flagged': int((area['flag_count'] > 0).sum())}
+
+        expected = pd.DataFrame({check: scope[f'z_{check}'].to_numpy() for check in ANOMALY_CHECKS})
+        for check in ANOMALY_CHECKS:
+            z = expected[check]
+            expected[check] = (z if check in ONE_SIDED else z.abs()) > Z_THRESHOLD
+        expected = expected.groupby(scope['district'].astype(str).to_numpy()).sum()
+        counts = report.flag_counts(year)
+        assert counts.index.tolist() == expected.index.tolist()
+        assert (counts.to_numpy() == expected.to_numpy()).all()
+    assert report.summary(1999) == {'booths': 0, 'flagged': 0}
+
+
+def test_booth_lookups_match_boolean_masks(report, anomalies):
+    for year in report.years:
+        scope = anomalies[anomalies['year'] == year].set_index('booth_id')
+        booth_ids = scope.index[::7].tolist() + [-1]
+        scores = report.scores(booth_ids, year)
+        assert np.allclose(scores['score'][:-1], scope.loc[booth_ids[:-1], 'score'])
+        assert scores['flags'][:-1].tolist() == scope.loc[booth_ids[:-1], 'flags'].astype(str).tolist()
+        assert np.isnan(scores['score'].iloc[-1]) and scores['flags'].iloc[-1] == ''
+        row = report.booth(booth_ids[0], year)
+        assert row['booth_id'] == booth_ids[0] and row['score'] == scope.loc[booth_ids[0], 'score']
+    assert report.booth(-1) is None
+
+
+def test_report_does_not_depend_on_row_order(report, anomalies):
+    shuffled = AnomalyReport(anomalies.sample(frac=1, random_state=1))
+    for year in report.years:
+        pd.testing.assert_frame_equal(shuffled.flag_counts(year), report.flag_counts(year))
+        assert shuffled.summary(year) == report.summary(year)
+    pd.testing.assert_frame_equal(shuffled.top(10).reset_index(drop=True), report.top(10).reset_index(drop=True))
@@ -0,0 +1,135 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from booths import BoothTables, PartitionedBoothTables
+from selection import year_partitions
+from utils import (BOOTH_CANDIDATES, BOOTH_CONSTITUENCIES, BOOTH_PARTIES, BOOTH_YEARS, KERALA_DISTRICTS,
+                   generate_booth_tables)
+
+
+@pytest.fixture(scope='module')
+def tables():
+    """The booth data as the app generates it."""
+    return generate_booth_tables()
+
+
+def test_same_seed_gives_the_same_tables(tables):
+    again = generate_booth_tables()
+    pd.testing.assert_frame_equal(again.booths, tables.booths)
+    pd.testing.assert_frame_equal(again.results, tables.results)
+    other = generate_booth_tables(seed=1)
+    assert not other.results['votes'].equals(tables.results['votes'])
+
+
+def test_booths_keep_the_baseline_shape(tables):
+    booths = tables.booths
+    # 10 booths per district and year, two in each of its five constituencies.
+    assert len(booths) == len(BOOTH_YEARS) * len(KERALA_DISTRICTS) * 10
+    assert list(booths['booth_id']) == list(range(1001, 1001 + len(booths)))
+    for (year, district), group in booths.groupby(['year', 'district'], observed=True):
+        assert year in BOOTH_YEARS
+        assert group['constituency'].astype(str).value_counts().to_dict() == \
+            {c: 2 for c in BOOTH_CONSTITUENCIES[district]}
+    assert booths['total_voters'].between(1200, 1200 + 9 * 50 + 299).all()
+    assert (booths['turnout_percentage'] <= 90).all()
+    assert booths['previous_error'].between(0, 20).all()
+    assert booths['tendered_votes'].between(0, 5).all()
+    # The same booth has the same serial number in its constituency every year.
+    serials = booths.groupby(['year', 'district', 'constituency'], observed=True)['booth_serial'].agg(sorted)
+    assert (serials.map(tuple) == (1, 2)).all()
+
+
+def test_candidate_rows_keep_the_baseline_shape(tables):
+    booths, results = tables.booths, tables.results
+    counts = results.groupby('booth_key').size().reindex(booths['booth_key'], fill_value=0)
+    assert counts.between(3, 4).all()
+    votes = results.groupby('booth_key')['votes'].sum().reindex(booths['booth_key'])
+    assert (votes.to_numpy() == booths['votes_polled'].to_numpy()).all()
+    winner_votes = results.groupby('booth_key')['votes'].max().reindex(booths['booth_key']).to_numpy()
+    share = winner_votes / booths['votes_polled'].to_numpy()
+    assert ((share >= 0.39) & (share < 0.6)).all()
+    assert set(results['candidate'].astype(str)) <= set(BOOTH_CANDIDATES)
+    assert set(results['party'].astype(str)) <= set(BOOTH_PARTIES)
+    # No candidate stands twice in one booth.
+    assert not results.duplicated(['booth_key', 'candidate']).any()
+
+
+@pytest.mark.parametrize('per_constituency, years', [(1, 1), (3, 2), (4, 5)])
+def test_scale_factors(per_constituency, years):
+    scaled = generate_booth_tables(booths_per_constituency=per_constituency, num_years=years)
+    assert len(scaled.booths) == years * len(KERALA_DISTRICTS) * 5 * per_constituency
+    assert sorted(scaled.booths['year'].unique()) == list(range(BOOTH_YEARS[0], BOOTH_YEARS[0] + years))
+    assert scaled.booths['booth_id'].is_unique
+    assert np.array_equal(scaled.booths['booth_key'].to_numpy(), np.arange(len(scaled.booths)))
+
+
+def test_booth_winners_margins_and_turnout_match_pandas(booth_tables):
+    booths, results = booth_tables.booths, booth_tables.results
+    ranked = results.sort_values(['booth_key', 'votes'], ascending=[True, False], kind='stable')
+    top = ranked.groupby('booth_key').nth(0).set_index('booth_key').reindex(booths['booth_key'])
+    second = ranked.groupby('booth_key').nth(1).set_index('booth_key')['votes'].reindex(booths['booth_key'])
+    assert (booths['winner_candidate'].to_numpy() == top['candidate'].to_numpy()).all()
+    assert (booths['winner_party'].to_numpy() == top['party'].to_numpy()).all()
+    assert (booths['margin'].to_numpy() == (top['votes'] - second.fillna(0)).to_numpy()).all()
+    turnout = (booths['votes_polled'] / booths['total_voters'] * 100).round(1)
+    assert (booths['turnout_percentage'] == turnout).all()
+
+
+def test_lookups_match_boolean_masks(booth_tables):
+    booths, results = booth_tables.booths, booth_tables.results
+    for position in range(0, len(booths), 37):
+        booth = booths.iloc[position]
+        key = int(booth['booth_key'])
+        pd.testing.assert_frame_equal(booth_tables.booth_results(key), results[results['booth_key'] == key])
+        found = booth_tables.find(int(booth['booth_id']))
+        pd.testing.assert_series_equal(found, booths[booths['booth_id'] == booth['booth_id']].iloc[0])
+        assert booth_tables.find(int(booth['booth_id']), int(booth['year']) + 1) is None
+    assert booth_tables.find(-1) is None
+
+
+def test_wide_view_matches_a_merge(booth_tables):
+    booths, results = booth_tables.booths, booth_tables.results
+    wide = booth_tables.wide()
+    merged = results.merge(BoothTables.with_names(booths), on='booth_key', suffixes=('', '_booth'))
+    assert len(wide) == len(results)
+    for col in ['year', 'district', 'constituency', 'booth_id', 'booth_name', 'total_voters', 'votes_polled',
+                'previous_error', 'postal_votes', 'tendered_votes', 'candidate', 'party', 'votes']:
+        assert (wide[col].to_numpy() == merged[col].to_numpy()).all(), col
+    assert (wide['winner'].to_numpy() == (merged['candidate'] == merged['winner_candidate']).to_numpy()).all()
+
+
+def test_results_in_any_order_give_the_same_tables(booth_tables):
+    shuffled = booth_tables.results.sample(frac=1, random_state=0)
+    booth_columns = [col for col in booth_tables.booths.columns
+                     if col not in ('booth_key', 'result_start', 'result_stop', 'winner_candidate', 'winner_party',
+                                    'margin', 'turnout_percentage')]
+    rebuilt = BoothTables.from_results(booth_tables.booths[booth_columns], shuffled)
+    pd.testing.assert_frame_equal(rebuilt.booths, booth_tables.booths)
+    # Candidates keep their booth; only their order within it follows the input.
+    by_booth = ['booth_key', 'candidate']
+    pd.testing.assert_frame_equal(rebuilt.results.sort_values(by_booth).reset_index(drop=True),
+                                  booth_tables.results.sort_values(by_booth).reset_index(drop=True))
+
+
+def test_partitioned_lookups_match_and_touch_one_year(booth_tables):
+    booths = booth_tables.booths
+    catalog = year_partitions(booths, bounds=('booth_id',))
+    partitioned = PartitionedBoothTables(booths, booth_tables.results, catalog)
+    booth = booths[booths['year'] == 2024].iloc[5]
+    key = int(booth['booth_key'])
+    pd.testing.assert_series_equal(partitioned.find(int(booth['booth_id'])), booth_tables.find(int(booth['booth_id'])))
+    pd.testing.assert_frame_equal(partitioned.booth_results(key), booth_tables.booth_results(key))
+    assert list(partitioned._years) == [2024]
+    assert partitioned.find(int(booth['booth_id']), 2023) is None
+
+    for position in range(0, len(booths), 53):
+        booth = booths.iloc[position]
+        key = int(booth['booth_key'])
+        pd.testing.assert_series_equal(partitioned.find(int(booth['booth_id']), int(booth['year'])),
+                                       booth_tables.find(int(booth['booth_id'])))
+        pd.testing.assert_frame_equal(partitioned.booth_results(key), booth_tables.booth_results(key))
+    for entry in catalog:
+        year = partitioned.year(entry['year'])
+        pd.testing.assert_frame_equal(year.booths, booths[booths['year'] == entry['year']])
+    assert partitioned.find(-1) is None and partitioned.year(1999) is None
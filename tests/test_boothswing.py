@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from boothswing import BOOTH_KEY, BoothSwing, booth_serials
+
+YEAR_PAIRS = [(2023, 2024), (2024, 2025), (2023, 2025), (2025, 2023)]
+AREAS = [(None, None), ('Kollam', None), ('Kollam', 'Chavara'), (None, 'Nemom'), ('Kollam', 'Nemom')]
+
+
+@pytest.fixture(scope='module')
+def swing(booth_tables):
+    return BoothSwing(booth_tables.booths)
+
+
+def plain_compare(booths, year1, year2, district=None, constituency=None):
+    """The same table from a merge of the two years' booth rows."""
+    rows = booths.astype({'district': str, 'constituency': str, 'winner_party': str})
+    if district:
+        rows = rows[rows['district'] == district]
+    if constituency:
+        rows = rows[rows['constituency'] == constituency]
+    columns = BOOTH_KEY + ['booth_id', 'turnout_percentage', 'votes_polled', 'winner_party', 'margin']
+    merged = rows.loc[rows['year'] == year1, columns].merge(
+        rows.loc[rows['year'] == year2, columns], on=BOOTH_KEY, suffixes=('_1', '_2'))
+    return merged.sort_values(BOOTH_KEY, kind='stable').reset_index(drop=True)
+
+
+@pytest.mark.parametrize('year1, year2', YEAR_PAIRS)
+@pytest.mark.parametrize('district, constituency', AREAS)
+def test_compare_matches_a_merge(swing, booth_tables, year1, year2, district, constituency):
+    compared = swing.compare(year1, year2, district, constituency)
+    plain = plain_compare(booth_tables.booths, year1, year2, district, constituency)
+    assert len(compared) == len(plain)
+    for col in BOOTH_KEY:
+        assert (compared[col].to_numpy() == plain[col].to_numpy()).all(), col
+    assert (compared[f'booth_id_{year1}'].to_numpy() == plain['booth_id_1'].to_numpy()).all()
+    assert (compared[f'booth_id_{year2}'].to_numpy() == plain['booth_id_2'].to_numpy()).all()
+    turnout_change = (plain['turnout_percentage_2'] - plain['turnout_percentage_1']).round(1)
+    assert np.allclose(compared['turnout_change'].to_numpy(), turnout_change.to_numpy())
+    assert (compared['polled_change'].to_numpy() ==
+            (plain['votes_polled_2'].astype(np.int64) - plain['votes_polled_1']).to_numpy()).all()
+    assert (compared['margin_change'].to_numpy() ==
+            (plain['margin_2'].astype(np.int64) - plain['margin_1']).to_numpy()).all()
+    assert (compared[f'winner_{year1}'].to_numpy() == plain['winner_party_1'].to_numpy()).all()
+    assert (compared['winner_changed'].to_numpy() ==
+            (plain['winner_party_1'] != plain['winner_party_2']).to_numpy()).all()
+
+
+def test_booths_missing_from_a_year_are_left_out(booth_tables):
+    booths = booth_tables.booths
+    dropped = booths[(booths['year'] == 2024) & (booths['constituency'] == 'Chavara')].index[:1]
+    swing = BoothSwing(booths.drop(dropped))
+    plain = plain_compare(booths.drop(dropped), 2023, 2024)
+    compared = swing.compare(2023, 2024)
+    assert len(compared) == len(plain) == len(BoothSwing(booths).compare(2023, 2024)) - 1
+    assert (compared['booth_id_2023'].to_numpy() == plain['booth_id_1'].to_numpy()).all()
+    # The 2023 and 2025 booths are still aligned through their key.
+    assert len(swing.compare(2023, 2025)) == len(BoothSwing(booths).compare(2023, 2025))
+
+
+def test_derived_serials_match_the_recorded_ones(booth_tables):
+    booths = booth_tables.booths
+    assert (booth_serials(booths) == booths['booth_serial'].to_numpy()).all()
+    shuffled = booths.sample(frac=1, random_state=0).drop(columns='booth_serial')
+    pd.testing.assert_frame_equal(BoothSwing(shuffled).compare(2023, 2025), BoothSwing(booths).compare(2023, 2025),
+                                  check_dtype=False)
@@ -0,0 +1,79 @@
+import pandas as pd
+import pytest
+
+from careers import CAREER_COLUMNS, CandidateIndex, career_frame
+from utils import compact_frame
+
+CONTEST = ['year', 'district', 'constituency']
+
+
+@pytest.fixture(scope='module')
+def careers(results):
+    return career_frame(results)
+
+
+@pytest.fixture(scope='module')
+def index(careers):
+    return CandidateIndex(careers)
+
+
+def test_ranks_shares_and_deficits_match_pandas(careers, raw_results):
+    plain = raw_results.copy()
+    contests = plain.groupby(CONTEST)['votes']
+    plain['rank'] = contests.rank(method='first', ascending=False).astype(int)
+    plain['share'] = (plain['votes'] / contests.transform('sum') * 100).round(2)
+    plain['deficit'] = contests.transform('max') - plain['votes']
+    key = CONTEST + ['candidate', 'party']
+    merged = careers.astype({col: str for col in ['district', 'constituency', 'candidate', 'party']}).merge(
+        plain, on=key, suffixes=('', '_plain'))
+    assert len(merged) == len(raw_results) == len(careers)
+    assert list(careers.columns) == CAREER_COLUMNS
+    assert (merged['votes'] == merged['votes_plain']).all()
+    assert (merged['winner'] == (merged['winner_plain'] == 'Yes')).all()
+    assert (merged['share'] - merged['share_plain']).abs().max() < 1e-9
+    assert (merged['deficit'] == merged['deficit_plain']).all()
+    # Ties in votes may be ranked either way round; everywhere else the ranks agree.
+    tied = merged.duplicated(CONTEST + ['votes'], keep=False)
+    assert (merged.loc[~tied, 'rank'] == merged.loc[~tied, 'rank_plain']).all()
+
+
+def test_every_identity_is_one_contiguous_slice_in_year_order(careers, index, raw_results):
+    for name in raw_results['candidate'].unique():
+        for key in index.identities(name):
+            career = index.career(*key)
+            assert not career.empty
+            assert career['year'].is_monotonic_increasing
+            assert (career['candidate'].astype(str) == name).all()
+    assert sum(len(index.career(name)) for name in raw_results['candidate'].unique()) == len(careers)
+
+
+def test_contests_match_a_filtered_frame(index, raw_results):
+    for (name, party), rows in raw_results.groupby(['candidate', 'party']):
+        contests = index.contests(name, party=party)
+        assert sorted(zip(contests['year'], contests['constituency'].astype(str))) == \
+            sorted(zip(rows['year'], rows['constituency']))
+        for year in rows['year'].unique():
+            assert len(index.contests(name, year=year, party=party)) == (rows['year'] == year).sum()
+
+
+def test_a_candidate_who_moves_district_keeps_one_home():
+    raw = pd.DataFrame({
+        'year': [2023, 2023, 2024, 2024, 2025, 2025, 2025, 2024, 2024],
+        'district': ['Kollam', 'Kollam', 'Kollam', 'Kannur', 'Kannur', 'Kannur', 'Idukki', 'Kollam', 'Kannur'],
+        'constituency': ['Chavara', 'Chavara', 'Chavara', 'Thalassery', 'Thalassery', 'Thalassery', 'Peermade',
+                         'Chavara', 'Thalassery'],
+        'candidate': ['Anil', 'Biju', 'Biju', 'Anil', 'Anil', 'Biju', 'Anil', 'Cyril', 'Cyril'],
+        'party': ['INC', 'CPI', 'CPI', 'INC', 'INC', 'CPI', 'BJP', 'BJP', 'BJP'],
+        'votes': [500, 400, 450, 300, 350, 200, 100, 50, 40],
+        'winner': ['Yes', 'No', 'Yes', 'Yes', 'Yes', 'No', 'Yes', 'No', 'No'],
+    })
+    index = CandidateIndex(career_frame(compact_frame(raw)))
+    # Anil (INC) stood in Kollam once and Kannur twice; Biju (CPI) mostly in Kollam.
+    assert index.identities('Anil') == [('Anil', 'BJP', 'Idukki'), ('Anil', 'INC', 'Kannur')]
+    assert index.identities('Biju') == [('Biju', 'CPI', 'Kollam')]
+    anil = index.career('Anil', 'INC')
+    assert list(anil['year']) == [2023, 2024, 2025]
+    assert list(anil['district'].astype(str)) == ['Kollam', 'Kannur', 'Kannur']
+    assert list(index.career('Biju', 'CPI', 'Kollam')['district'].astype(str)) == ['Kollam', 'Kollam', 'Kannur']
+    # Two Cyrils of one party standing in the same year are namesakes, told apart by district.
+    assert index.identities('Cyril') == [('Cyril', 'BJP', 'Kannur'), ('Cyril', 'BJP', 'Kollam')]
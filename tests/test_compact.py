@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from utils import KERALA_DISTRICTS, category_dtype, compact_frame
+
+
+def test_values_match_the_plain_csv(raw_results, results):
+    assert list(results.columns) == list(raw_results.columns)
+    pd.testing.assert_index_equal(results.index, raw_results.index)
+    for col in raw_results.columns:
+        if col == 'winner':
+            assert (results[col] == (raw_results[col] == 'Yes')).all()
+        else:
+            assert (results[col].astype(raw_results[col].dtype).to_numpy() == raw_results[col].to_numpy()).all()
+
+
+def test_columns_are_compact(raw_results, results):
+    for col in ['district', 'constituency', 'party']:
+        assert isinstance(results[col].dtype, pd.CategoricalDtype)
+    assert results['winner'].dtype == bool
+    assert results['year'].dtype.itemsize < raw_results['year'].dtype.itemsize
+    # Vote counts keep at least 32 bits.
+    assert results['votes'].dtype.itemsize >= 4
+    memory = results.attrs['memory']
+    assert memory['after'] < memory['before'] == raw_results.memory_usage(deep=True).sum()
+
+
+def test_district_categories_follow_the_state_order(results):
+    categories = list(results['district'].cat.categories)
+    assert categories == [d for d in KERALA_DISTRICTS if d in categories]
+
+
+def test_category_order_does_not_depend_on_row_order(raw_results):
+    shuffled = raw_results.sample(frac=1, random_state=0)
+    for col in ['constituency', 'party']:
+        assert category_dtype(shuffled[col]) == category_dtype(raw_results[col])
+    pd.testing.assert_frame_equal(compact_frame(shuffled).loc[raw_results.index], compact_frame(raw_results))
+
+
+def test_near_unique_strings_stay_strings():
+    frame = pd.DataFrame({'candidate': [f'Candidate {i}' for i in range(10)], 'votes': np.arange(10) * 1000})
+    compact = compact_frame(frame)
+    assert not isinstance(compact['candidate'].dtype, pd.CategoricalDtype)
+    assert compact['votes'].dtype == np.int32
@@ -0,0 +1,131 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from counting import CONTEST_KEY, CountingFeed, CountingState
+
+CANDIDATES = [('Suresh', 'CPI'), ('Rajan', 'INC'), ('Meera', 'BJP')]
+ROUNDS = 6
+
+
+@pytest.fixture(scope='module')
+def rounds():
+    """Counting rows for three constituencies; one reports only from round 3."""
+    rng = np.random.default_rng(11)
+    rows = []
+    for round_no in range(1, ROUNDS + 1):
+        for constituency in ['Nemom', 'Kovalam', 'Attingal']:
+            if constituency == 'Attingal' and round_no < 3:
+                continue
+            for candidate, party in CANDIDATES:
+                rows.append((round_no, 'Thiruvananthapuram', constituency, candidate, party,
+                             int(rng.integers(0, 3000))))
+    return pd.DataFrame(rows, columns=['round'] + CONTEST_KEY + ['candidate', 'party', 'votes'])
+
+
+def pandas_status(rows, round_no):
+    """Leader, runner-up, margin and total per contest from the rows up to a round."""
+    counted = rows[rows['round'] <= round_no]
+    totals = counted.groupby(CONTEST_KEY + ['candidate', 'party'], as_index=False)['votes'].sum()
+    totals = totals.sort_values(CONTEST_KEY + ['votes', 'candidate', 'party'],
+                                ascending=[True, True, False, True, True])
+    status = []
+    for (district, constituency), contest in totals.groupby(CONTEST_KEY, sort=True):
+        leader, runner_up = contest.iloc[0], contest.iloc[1]
+        status.append({'district': district, 'constituency': constituency,
+                       'round': int(counted.loc[counted['constituency'] == constituency, 'round'].max()),
+                       'leader': leader['candidate'], 'leader_party': leader['party'],
+                       'runner_up': runner_up['candidate'], 'margin': int(leader['votes'] - runner_up['votes']),
+                       'total_votes': int(contest['votes'].sum())})
+    return pd.DataFrame(status)
+
+
+def assert_matches_pandas(state, rows):
+    for round_no in range(1, ROUNDS + 1):
+        expected = pandas_status(rows, round_no)
+        status = state.as_of(round_no)[expected.columns]
+        pd.testing.assert_frame_equal(status, expected, check_dtype=False)
+
+
+def test_status_as_of_every_round_matches_pandas(rounds):
+    state = CountingState()
+    for round_no in range(1, ROUNDS + 1):
+        state.apply(rounds[rounds['round'] == round_no])
+    assert_matches_pandas(state, rounds)
+    leads = state.leads().set_index('party')['leading']
+    assert leads.to_dict() == pandas_status(rounds, ROUNDS)['leader_party'].value_counts().to_dict()
+
+
+def test_late_and_split_rounds_give_the_same_history(rounds):
+    in_order = CountingState()
+    in_order.apply(rounds)
+    late = CountingState()
+    for round_no in [1, 3, 2, 5, 6, 4]:
+        late.apply(rounds[rounds['round'] == round_no])
+        late.as_of(2)
+    split = CountingState()
+    for round_no in range(1, ROUNDS + 1):
+        batch = rounds[rounds['round'] == round_no]
+        split.apply(batch.iloc[::2])
+        split.apply(batch.iloc[1::2])
+    assert_matches_pandas(late, rounds)
+    for round_no in range(1, ROUNDS + 1):
+        pd.testing.assert_frame_equal(late.as_of(round_no), in_order.as_of(round_no))
+        pd.testing.assert_frame_equal(split.as_of(round_no), in_order.as_of(round_no))
+
+
+def test_frames_are_cached_until_the_state_changes(rounds):
+    state = CountingState()
+    state.apply(rounds[rounds['round'] == 1])
+    first = state.as_of()
+    assert state.as_of() is first
+    state.apply(rounds[rounds['round'] == 2])
+    assert state.as_of(1) is not first
+    pd.testing.assert_frame_equal(state.as_of(1), first)
+
+
+def test_feed_reads_only_complete_lines(tmp_path, rounds):
+    path = tmp_path / 'count.csv'
+    text = rounds.to_csv(index=False)
+    cut = text.index('\n', len(text) // 2) + 5
+    path.write_text(text[:cut])
+    feed = CountingFeed(path)
+    first = pd.concat(feed.poll())
+    with open(path, 'a') as f:
+        f.write(text[cut:])
+    second = pd.concat(feed.poll())
+    assert feed.poll() == []
+    pd.testing.assert_frame_equal(pd.concat([first, second], ignore_index=True), rounds)
+
+
+def test_drop_directory_retries_files_that_do_not_parse(tmp_path, rounds):
+    feed = CountingFeed(tmp_path)
+    (tmp_path / 'round1.csv').write_text("")
+    assert feed.poll() == []
+    (tmp_path / 'round1.csv').write_text("round,district\n1,Kollam\n2,Kollam,extra,fields\n")
+    assert feed.poll() == []
+    rounds.to_csv(tmp_path / 'round1.csv', index=False)
+    pd.testing.assert_frame_equal(pd.concat(feed.poll()), rounds)
+    assert feed.poll() == []
+
+
+def test_rows_without_votes_are_left_out(rounds):
+    with_blanks = rounds.astype({'votes': object})
+    with_blanks.loc[[0, 5], 'votes'] = [None, '']
+    state, expected = CountingState(), CountingState()
+    state.apply(with_blanks)
+    expected.apply(rounds.drop(index=[0, 5]))
+    for round_no in range(1, ROUNDS + 1):
+        pd.testing.assert_frame_equal(state.as_of(round_no), expected.as_of(round_no))
+
+
+def test_concurrent_batches_without_rounds_get_their_own_rounds(rounds):
+    import threading
+    state = CountingState()
+    batch = rounds[rounds['round'] == 1].drop(columns='round')
+    threads = [threading.Thread(target=state.apply, args=(batch,)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(entry['round'] for entry in state.rounds) == list(range(1, 9))
@@ -0,0 +1,71 @@
+import pandas as pd
+import pytest
+
+from cube import PartyCube, party_cube_frame
+
+
+@pytest.fixture(scope='module')
+def cube(results):
+    return PartyCube(party_cube_frame(results))
+
+
+def plain_tally(raw, year=None, district=None):
+    """Per-party seats, votes, contested seats and vote share from boolean masks and a groupby."""
+    rows = raw
+    if year is not None:
+        rows = rows[rows['year'] == year]
+    if district is not None:
+        rows = rows[rows['district'] == district]
+    parties = rows.groupby('party')
+    tally = pd.DataFrame({
+        'seats': parties['winner'].apply(lambda won: int((won == 'Yes').sum())),
+        'votes': parties['votes'].sum(),
+        'contested': rows.drop_duplicates(['year', 'district', 'constituency', 'party']).groupby('party').size(),
+    })
+    tally['vote_share'] = tally['votes'] / rows['votes'].sum() * 100
+    return tally
+
+
+AREAS = [(None, None), (2024, None), (None, 'Kollam'), (2023, 'Thiruvananthapuram'), (2025, 'Kottayam')]
+
+
+@pytest.mark.parametrize('year, district', AREAS)
+def test_slices_match_pandas(cube, raw_results, year, district):
+    tally = cube.slice(year, district)
+    plain = plain_tally(raw_results, year, district)
+    assert sorted(tally['party']) == sorted(plain.index)
+    keyed = tally.set_index('party').loc[plain.index]
+    for col in ['seats', 'votes', 'contested']:
+        assert (keyed[col].to_numpy() == plain[col].to_numpy()).all(), col
+    assert (keyed['vote_share'] - plain['vote_share']).abs().max() < 1e-9
+    # Most seats first, then most votes.
+    ordered = tally.sort_values(['seats', 'votes'], ascending=False, kind='stable')
+    assert list(ordered['party']) == list(tally['party'])
+
+
+@pytest.mark.parametrize('year, district', AREAS)
+def test_party_lookups_match_the_slices(cube, raw_results, year, district):
+    tally = cube.slice(year, district).set_index('party')
+    for party in raw_results['party'].unique():
+        found = cube.party(party, year, district)
+        if party not in tally.index:
+            assert found is None
+            continue
+        row = tally.loc[party]
+        assert (found['seats'], found['votes'], found['contested']) == (row['seats'], row['votes'], row['contested'])
+        assert found['vote_share'] == pytest.approx(row['vote_share'])
+
+
+def test_unknown_areas_are_empty(cube):
+    assert cube.slice(1999).empty and cube.slice(2024, 'Nowhere').empty and cube.slice(2024, 'Kasaragod').empty
+    assert cube.party('BJP', 1999) is None and cube.party('No Party') is None
+
+
+def test_party_with_two_candidates_in_a_seat_contests_it_once(results):
+    seat = results.iloc[[0]].copy()
+    doubled = pd.concat([results, seat.assign(winner=False)], ignore_index=True)
+    cube, base = PartyCube(party_cube_frame(doubled)), PartyCube(party_cube_frame(results))
+    party, year, district = str(seat['party'].iloc[0]), int(seat['year'].iloc[0]), str(seat['district'].iloc[0])
+    found, expected = cube.party(party, year, district), base.party(party, year, district)
+    assert found['contested'] == expected['contested']
+    assert (found['seats'], found['votes']) == (expected['seats'], expected['votes'] + int(seat['votes'].iloc[0]))
@@ -0,0 +1,119 @@
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from datastore import cached_read_csv, read_only_view, shared_frames, sidecar_path
+from utils import DATA_PATH, compact_frame
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / 'results.csv'
+    shutil.copy(DATA_PATH, path)
+    return path
+
+
+def in_memory(frame):
+    """``frame`` with its memory-mapped columns read into plain arrays, dtypes unchanged."""
+    columns = {}
+    for col in frame.columns:
+        values = frame[col].array
+        if isinstance(values, pd.Categorical):
+            columns[col] = pd.Categorical.from_codes(np.array(values.codes), dtype=values.dtype)
+        else:
+            columns[col] = np.array(values)
+    return pd.DataFrame(columns, index=frame.index)
+
+
+def is_mapped(array):
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = array.base
+    return False
+
+
+def assert_same_frame(loaded, expected):
+    pd.testing.assert_frame_equal(in_memory(loaded), expected, check_index_type=False)
+
+
+def test_cached_read_matches_pandas(csv_path, results):
+    first = cached_read_csv(csv_path, prepare=compact_frame)
+    second = cached_read_csv(csv_path, prepare=compact_frame)
+    assert (first.attrs['load']['source'], second.attrs['load']['source']) == ('csv', 'cache')
+    assert_same_frame(first, results)
+    assert_same_frame(second, results)
+    assert second.attrs['memory'] == results.attrs['memory']
+
+
+def test_a_touched_but_unchanged_csv_reuses_the_cache(csv_path):
+    cached_read_csv(csv_path, prepare=compact_frame)
+    stat = os.stat(csv_path)
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert cached_read_csv(csv_path, prepare=compact_frame).attrs['load']['source'] == 'cache'
+    # The refreshed fingerprint is trusted on the next read without hashing again.
+    assert cached_read_csv(csv_path, prepare=compact_frame).attrs['load']['source'] == 'cache'
+
+
+def test_an_edited_csv_rebuilds_the_cache(csv_path, raw_results):
+    cached_read_csv(csv_path, prepare=compact_frame)
+    votes = int(raw_results.loc[0, 'votes'])
+    stat = os.stat(csv_path)
+    # A same-size edit, so only the content hash can tell.
+    edited = csv_path.read_bytes().replace(f',{votes},'.encode(), f',{votes + 1},'.encode(), 1)
+    assert len(edited) == stat.st_size
+    csv_path.write_bytes(edited)
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    reloaded = cached_read_csv(csv_path, prepare=compact_frame)
+    assert reloaded.attrs['load']['source'] == 'csv'
+    assert int(reloaded.loc[0, 'votes']) == votes + 1
+    assert cached_read_csv(csv_path, prepare=compact_frame).attrs['load']['source'] == 'cache'
+
+
+def test_a_broken_sidecar_is_rebuilt(csv_path, results):
+    cached_read_csv(csv_path, prepare=compact_frame)
+    (sidecar_path(csv_path) / 'meta.json').write_text('{')
+    reloaded = cached_read_csv(csv_path, prepare=compact_frame)
+    assert reloaded.attrs['load']['source'] == 'csv'
+    assert_same_frame(reloaded, results)
+
+
+def test_shared_frames_are_published_once_per_version(tmp_path, results, booth_tables):
+    builds = []
+
+    def build():
+        builds.append(1)
+        return {'results': results, 'booths': booth_tables.booths}
+
+    first = shared_frames('election', 'v1', build, root=tmp_path)
+    second = shared_frames('election', 'v1', build, root=tmp_path)
+    assert len(builds) == 1
+    for frames in (first, second):
+        assert_same_frame(frames['results'], results)
+        assert_same_frame(frames['booths'], booth_tables.booths.reset_index(drop=True))
+    # Attached columns are read-only maps of the published files, not private copies.
+    votes = first['results']['votes'].to_numpy()
+    assert is_mapped(votes) and not votes.flags.writeable
+
+    shared_frames('election', 'v2', build, root=tmp_path)
+    assert len(builds) == 2
+    assert sorted(path.name for path in tmp_path.iterdir() if path.is_dir()) == ['election-v2']
+
+
+def test_views_share_the_columns_and_keep_edits_to_themselves(tmp_path, results):
+    shared = shared_frames('election', 'v1', lambda: {'results': results}, root=tmp_path)['results']
+    view = read_only_view(shared)
+    assert np.shares_memory(view['votes'].to_numpy(), shared['votes'].to_numpy())
+
+    view.loc[0, 'votes'] = -1
+    view['margin'] = 0
+    view.attrs['edited'] = True
+    view.drop(columns='party', inplace=True)
+    assert int(shared.loc[0, 'votes']) == int(results.loc[0, 'votes'])
+    assert 'margin' not in shared.columns and 'party' in shared.columns
+    assert 'edited' not in shared.attrs
+    assert_same_frame(shared, results)
+    assert_same_frame(read_only_view(shared), results)
@@ -0,0 +1,70 @@
+import random
+import string
+
+import pytest
+
+from fuzzy import FuzzyIndex, edit_budget, edit_distance
+
+
+def reference_distance(a, b):
+    """Full optimal string alignment table, no banding or early exit."""
+    table = [[i + j if not i * j else 0 for j in range(len(b) + 1)] for i in range(len(a) + 1)]
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            table[i][j] = min(table[i - 1][j] + 1, table[i][j - 1] + 1, table[i - 1][j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                table[i][j] = min(table[i][j], table[i - 2][j - 2] + 1)
+    return table[len(a)][len(b)]
+
+
+def brute_force_lookup(names, word):
+    """Closest name within the word's edit budget: fewest edits, then closest length, then first listed."""
+    word = word.lower().strip()
+    keys = list(dict.fromkeys(name.lower() for name in names))
+    originals = {}
+    for name in names:
+        originals.setdefault(name.lower(), name)
+    if word in originals:
+        return originals[word]
+    budget = edit_budget(len(word))
+    ranked = [(reference_distance(word, key), abs(len(key) - len(word)), position)
+              for position, key in enumerate(keys)]
+    ranked = [rank for rank in ranked if 0 < budget and rank[0] <= budget]
+    return originals[keys[min(ranked)[2]]] if ranked else None
+
+
+def typo(rng, word):
+    for _ in range(rng.randint(1, 2)):
+        i = rng.randrange(len(word))
+        edit = rng.choice(['insert', 'delete', 'replace', 'swap'])
+        if edit == 'insert':
+            word = word[:i] + rng.choice(string.ascii_lowercase) + word[i:]
+        elif edit == 'delete' and len(word) > 1:
+            word = word[:i] + word[i + 1:]
+        elif edit == 'replace':
+            word = word[:i] + rng.choice(string.ascii_lowercase) + word[i + 1:]
+        elif i + 1 < len(word):
+            word = word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    return word
+
+
+def test_edit_distance_matches_the_full_table():
+    rng = random.Random(2)
+    for _ in range(2000):
+        a = "".join(rng.choices("abcde", k=rng.randint(0, 9)))
+        b = "".join(rng.choices("abcde", k=rng.randint(0, 9)))
+        expected = reference_distance(a, b)
+        for limit in (1, 2, 3):
+            assert edit_distance(a, b, limit) == (expected if expected <= limit else limit + 1)
+
+
+@pytest.mark.parametrize('kind', ['district', 'constituency', 'candidate'])
+def test_lookup_matches_a_brute_force_scan(raw_results, kind):
+    names = list(dict.fromkeys(raw_results[kind].astype(str)))
+    index = FuzzyIndex(names)
+    rng = random.Random(len(names))
+    words = [typo(rng, name.lower()) for name in names for _ in range(8)]
+    words += ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 12))) for _ in range(200)]
+    words += [name.upper() for name in names]
+    for word in words:
+        assert index.lookup(word) == brute_force_lookup(names, word), word
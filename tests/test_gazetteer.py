@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from gazetteer import Gazetteer, tokenize
+
+KINDS = ['district', 'constituency', 'candidate', 'party']
+FILLER = ['who', 'won', 'in', 'the', '2024', 'votes', 'for', 'and', 'compare', 'with', 'margin', 'of']
+
+
+@pytest.fixture(scope='module')
+def entities(raw_results):
+    return {kind: list(dict.fromkeys(raw_results[kind].astype(str))) for kind in KINDS}
+
+
+def brute_force_find(entities, text):
+    """Longest name at each token, left to right, by trying every name."""
+    tokens = [token for token, _, _ in tokenize(text)]
+    names = {}
+    for kind, values in entities.items():
+        for name in values:
+            key = tuple(token for token, _, _ in tokenize(name))
+            names.setdefault(key, {}).setdefault(kind, name)
+    found, i = [], 0
+    while i < len(tokens):
+        matches = [key for key in names if tuple(tokens[i:i + len(key)]) == key]
+        if not matches:
+            i += 1
+            continue
+        longest = max(matches, key=len)
+        found.append(names[longest])
+        i += len(longest)
+    return found
+
+
+def test_find_matches_a_brute_force_scan(entities):
+    gazetteer = Gazetteer(entities)
+    rng = random.Random(5)
+    names = [name for values in entities.values() for name in values]
+    for _ in range(300):
+        words = rng.sample(FILLER, 3) + rng.sample(names, rng.randint(0, 3))
+        rng.shuffle(words)
+        text = " ".join(words)
+        assert [span.entities for span in gazetteer.find(text)] == brute_force_find(entities, text)
+
+
+def test_spans_point_at_the_mention():
+    gazetteer = Gazetteer({'party': ['CPI', 'CPIM', 'KC(M)'], 'constituency': ['Thiruvananthapuram'],
+                           'district': ['Thiruvananthapuram']})
+    text = "Did CPIM or kc m win Thiruvananthapuram, not CPI?"
+    spans = gazetteer.find(text)
+    assert [text[span.start:span.end] for span in spans] == ['CPIM', 'kc m', 'Thiruvananthapuram', 'CPI']
+    assert spans[1].entities == {'party': 'KC(M)'}
+    assert spans[2].entities == {'constituency': 'Thiruvananthapuram', 'district': 'Thiruvananthapuram'}
+    assert Gazetteer.first(spans, 'district') == 'Thiruvananthapuram'
+    assert Gazetteer.first(spans, 'candidate') is None
+    assert gazetteer.find("cpimx and xcpi") == []
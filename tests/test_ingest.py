@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import ingest
+from ingest import RESULT_KEYS, stream_ingest
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """Chunks of 25 rows, so a small CSV is read in many chunks."""
+    monkeypatch.setattr(ingest, 'MIN_CHUNK_ROWS', 25)
+    return 0.0001
+
+
+def split_votes_csv(raw, path):
+    """The CSV with every candidate's votes split over two rows far apart, in different chunks."""
+    first = raw.assign(votes=raw['votes'] // 2)
+    second = raw.assign(votes=raw['votes'] - raw['votes'] // 2, winner='No')
+    pd.concat([first, second], ignore_index=True).to_csv(path, index=False)
+
+
+def baseline(raw):
+    grouped = raw.groupby(RESULT_KEYS, sort=False)
+    expected = grouped['votes'].sum().rename('votes').reset_index()
+    expected['winner'] = grouped['winner'].apply(lambda flags: (flags == 'Yes').any()).to_numpy()
+    return expected
+
+
+def normalized(frame):
+    """Plain in-memory columns (memory-mapped ones included), sorted by the result keys."""
+    frame = pd.DataFrame({
+        **{key: frame[key].astype(str).to_numpy() for key in RESULT_KEYS},
+        'votes': np.array(frame['votes'], dtype=np.int64),
+        'winner': np.array(frame['winner'], dtype=bool),
+    })
+    return frame.sort_values(RESULT_KEYS).reset_index(drop=True)
+
+
+def test_stream_totals_match_pandas_groupby(raw_results, tmp_path, small_chunks):
+    csv_path = tmp_path / 'results.csv'
+    split_votes_csv(raw_results, csv_path)
+    ingested = stream_ingest(csv_path, small_chunks, store_dir=tmp_path / 'store')
+    assert ingested['chunks'] > 2
+    assert ingested['rows'] == 2 * len(raw_results)
+    pd.testing.assert_frame_equal(normalized(ingested['results']), normalized(baseline(raw_results)))
+
+
+def test_summary_totals_match_pandas(raw_results, tmp_path, small_chunks):
+    csv_path = tmp_path / 'results.csv'
+    raw_results.to_csv(csv_path, index=False)
+    summary = stream_ingest(csv_path, small_chunks, store_dir=tmp_path / 'store')['summary']
+    contest = ['year', 'district', 'constituency']
+    expected = raw_results.groupby(contest)['votes'].sum()
+    totals = {(int(year), str(district), str(constituency)): int(total) for year, district, constituency, total
+              in summary[contest + ['total_votes']].itertuples(index=False)}
+    assert totals == expected.to_dict()
+
+
+def test_unchanged_csv_reuses_the_store(raw_results, tmp_path, small_chunks):
+    csv_path = tmp_path / 'results.csv'
+    raw_results.to_csv(csv_path, index=False)
+    first = stream_ingest(csv_path, small_chunks, store_dir=tmp_path / 'store')
+    again = stream_ingest(csv_path, small_chunks, store_dir=tmp_path / 'store')
+    assert again['chunks'] == 0
+    pd.testing.assert_frame_equal(normalized(again['results']), normalized(first['results']))
+
+
+@pytest.mark.parametrize('column, value', [('votes', 'many'), ('votes', None), ('constituency', None)])
+def test_bad_rows_in_a_later_chunk_are_rejected(raw_results, tmp_path, small_chunks, column, value):
+    bad = raw_results.astype({column: object})
+    bad.loc[len(bad) - 3, column] = value
+    csv_path = tmp_path / 'results.csv'
+    bad.to_csv(csv_path, index=False)
+    with pytest.raises(ValueError):
+        stream_ingest(csv_path, small_chunks, store_dir=tmp_path / 'store')
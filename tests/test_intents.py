@@ -0,0 +1,51 @@
+import csv
+
+import pytest
+
+from benchmarks.bench_intents import QUERIES_PATH, keyword_chain
+from chatbot import ElectionChatbot
+from intents import ENTITY_BONUS, Intent, IntentClassifier
+
+
+@pytest.fixture(scope='module')
+def bot(results):
+    return ElectionChatbot(results)
+
+
+@pytest.fixture(scope='module')
+def labeled():
+    with open(QUERIES_PATH, newline='') as f:
+        return [(row['query'], row['intent']) for row in csv.DictReader(f)]
+
+
+def test_labeled_queries_beat_the_keyword_chain(bot, labeled):
+    classified = chained = 0
+    for query, intent in labeled:
+        frame = bot.parse(query)
+        slots = bot.extract_slots(frame)
+        ranked = bot.classify(frame, slots)
+        classified += (ranked[0].intent if ranked else 'none') == intent
+        chained += keyword_chain(frame.lower, slots) == intent
+    assert classified / len(labeled) >= 0.95
+    assert classified >= chained
+
+
+def test_scores_add_phrase_weights_and_the_entity_bonus():
+    classifier = IntentClassifier([
+        Intent('winner', {'who won': 1.0, 'winner': 1.0}, requires=('constituency',)),
+        Intent('margin', {'margin': 1.0, 'won by': 1.0}, requires=('constituency',)),
+        Intent('closest', {'closest': 1.5, 'closest margin': 1.5}),
+        Intent('district', {}, requires=('district',), base=0.1),
+    ])
+    assert classifier.scores("who won and what was the winner margin") == {'winner': 2.0, 'margin': 1.0}
+    # The longer phrase is read once, not also as "margin".
+    assert classifier.scores("closest margin") == {'closest': 1.5}
+
+    ranked = classifier.classify("margin or who won", {'constituency': 'Nemom', 'district': 'Kollam'})
+    assert [match.intent for match in ranked] == ['winner', 'margin', 'district']
+    assert ranked[0].score == 1.0 + ENTITY_BONUS and ranked[2].score == 0.1
+    assert sum(match.confidence for match in ranked) == pytest.approx(1.0)
+
+    ranked = classifier.classify("who won", {})
+    assert [(match.intent, match.missing) for match in ranked] == [('winner', ('constituency',))]
+    assert classifier.classify("hello there", {}) == []
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from leaderboard import LEADERBOARDS, Leaderboard, build_leaderboards
+from summary import constituency_summary
+
+TIES = {'contests': ['constituency', 'year'], 'booths': ['booth_id', 'year']}
+SCOPES = [(None, None), (2024, None), (None, 'Kollam'), (2023, 'Thiruvananthapuram'), (1999, None)]
+
+
+@pytest.fixture(scope='module')
+def sources(results, booth_tables):
+    summary = constituency_summary(results)
+    return {'contests': summary[summary['candidates'] >= 2].reset_index(drop=True),
+            'booths': booth_tables.booths.reset_index(drop=True)}
+
+
+@pytest.fixture(scope='module')
+def boards(results, booth_tables):
+    return build_leaderboards(constituency_summary(results), booth_tables.booths)
+
+
+def plain_top(frame, column, ties, k, year, district, largest):
+    """Top-k rows from boolean masks and a full stable sort."""
+    rows = frame
+    if year is not None:
+        rows = rows[rows['year'] == year]
+    if district is not None:
+        rows = rows[rows['district'].astype(str) == district]
+    keys = rows[[column]].assign(**{tie: rows[tie].astype(str) if not pd.api.types.is_numeric_dtype(rows[tie])
+                                    else rows[tie] for tie in ties})
+    order = keys.sort_values([column] + ties, ascending=[not largest] + [True] * len(ties), kind='stable',
+                             na_position='last').index
+    return rows.loc[order[:k]].reset_index(drop=True)
+
+
+@pytest.mark.parametrize('name', list(LEADERBOARDS))
+@pytest.mark.parametrize('year, district', SCOPES)
+@pytest.mark.parametrize('largest', [True, False])
+def test_top_matches_a_full_sort(boards, sources, name, year, district, largest):
+    source, column, _, _ = LEADERBOARDS[name]
+    for k in (1, 5, 50):
+        top = boards[name].top(k, year, district, largest)
+        expected = plain_top(sources[source], column, TIES[source], k, year, district, largest)
+        assert list(top['rank']) == list(range(1, len(expected) + 1))
+        pd.testing.assert_frame_equal(top.drop(columns='rank'), expected)
+
+
+def test_missing_values_rank_last_and_ties_keep_row_order():
+    frame = pd.DataFrame({'year': [2024] * 5, 'district': ['Kollam'] * 5, 'row': range(5),
+                          'value': [2.0, np.nan, 5.0, 2.0, 5.0]})
+    board = Leaderboard(frame, 'value')
+    assert board.top(5)['row'].tolist() == [2, 4, 0, 3, 1]
+    assert board.top(5, largest=False)['row'].tolist() == [0, 3, 2, 4, 1]
+    assert board.top(0).empty and board.top(2, district='Kannur').empty
@@ -0,0 +1,65 @@
+import csv
+import re
+
+import pytest
+
+import chatbot
+from benchmarks.bench_intents import QUERIES_PATH
+from chatbot import ElectionChatbot
+from query import parse_query
+
+EXTRACTORS = ['extract_year', 'extract_location', 'extract_candidate', 'extract_party', 'extract_booth',
+              'extract_count', 'extract_swing']
+
+
+@pytest.fixture(scope='module')
+def bot(results, booth_tables):
+    return ElectionChatbot(results, booth_tables, cache_size=0)
+
+
+@pytest.fixture(scope='module')
+def queries(bot):
+    with open(QUERIES_PATH, newline='') as f:
+        labeled = [row['query'] for row in csv.DictReader(f)]
+    return labeled + bot.get_example_questions() + [
+        'Show booth id 1042 in 2023', 'top 500 margins', 'top 0 turnout booths', 'BJP gains 3.5 points',
+        'What if CPI loses 2% in Kollam?', '  NEMOM winner 2024  ', '',
+    ]
+
+
+def test_frame_matches_the_plain_patterns(bot, queries):
+    for query in queries:
+        frame = parse_query(query, bot.gazetteer)
+        lower = query.lower().strip()
+        assert frame.lower == lower
+        assert frame.years == tuple(int(y) for y in re.findall(r'\b((?:19|20)\d\d)\b', query))
+        assert frame.booth_ids == tuple(int(b) for b in re.findall(r'booth\s*(?:id\s*)?(\d+)', lower))
+        count = re.search(r'\btop\s+(\d+)\b', lower)
+        assert frame.count == (min(max(int(count.group(1)), 1), 50) if count else None)
+        assert frame.spans == tuple(bot.gazetteer.find(lower))
+        for kind in ['district', 'constituency', 'candidate', 'party']:
+            assert frame.entity(kind) == next((s.entities[kind] for s in frame.spans if kind in s.entities), None)
+
+
+def test_extractors_read_a_frame_like_the_text(bot, queries):
+    for query in queries:
+        frame = bot.parse(query)
+        assert bot.parse(frame) is frame
+        for name in EXTRACTORS:
+            extract = getattr(bot, name)
+            assert extract(frame) == extract(query), (name, query)
+        assert bot.extract_slots(frame) == bot.extract_slots(query), query
+
+
+def test_each_query_is_parsed_once(bot, queries, monkeypatch):
+    parsed = []
+
+    def counting_parse(text, gazetteer):
+        parsed.append(text)
+        return parse_query(text, gazetteer)
+
+    monkeypatch.setattr(chatbot, 'parse_query', counting_parse)
+    for query in queries:
+        parsed.clear()
+        bot.process_query(query)
+        assert parsed == [query]
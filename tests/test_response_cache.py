@@ -0,0 +1,76 @@
+import random
+from collections import OrderedDict
+
+import pytest
+
+from benchmarks.bench_response_cache import PARAPHRASES
+from chatbot import ElectionChatbot
+from response_cache import MISSING, ResponseCache, cache_key
+
+
+def test_eviction_matches_a_reference_lru():
+    rng = random.Random(4)
+    cache, reference = ResponseCache(max_size=8), OrderedDict()
+    for _ in range(3000):
+        key = rng.randrange(20)
+        if rng.random() < 0.5:
+            expected = reference.get(key, MISSING)
+            if expected is not MISSING:
+                reference.move_to_end(key)
+            assert cache.get(key) is expected
+        else:
+            value = object()
+            cache.put(key, value)
+            reference[key] = value
+            reference.move_to_end(key)
+            while len(reference) > 8:
+                reference.popitem(last=False)
+        assert list(cache._entries) == list(reference)
+
+
+def test_versions_none_answers_and_disabled_cache():
+    cache = ResponseCache(max_size=4, version='a')
+    cache.put('q', None, 'a')
+    assert cache.get('q', 'a') is None
+    assert cache.get('q', 'b') is MISSING
+    assert len(cache) == 0 and cache.version == 'b'
+    disabled = ResponseCache(max_size=0)
+    disabled.put('q', 'answer')
+    assert disabled.get('q') is MISSING
+    assert cache_key('winner', {'year': 2024, 'district': 'Kollam'}, ('year', 'constituency')) == \
+        ('winner', 2024, None)
+
+
+@pytest.fixture(scope='module')
+def bots(results, booth_tables):
+    return ElectionChatbot(results, booth_tables, data_version='v1'), ElectionChatbot(results, booth_tables,
+                                                                                       cache_size=0)
+
+
+def test_cached_answers_match_uncached_answers(bots):
+    cached, uncached = bots
+    questions = cached.get_example_questions() + PARAPHRASES
+    for _ in range(2):
+        for question in questions:
+            assert cached.process_query(question) == uncached.process_query(question), question
+    stats = cached.cache.stats()
+    assert stats['hits'] >= len(questions)
+    assert uncached.cache.stats()['size'] == 0
+
+
+def test_a_changed_csv_rebuilds_the_cached_engines(monkeypatch, tmp_path):
+    import utils
+    monkeypatch.setenv('POLLYTICS_SHARED_DIR', str(tmp_path))
+    version = ['a']
+    monkeypatch.setattr(utils, 'election_data_version', lambda: version[0])
+    monkeypatch.setattr(utils, '_election_version', None)
+    utils.refresh_election_data()
+    utils.load_election_frames.clear()
+    cube, swing = utils.get_party_cube(), utils.get_swing_engine()
+    utils.refresh_election_data()
+    assert utils.get_party_cube() is cube and utils.get_swing_engine() is swing
+    version[0] = 'b'
+    utils.refresh_election_data()
+    assert utils.get_party_cube() is not cube and utils.get_swing_engine() is not swing
+    version[0] = 'a'
+    utils.refresh_election_data()
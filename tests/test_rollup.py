@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from booths import BoothTables
+from rollup import ROLLUP_MEASURES, BoothRollup, _grow
+
+LEVELS = ['year', 'district', 'constituency']
+
+
+def expected_totals(tables, keys):
+    """Booth measures and per-party votes summed with a pandas groupby."""
+    booths = tables.booths.astype({'district': str, 'constituency': str})
+    measures = booths.groupby(keys).agg(booths=('booth_id', 'size'), total_voters=('total_voters', 'sum'),
+                                        votes_polled=('votes_polled', 'sum'), postal_votes=('postal_votes', 'sum'),
+                                        tendered_votes=('tendered_votes', 'sum'))
+    candidates = tables.results.merge(booths[['booth_key'] + keys], on='booth_key')
+    party_votes = candidates.astype({'party': str}).groupby(keys + ['party'])['votes'].sum()
+    return measures, party_votes
+
+
+def assert_matches(rollup, tables):
+    for depth in range(1, len(LEVELS) + 1):
+        keys = LEVELS[:depth]
+        measures, party_votes = expected_totals(tables, keys)
+        for key, row in measures.iterrows():
+            key = key if isinstance(key, tuple) else (key,)
+            node = rollup.node(*key)
+            assert {measure: node[measure] for measure in ROLLUP_MEASURES} == row.to_dict()
+            assert node['turnout'] == round(row['votes_polled'] / row['total_voters'] * 100, 1)
+            expected_parties = party_votes.loc[key]
+            assert node['party_votes'] == expected_parties[expected_parties > 0].to_dict()
+
+
+@pytest.fixture(scope='module')
+def rollup(booth_tables):
+    return BoothRollup.from_tables(booth_tables)
+
+
+def test_nodes_match_pandas_groupby(rollup, booth_tables):
+    assert_matches(rollup, booth_tables)
+    assert rollup.node(1999) is None
+
+
+def test_children_match_pandas_groupby(rollup, booth_tables):
+    year = int(booth_tables.booths['year'].iloc[0])
+    measures, _ = expected_totals(booth_tables, ['year', 'district'])
+    children = rollup.children(year).set_index('district')
+    expected = measures.loc[year]
+    assert sorted(children.index) == sorted(expected.index)
+    pd.testing.assert_frame_equal(children.loc[expected.index, ROLLUP_MEASURES], expected,
+                                  check_dtype=False, check_names=False)
+
+
+def batch(tables, booth_rows):
+    booths = tables.booths.iloc[booth_rows]
+    results = tables.results[tables.results['booth_key'].isin(booths['booth_key'])]
+    return BoothTables(booths, results)
+
+
+def test_incremental_updates_match_a_full_build(booth_tables):
+    half = len(booth_tables.booths) // 2
+    rollup = BoothRollup()
+    rollup.update(batch(booth_tables, slice(half, None)))
+    rollup.update(batch(booth_tables, slice(0, half)))
+    assert_matches(rollup, booth_tables)
+
+    # A corrected booth replaces its earlier figures instead of adding to them.
+    booths = booth_tables.booths.copy()
+    results = booth_tables.results.copy()
+    corrected = booths.index[7]
+    booths.loc[corrected, 'votes_polled'] += 100
+    key = booths.loc[corrected, 'booth_key']
+    results.loc[results['booth_key'] == key, 'votes'] *= 2
+    corrected_tables = BoothTables(booths, results)
+    rollup.update(batch(corrected_tables, np.array([7])))
+    assert_matches(rollup, corrected_tables)
+
+
+def test_grow_keeps_the_rows_when_only_columns_are_added():
+    array = np.arange(8, dtype=np.int64).reshape(4, 2)
+    wider = _grow(array, 3, 5)
+    assert wider.shape == (4, 5)
+    assert (wider[:, :2] == array).all() and not wider[:, 2:].any()
+    assert _grow(array, 4) is array
+    assert _grow(array, 5).shape == (8, 2)
+    assert _grow(array, 20).shape == (20, 2)
+
+
+def test_candidate_rows_of_unknown_booths_are_rejected(booth_tables):
+    tables = batch(booth_tables, slice(0, 10))
+    stray = booth_tables.results[booth_tables.results['booth_key'] == booth_tables.booths['booth_key'].iloc[10]]
+    rollup = BoothRollup()
+    with pytest.raises(ValueError, match='booth_key'):
+        rollup.update(BoothTables(tables.booths, pd.concat([tables.results, stray])))
+    assert rollup.version == 0 and rollup.node(int(tables.booths['year'].iloc[0])) is None
+    rollup.update(tables)
+    assert_matches(rollup, tables)
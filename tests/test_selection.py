@@ -0,0 +1,83 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from selection import ElectionIndex, PartitionedIndex, year_partitions
+
+
+def masked(df, **filters):
+    """Plain boolean-mask selection, in the frame's own row order."""
+    mask = np.ones(len(df), dtype=bool)
+    for column, value in filters.items():
+        if value is not None:
+            mask &= (df[column].astype(str) == str(value)).to_numpy()
+    return df[mask]
+
+
+def assert_same_rows(selected, expected):
+    pd.testing.assert_frame_equal(selected.sort_index(), expected.sort_index())
+
+
+def filter_cases(df):
+    years = [None] + sorted(df['year'].unique().tolist())
+    districts = [None] + sorted(df['district'].astype(str).unique().tolist())[:3]
+    for year, district in itertools.product(years, districts):
+        yield {'year': year, 'district': district}
+    for constituency in df['constituency'].astype(str).unique()[:5]:
+        yield {'constituency': constituency}
+        yield {'year': 2024, 'constituency': constituency}
+    for party in df['party'].astype(str).unique():
+        yield {'party': party}
+        yield {'year': 2023, 'party': party}
+    candidate = str(df['candidate'].iloc[0])
+    yield {'candidate': candidate}
+    yield {'candidate': candidate, 'party': str(df['party'].iloc[0])}
+    yield {'year': 1999}
+    yield {'constituency': 'Nowhere'}
+    yield {'district': 'Kollam', 'constituency': str(df['constituency'].iloc[0])}
+
+
+@pytest.fixture(scope='module')
+def index(results):
+    return ElectionIndex(results)
+
+
+def test_select_matches_boolean_masks(index, results):
+    for filters in filter_cases(results):
+        assert_same_rows(index.select(**filters), masked(results, **filters))
+
+
+def test_key_prefixes_are_contiguous(index):
+    for year in index.years:
+        start, stop = index.span(year)
+        assert (index.frame['year'].iloc[start:stop] == year).all()
+        for district in index.districts(year):
+            start, stop = index.span(year, district)
+            assert (index.frame['district'].iloc[start:stop].astype(str) == district).all()
+
+
+def test_listings_match_pandas(index, results):
+    assert index.years == sorted(results['year'].unique().tolist())
+    for year in [None] + index.years:
+        scope = results if year is None else results[results['year'] == year]
+        assert index.districts(year) == sorted(scope['district'].astype(str).unique())
+        assert index.constituencies(year) == sorted(scope['constituency'].astype(str).unique())
+    pairs = results[['constituency', 'district']].astype(str).drop_duplicates()
+    for constituency, district in pairs.itertuples(index=False):
+        assert index.district_of(constituency) == district
+
+
+def test_partitioned_index_matches_boolean_masks(results):
+    stored = ElectionIndex(results).frame
+    partitioned = PartitionedIndex(stored, year_partitions(stored))
+    for filters in filter_cases(results):
+        assert_same_rows(partitioned.select(**filters), masked(results, **filters))
+    assert partitioned.districts() == sorted(results['district'].astype(str).unique())
+
+
+def test_year_partitions_require_grouped_years(results):
+    shuffled = results.sample(frac=1, random_state=0)
+    with pytest.raises(ValueError):
+        year_partitions(shuffled)
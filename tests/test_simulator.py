@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from simulator import SeatSimulator
+from swing import SwingEngine
+
+YEAR = 2024
+NO_NOISE = dict(state_noise=0.0, district_noise=0.0, seat_noise=0.0)
+
+
+@pytest.fixture(scope='module')
+def simulator(results):
+    return SeatSimulator(SwingEngine(results), YEAR)
+
+
+@pytest.fixture(scope='module')
+def seat_winners(raw_results):
+    """Largest party in every seat contested in YEAR, by pandas idxmax."""
+    year = raw_results[raw_results['year'] == YEAR]
+    party_votes = year.groupby(['district', 'constituency', 'party'])['votes'].sum().reset_index()
+    return party_votes.loc[party_votes.groupby(['district', 'constituency'])['votes'].idxmax()]
+
+
+def test_noiseless_draws_give_every_seat_to_its_largest_party(simulator, seat_winners):
+    projection = simulator.run(draws=50, **NO_NOISE)
+    seats = projection['seats'].set_index('party')
+    expected = seat_winners['party'].value_counts()
+    assert seats['mean_seats'].to_dict() == expected.astype(float).to_dict()
+    assert seats['base_seats'].to_dict() == expected.to_dict()
+    assert (seats['p5'] == seats['p95']).all()
+    majority = len(seat_winners) // 2 + 1
+    assert projection['majority'] == majority
+    assert seats['majority_probability'].to_dict() == (expected >= majority).astype(float).to_dict()
+
+    favourites = projection['win_probability'].set_index(['district', 'constituency'])
+    expected_favourites = seat_winners.set_index(['district', 'constituency'])['party']
+    assert (favourites.loc[expected_favourites.index, 'favourite'] == expected_favourites).all()
+    assert (favourites['favourite_probability'] == 1.0).all()
+
+
+def test_a_large_swing_wins_every_contested_seat(simulator, raw_results):
+    party = 'BJP'
+    contested = raw_results[(raw_results['year'] == YEAR) & (raw_results['party'] == party)]
+    contested_seats = contested[['district', 'constituency']].drop_duplicates()
+    seats = simulator.run(draws=200, swing={party: 100.0})['seats'].set_index('party')
+    assert seats.loc[party, 'mean_seats'] == len(contested_seats)
+
+
+def test_draws_are_reproducible_and_distributions_sum_to_one(simulator):
+    first = simulator.run(draws=3000, seed=7)
+    again = simulator.run(draws=3000, seed=7)
+    pd.testing.assert_frame_equal(first['seats'], again['seats'])
+    pd.testing.assert_frame_equal(first['win_probability'], again['win_probability'])
+    assert np.allclose(first['seat_distribution'].sum(axis=1), 1.0)
+    assert first['seats']['mean_seats'].sum() == pytest.approx(len(simulator.constituencies), abs=0.05)
+    assert first['tipping_point']['probability'].sum() == pytest.approx(1.0)
+
+
+def test_chatbot_projections_use_the_given_projector(results):
+    from chatbot import CHAT_PROJECTION_DRAWS, ElectionChatbot
+    engine = SwingEngine(results)
+    calls = []
+
+    def projector(year, draws, swing):
+        calls.append((year, draws, swing))
+        return SeatSimulator(engine, year).run(draws=draws, swing=dict(swing))
+
+    bot = ElectionChatbot(results, swing=engine, projector=projector)
+    answer = bot.process_query("What if BJP gains 3 points?")
+    assert calls == [(max(engine.years), CHAT_PROJECTION_DRAWS, (('BJP', 3.0),))]
+    assert f"{CHAT_PROJECTION_DRAWS:,} simulated elections" in answer
+    # Forecasts and predictions keep the exit-poll answer.
+    for question in ["Any forecast for the next election?", "Prediction for 2026"]:
+        assert bot.process_query(question) == bot.answer_exit_poll({})
+    assert len(calls) == 1
@@ -0,0 +1,88 @@
+import pandas as pd
+import pytest
+
+from booths import BoothTables
+from rollup import ROLLUP_MEASURES, BoothRollup
+from selection import ElectionIndex
+from sqlstore import SQLiteBoothTables, SQLiteIndex, SQLiteStore
+from test_selection import filter_cases
+
+
+@pytest.fixture(scope='module')
+def frames(results, booth_tables):
+    return {'results': ElectionIndex(results).frame, 'booths': ElectionIndex(booth_tables.booths).frame,
+            'booth_results': booth_tables.results}
+
+
+@pytest.fixture(scope='module')
+def store(frames, tmp_path_factory):
+    return SQLiteStore(tmp_path_factory.mktemp('sqlite') / 'store.sqlite', 'v1', lambda: frames)
+
+
+def test_tables_round_trip_with_dtypes_and_labels(store, frames):
+    for name, frame in frames.items():
+        pd.testing.assert_frame_equal(store.query(name), frame)
+
+
+def test_queries_read_only_the_given_columns(store, frames):
+    columns = ['booth_key', 'year', 'booth_id']
+    pd.testing.assert_frame_equal(store.query('booths', [('year', 2024)], columns=columns),
+                                  frames['booths'].loc[frames['booths']['year'] == 2024, columns])
+
+
+def test_sums_match_a_pandas_groupby(store, frames):
+    summed = store.sum('booth_results', ['booth_key', 'party'], 'votes')
+    expected = frames['booth_results'].groupby(['booth_key', 'party'], observed=True, sort=False)['votes'] \
+        .sum().astype('int64').reset_index()
+    pd.testing.assert_frame_equal(summed, expected)
+
+
+def test_rollup_from_summed_party_votes_matches_the_full_tables(store, booth_tables):
+    booths = store.query('booths', columns=['booth_key', 'year', 'booth_id', 'district', 'constituency']
+                         + ROLLUP_MEASURES[1:])
+    summed = BoothRollup.from_tables(BoothTables(booths, store.sum('booth_results', ['booth_key', 'party'], 'votes')))
+    full = BoothRollup.from_tables(booth_tables)
+    for year in [2023, 2024, 2025]:
+        for district in [None, 'Kollam']:
+            pd.testing.assert_frame_equal(summed.children(year, district), full.children(year, district))
+        assert summed.node(year, 'Kollam', 'Chavara') == full.node(year, 'Kollam', 'Chavara')
+
+
+def test_index_matches_election_index(store, results):
+    index, sqlite_index = ElectionIndex(results), SQLiteIndex(store)
+    for filters in filter_cases(results):
+        pd.testing.assert_frame_equal(sqlite_index.select(**filters), index.select(**filters))
+    assert sqlite_index.years == index.years
+    for year in [None] + index.years:
+        assert sqlite_index.districts(year) == index.districts(year)
+        assert sqlite_index.constituencies(year) == index.constituencies(year)
+    for constituency in index.constituencies():
+        assert sqlite_index.district_of(constituency) == index.district_of(constituency)
+
+
+def test_booth_lookups_match_booth_tables(store, booth_tables):
+    sqlite_tables = SQLiteBoothTables(store)
+    booths = booth_tables.booths
+    for position in range(0, len(booths), 97):
+        booth = booths.iloc[position]
+        found = sqlite_tables.find(int(booth['booth_id']), int(booth['year']))
+        expected = booth_tables.find(int(booth['booth_id']), int(booth['year']))
+        assert found.to_dict() == expected.to_dict()
+        pd.testing.assert_frame_equal(sqlite_tables.booth_results(int(booth['booth_key'])),
+                                      booth_tables.booth_results(int(booth['booth_key'])))
+    assert sqlite_tables.find(-1) is None
+
+
+def test_store_is_rebuilt_only_for_a_new_version(frames, tmp_path):
+    builds = []
+
+    def build():
+        builds.append(1)
+        return {'results': frames['results']}
+
+    path = tmp_path / 'store.sqlite'
+    SQLiteStore(path, 'v1', build)
+    SQLiteStore(path, 'v1', build)
+    assert len(builds) == 1
+    SQLiteStore(path, 'v2', build)
+    assert len(builds) == 2
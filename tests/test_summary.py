@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from summary import SUMMARY_COLUMNS, SUMMARY_KEYS, constituency_summary
+from utils import compact_frame
+
+
+@pytest.fixture(scope='module')
+def summary(results):
+    return constituency_summary(results)
+
+
+def plain_summary(raw):
+    """The same table from a sort and groupby over the plain CSV."""
+    ranked = raw.sort_values(SUMMARY_KEYS + ['votes'], ascending=[True] * 3 + [False], kind='stable')
+    contests = ranked.groupby(SUMMARY_KEYS, sort=False)
+    winners = contests.nth(0).set_index(SUMMARY_KEYS)
+    runners_up = contests.nth(1).set_index(SUMMARY_KEYS)
+    party_votes = raw.groupby(SUMMARY_KEYS + ['party'])['votes'].sum()
+    totals = raw.groupby(SUMMARY_KEYS)['votes'].sum()
+    shares = party_votes / totals.reindex(party_votes.droplevel('party').index).to_numpy()
+    plain = pd.DataFrame({
+        'winner_candidate': winners['candidate'], 'winner_party': winners['party'],
+        'winner_votes': winners['votes'],
+        'runner_up_candidate': runners_up['candidate'], 'runner_up_party': runners_up['party'],
+        'runner_up_votes': runners_up['votes'],
+    })
+    plain['runner_up_votes'] = plain['runner_up_votes'].fillna(0)
+    plain['margin'] = plain['winner_votes'] - plain['runner_up_votes']
+    plain['total_votes'] = totals
+    plain['winner_share'] = plain['winner_votes'] / plain['total_votes'] * 100
+    plain['candidates'] = raw.groupby(SUMMARY_KEYS).size()
+    plain['enp'] = 1 / (shares ** 2).groupby(level=SUMMARY_KEYS).sum()
+    return plain
+
+
+def test_summary_matches_pandas(summary, raw_results):
+    assert list(summary.columns) == SUMMARY_COLUMNS
+    plain = plain_summary(raw_results)
+    keyed = summary.astype({col: str for col in SUMMARY_KEYS[1:]}).set_index(SUMMARY_KEYS)
+    assert len(keyed) == len(plain) and keyed.index.is_unique
+    plain = plain.loc[keyed.index]
+    for col in ['winner_candidate', 'winner_party', 'runner_up_candidate', 'runner_up_party']:
+        assert (keyed[col].astype(str).to_numpy() == plain[col].astype(str).to_numpy()).all(), col
+    for col in ['winner_votes', 'runner_up_votes', 'margin', 'total_votes', 'candidates']:
+        assert (keyed[col].to_numpy() == plain[col].to_numpy()).all(), col
+    for col in ['winner_share', 'enp']:
+        assert np.allclose(keyed[col].to_numpy(), plain[col].to_numpy()), col
+
+
+def test_summary_keeps_the_order_of_first_appearance(summary, results):
+    first = results.drop_duplicates(SUMMARY_KEYS)[SUMMARY_KEYS].reset_index(drop=True)
+    pd.testing.assert_frame_equal(summary[SUMMARY_KEYS], first)
+
+
+def test_single_candidates_and_pooled_party_votes():
+    raw = pd.DataFrame({
+        'year': [2024, 2024, 2024, 2024],
+        'district': ['Kollam', 'Kollam', 'Kollam', 'Kannur'],
+        'constituency': ['Chavara', 'Chavara', 'Chavara', 'Thalassery'],
+        'candidate': ['Anil', 'Biju', 'Cyril', 'Deepa'],
+        'party': ['INC', 'INC', 'CPI', 'BJP'],
+        'votes': [500, 300, 200, 900],
+        'winner': ['Yes', 'No', 'No', 'Yes'],
+    })
+    summary = constituency_summary(compact_frame(raw)).set_index('constituency')
+    chavara, thalassery = summary.loc['Chavara'], summary.loc['Thalassery']
+    # Two INC candidates pool to an 80% party share.
+    assert chavara['enp'] == pytest.approx(1 / (0.8 ** 2 + 0.2 ** 2))
+    assert (chavara['runner_up_candidate'], chavara['margin']) == ('Biju', 200)
+    assert pd.isna(thalassery['runner_up_candidate'])
+    assert (thalassery['margin'], thalassery['enp'], thalassery['winner_share']) == (900, 1.0, 100.0)
+    assert constituency_summary(compact_frame(raw.iloc[0:0])).empty
@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from swing import SwingEngine, seat_party_frame
+
+SEAT = ['district', 'constituency']
+YEAR_PAIRS = [(2023, 2024), (2024, 2025), (2023, 2025)]
+
+
+@pytest.fixture(scope='module')
+def engine(results):
+    return SwingEngine(results)
+
+
+@pytest.fixture(scope='module')
+def plain(raw_results):
+    """Party votes and winners per seat and year, from pandas pivots."""
+    votes = raw_results.pivot_table(index=SEAT + ['party'], columns='year', values='votes', aggfunc='sum',
+                                    fill_value=0)
+    totals = votes.groupby(level=SEAT).sum()
+    winners = raw_results[raw_results['winner'] == 'Yes'].set_index(SEAT + ['year'])['party'].unstack('year')
+    return votes, totals, winners
+
+
+def contested(totals, year1, year2):
+    return totals[(totals[year1] > 0) & (totals[year2] > 0)]
+
+
+@pytest.mark.parametrize('year1, year2', YEAR_PAIRS)
+def test_compare_matches_pandas(engine, plain, year1, year2):
+    votes, totals, winners = plain
+    both = contested(totals, year1, year2)
+    compared = engine.compare(year1, year2).set_index(SEAT).loc[both.index]
+    assert len(compared) == len(both)
+    assert (compared[f'total_votes_{year1}'].to_numpy() == both[year1].to_numpy()).all()
+    assert (compared['vote_change'].to_numpy() == (both[year2] - both[year1]).to_numpy()).all()
+    assert (compared[f'winner_{year1}'] == winners.loc[both.index, year1]).all()
+    assert (compared[f'winner_{year2}'] == winners.loc[both.index, year2]).all()
+    assert (compared['flipped'] == (winners.loc[both.index, year1] != winners.loc[both.index, year2])).all()
+
+    shares = votes.div(totals.reindex(votes.index.droplevel('party')).to_numpy()) * 100
+    for seat, row in compared.iterrows():
+        holder = shares.loc[seat + (row[f'winner_{year1}'],)]
+        assert row['holder_swing'] == pytest.approx(round(holder[year2] - holder[year1], 2), abs=0.006)
+
+
+@pytest.mark.parametrize('year1, year2', YEAR_PAIRS)
+@pytest.mark.parametrize('district', [None, 'Kollam'])
+def test_party_swing_matches_pandas(engine, plain, year1, year2, district):
+    votes, totals, _ = plain
+    seats = contested(totals, year1, year2).index
+    if district:
+        seats = seats[seats.get_level_values('district') == district]
+    in_scope = votes[votes.index.droplevel('party').isin(seats)]
+    party_votes = in_scope.groupby(level='party')[[year1, year2]].sum()
+    party_votes = party_votes[(party_votes[year1] > 0) | (party_votes[year2] > 0)]
+
+    swing = engine.party_swing(year1, year2, district=district).set_index('party')
+    assert sorted(swing.index) == sorted(party_votes.index)
+    for party, row in party_votes.iterrows():
+        assert swing.loc[party, f'votes_{year1}'] == row[year1]
+        assert swing.loc[party, f'votes_{year2}'] == row[year2]
+        expected = row[year2] / party_votes[year2].sum() * 100 - row[year1] / party_votes[year1].sum() * 100
+        assert swing.loc[party, 'swing'] == pytest.approx(expected, abs=0.011)
+    assert list(swing[f'votes_{year2}']) == sorted(swing[f'votes_{year2}'], reverse=True)
+
+
+@pytest.mark.parametrize('year1, year2', YEAR_PAIRS)
+def test_seat_changes_match_pandas(engine, plain, year1, year2):
+    _, totals, winners = plain
+    pair = winners.loc[contested(totals, year1, year2).index, [year1, year2]]
+    held = pair[year1] == pair[year2]
+    changes = engine.seat_changes(year1, year2).set_index('party')
+    for party, row in changes.iterrows():
+        assert row[f'seats_{year1}'] == (pair[year1] == party).sum()
+        assert row[f'seats_{year2}'] == (pair[year2] == party).sum()
+        assert row['retained'] == (held & (pair[year1] == party)).sum()
+        assert row['gained'] == (~held & (pair[year2] == party)).sum()
+        assert row['lost'] == (~held & (pair[year1] == party)).sum()
+    assert changes[f'seats_{year2}'].sum() == len(pair)
+    assert np.array_equal(changes['net'], changes['gained'] - changes['lost'])
+
+
+def test_district_swing_matches_pandas(engine, plain):
+    votes, totals, _ = plain
+    seats = contested(totals, 2023, 2024).index
+    in_scope = votes[votes.index.droplevel('party').isin(seats)][[2023, 2024]]
+    by_district = in_scope.groupby(level=['district', 'party']).sum()
+    shares = by_district / by_district.groupby(level='district').transform('sum') * 100
+    expected = (shares[2024] - shares[2023]).unstack('party', fill_value=0.0)
+    swing = engine.district_swing(2023, 2024)
+    pd.testing.assert_frame_equal(swing.loc[expected.index, expected.columns], expected.round(2),
+                                  check_names=False, atol=0.011)
+
+
+def test_engine_from_seat_party_votes_matches_the_candidate_rows(engine, results):
+    compact = SwingEngine(seat_party_frame(results))
+    assert (compact.votes == engine.votes).all()
+    assert (compact.winners == engine.winners).all()
+    assert (compact.parties, compact.constituencies) == (engine.parties, engine.constituencies)
+    for year1, year2 in YEAR_PAIRS:
+        pd.testing.assert_frame_equal(compact.compare(year1, year2), engine.compare(year1, year2))
@@ -1,9 +1,49 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 from pathlib import Path
 import base64
+import os
+import threading
+from selection import ElectionIndex, PartitionedIndex, year_partitions
+from datastore import cached_read_csv, read_only_view, shared_frames, source_version
+from ingest import stream_ingest, DEFAULT_MEMORY_BUDGET_MB
+from booths import BoothTables, PartitionedBoothTables
+from summary import constituency_summary
+from cube import PartyCube, party_cube_frame
+from careers import CandidateIndex, career_frame
+from rollup import BoothRollup, ROLLUP_MEASURES
+from swing import SwingEngine, seat_party_frame
+from simulator import SeatSimulator
+from leaderboard import build_leaderboards
+from boothswing import BoothSwing
+from anomalies import AnomalyReport, booth_anomalies
+from counting import LiveCount
+from sqlstore import SQLiteStore, SQLiteIndex, SQLiteBoothTables, sqlite_path
 
 BASE_DIR = Path(__file__).parent
+DATA_PATH = BASE_DIR / "data" / "kerala_election_data.csv"
+
+KERALA_DISTRICTS = [
+    'Thiruvananthapuram', 'Kollam', 'Pathanamthitta', 'Alappuzha', 'Kottayam',
+    'Idukki', 'Ernakulam', 'Thrissur', 'Palakkad', 'Malappuram',
+    'Kozhikode', 'Wayanad', 'Kannur', 'Kasaragod'
+]
+
+# "full" parses the whole CSV (through the columnar cache); "stream" ingests it
+# in chunks within POLLYTICS_MEMORY_BUDGET_MB and keeps only the aggregates.
+INGEST_MODE = os.environ.get("POLLYTICS_INGEST", "full")
+MEMORY_BUDGET_MB = float(os.environ.get("POLLYTICS_MEMORY_BUDGET_MB", DEFAULT_MEMORY_BUDGET_MB))
+# "pandas" answers lookups from in-memory frames; "sqlite" from indexed queries
+# against a database file, reading only the matching rows.
+BACKEND = os.environ.get("POLLYTICS_BACKEND", "pandas")
+# Counting-day feed: an append-only results CSV or a directory that round files are dropped into.
+LIVE_PATH = Path(os.environ.get("POLLYTICS_LIVE_PATH", BASE_DIR / "data" / "live"))
+# Bumped when the layout of the shared election store changes.
+ELECTION_LAYOUT_VERSION = 6
+
+CATEGORY_COLUMNS = ['district', 'constituency', 'candidate', 'party', 'booth_name']
+VOTE_COLUMNS = ['votes', 'total_voters', 'votes_polled', 'margin', 'postal_votes']
 
 def get_logo_base64():
     """Get logo as base64 string for embedding in HTML."""
@@ -22,6 +62,8 @@ def setup_page(page_title="Pollytics"):
         initial_sidebar_state="collapsed"
     )
     
+    refresh_election_data()
+    
     css_path = BASE_DIR / "assets" / "style.css"
     try:
         with open(css_path, encoding="utf-8") as f:
@@ -79,6 +121,16 @@ def render_breadcrumb(items):
     </div>
     ''', unsafe_allow_html=True)
 
+def render_year_selector(years, state_key, button_key):
+    """Render a year box and select button for each available election year."""
+    cols = st.columns(3)
+    for position, year in enumerate(years):
+        with cols[position % 3]:
+            st.markdown(f'<div class="year-box"><h2>{year}</h2><p>Assembly Election</p></div>', unsafe_allow_html=True)
+            if st.button(f"Select {year}", key=button_key.format(year=year), use_container_width=True, type="primary"):
+                st.session_state[state_key] = year
+                st.rerun()
+
 def render_filter_section(title=None):
     """Start a filter section container."""
     title_html = f'<div class="filter-section-title">{title}</div>' if title else ''
@@ -96,117 +148,401 @@ def render_footer():
     </div>
     ''', unsafe_allow_html=True)
 
-@st.cache_data
+def category_dtype(values, preferred=()):
+    """Build a categorical dtype with a stable order: preferred values first, then the rest sorted."""
+    values = pd.Series(values)
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        present = set(values.cat.remove_unused_categories().cat.categories)
+    else:
+        present = set(pd.unique(values.dropna()))
+    ordered = [v for v in preferred if v in present]
+    ordered += sorted(present - set(ordered))
+    return pd.CategoricalDtype(ordered)
+
+def _repeats(series):
+    """Whether values repeat enough for a categorical to beat plain strings."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return True
+    return series.nunique() <= len(series) // 2
+
+def compact_frame(df):
+    """Return a memory-compact copy of an election frame.
+
+    Repeating string columns become categoricals with a stable category order, the
+    'Yes'/'No' winner flag becomes a bool and integer columns are downcast.
+    Memory usage before and after is recorded in ``df.attrs['memory']``.
+    """
+    before = int(df.memory_usage(deep=True).sum())
+    out = {}
+    for col in df.columns:
+        series = df[col]
+        if col in CATEGORY_COLUMNS and _repeats(series):
+            preferred = KERALA_DISTRICTS if col == 'district' else ()
+            out[col] = series.astype(category_dtype(series, preferred))
+        elif col == 'winner' and not pd.api.types.is_bool_dtype(series):
+            out[col] = series.astype(str).str.strip().str.lower().isin(['yes', 'true', '1'])
+        elif pd.api.types.is_integer_dtype(series):
+            # Vote counts keep at least 32 bits so sums and differences cannot overflow.
+            downcast = pd.to_numeric(series, downcast='integer')
+            if col in VOTE_COLUMNS:
+                downcast = downcast.astype(np.promote_types(downcast.dtype, np.int32))
+            out[col] = downcast
+        else:
+            out[col] = series
+    compact = pd.DataFrame(out, index=df.index)
+    compact.attrs['memory'] = {'before': before, 'after': int(compact.memory_usage(deep=True).sum())}
+    return compact
+
+def memory_report(df):
+    """Describe the memory saved by compact_frame."""
+    memory = df.attrs.get('memory')
+    if not memory:
+        return "No memory report available"
+    before, after = memory['before'], memory['after']
+    ratio = before / after if after else 0
+    return f"{before / 1024:,.1f} KiB -> {after / 1024:,.1f} KiB ({ratio:.1f}x smaller)"
+
+def read_election_data():
+    """Read the election CSV as a compact frame, via the columnar cache next to the CSV."""
+    if INGEST_MODE == "stream":
+        return stream_ingest(DATA_PATH, MEMORY_BUDGET_MB, prepare=compact_frame)['results']
+    return cached_read_csv(DATA_PATH, prepare=compact_frame)
+
 def load_data():
-    """Load Kerala election data from CSV."""
+    """Kerala election data as a zero-copy handle on the shared store.
+
+    Cheap enough to call on every rerun: nothing is pickled or copied, and
+    changes a page makes to the handle never reach the shared copy.
+    """
+    return read_only_view(load_shared_data())
+
+def build_election_frames():
+    """Election results stored year by year, with their constituency summary, party cube, candidate careers
+    and per-seat party votes for the swing engine."""
+    results = ElectionIndex(read_election_data()).frame
+    results.attrs['partitions'] = year_partitions(results)
+    summary = constituency_summary(results)
+    summary.attrs['partitions'] = year_partitions(summary)
+    return {'results': results, 'summary': summary, 'cube': party_cube_frame(results),
+            'careers': career_frame(results), 'swing': seat_party_frame(results)}
+
+def election_data_version():
+    """Version of the election data stores: their layout, the ingest mode and the CSV's size and mtime."""
+    return f"v{ELECTION_LAYOUT_VERSION}-{INGEST_MODE}-{source_version(DATA_PATH)}"
+
+@st.cache_resource
+def load_election_frames():
+    """Election results and their derived tables attached read-only from the host-wide shared column store.
+
+    Every server process on the host maps the same column files, so adding
+    workers does not add copies of the data. The summary, party cube and
+    candidate careers are computed once per dataset version, when the store
+    is published. Rows are stored year by year with a catalog of the year
+    row groups in ``attrs['partitions']``.
+    """
     try:
-        data_path = BASE_DIR / "data" / "kerala_election_data.csv"
-        df = pd.read_csv(data_path)
-        return df
+        version = election_data_version()
+        return shared_frames('election', version, build_election_frames)
     except Exception as e:
         st.error(f"Error loading data: {e}")
         st.info("Please make sure the file 'data/kerala_election_data.csv' exists in the data folder")
-        return pd.DataFrame()
+        return {'results': pd.DataFrame(), 'summary': pd.DataFrame(), 'cube': party_cube_frame(pd.DataFrame()),
+                'careers': career_frame(pd.DataFrame()), 'swing': seat_party_frame(pd.DataFrame())}
+
+def load_shared_data():
+    """Election data attached read-only from the host-wide shared column store."""
+    return load_election_frames()['results']
+
+BOOTH_CONSTITUENCIES = {
+    'Thiruvananthapuram': ['Vattiyoorkavu', 'Nemom', 'Kazhakoottam', 'Kovalam', 'Parassala'],
+    'Kollam': ['Kollam', 'Kundara', 'Chavara', 'Punalur', 'Karunagappally'],
+    'Pathanamthitta': ['Pathanamthitta', 'Ranni', 'Aranmula', 'Konni', 'Adoor'],
+    'Alappuzha': ['Alappuzha', 'Cherthala', 'Ambalappuzha', 'Haripad', 'Kayamkulam'],
+    'Kottayam': ['Kottayam', 'Changanassery', 'Pala', 'Vaikom', 'Kaduthuruthy'],
+    'Idukki': ['Idukki', 'Peerumade', 'Udumbanchola', 'Devikulam', 'Thodupuzha'],
+    'Ernakulam': ['Ernakulam', 'Thrikkakara', 'Kalamassery', 'Paravur', 'Aluva'],
+    'Thrissur': ['Thrissur', 'Ollur', 'Irinjalakuda', 'Guruvayur', 'Kodungallur'],
+    'Palakkad': ['Palakkad', 'Ottapalam', 'Mannarkkad', 'Chittur', 'Alathur'],
+    'Malappuram': ['Malappuram', 'Manjeri', 'Ponnani', 'Tirur', 'Perinthalmanna'],
+    'Kozhikode': ['Kozhikode North', 'Kozhikode South', 'Beypore', 'Kunnamangalam', 'Koduvally'],
+    'Wayanad': ['Sulthan Bathery', 'Kalpetta', 'Mananthavady', 'Vythiri', 'Panamaram'],
+    'Kannur': ['Kannur', 'Thalassery', 'Payyanur', 'Taliparamba', 'Iritty'],
+    'Kasaragod': ['Kasaragod', 'Kanhangad', 'Uppala', 'Manjeshwar', 'Vellarikundu']
+}
+BOOTH_PARTIES = ['CPI', 'INC', 'BJP', 'CPIM', 'IUML', 'KC(M)', 'JD(S)']
+BOOTH_CANDIDATES = ['Suresh', 'Rajan', 'Meera', 'Anand', 'Priya', 'Manoj', 'Deepa',
+                    'Sunil', 'Bindu', 'Vijayan', 'Uma', 'George', 'Jose', 'Peter']
+BOOTH_YEARS = [2023, 2024, 2025]
+BOOTH_DATA_SEED = 20240
+# Bump when the generator changes so shared stores built by older code are replaced.
+BOOTH_DATA_VERSION = 3
+# Bumped when the tables stored in the booth database change.
+BOOTH_LAYOUT_VERSION = 2
+BOOTH_SQLITE_PATH = BASE_DIR / "data" / ".booths.sqlite"
+BOOTH_PLACES = ['Govt. School', 'LP School', 'HSS', 'College', 'Community Hall']
+BOOTH_SIDES = ['North', 'South', 'East', 'West', 'Central']
+BOOTH_PLACE_NAMES = [f"{place} {side}" for place, side in zip(BOOTH_PLACES, BOOTH_SIDES)]
+
+def generate_booth_tables(booths_per_constituency=2, num_years=len(BOOTH_YEARS), seed=BOOTH_DATA_SEED):
+    """Generate synthetic booth-wise results as BoothTables, identically in every process.
+
+    All randomness comes from a seeded generator, so the same arguments give
+    the same frame on every worker and restart. ``booths_per_constituency``
+    and ``num_years`` scale the output for load testing (years continue
+    after 2025 when more than three are requested).
+    """
+    rng = np.random.default_rng(seed)
+    years = np.array(BOOTH_YEARS + list(range(BOOTH_YEARS[-1] + 1, BOOTH_YEARS[0] + num_years)))[:num_years]
+    per_district = max(len(c) for c in BOOTH_CONSTITUENCIES.values())
+    booths_per_district = per_district * booths_per_constituency
+
+    constituency_names = [c for d in KERALA_DISTRICTS for c in BOOTH_CONSTITUENCIES[d]]
+    constituency_offset = rng.integers(0, 105, len(constituency_names))
+    district_booth_offset = rng.integers(0, 300, (len(KERALA_DISTRICTS), booths_per_district))
+
+    # One entry per booth, ordered year -> district -> constituency so every
+    # constituency is a contiguous block; serial numbers booths within a district.
+    n_booths = len(years) * len(KERALA_DISTRICTS) * booths_per_district
+    booth_year = np.repeat(years, len(KERALA_DISTRICTS) * booths_per_district)
+    booth_district = np.tile(np.repeat(np.arange(len(KERALA_DISTRICTS)), booths_per_district), len(years))
+    position = np.tile(np.arange(booths_per_district), len(years) * len(KERALA_DISTRICTS))
+    serial = (position % booths_per_constituency) * per_district + position // booths_per_constituency
+    # The booth's number within its constituency, the same in every year.
+    booth_serial = position % booths_per_constituency + 1
+    booth_constituency = booth_district * per_district + serial % per_district
+    counter = np.arange(1, n_booths + 1)
+    cycle = serial % 10
+
+    total = 1200 + cycle * 50 + district_booth_offset[booth_district, serial]
+    offset = constituency_offset[booth_constituency]
+    turnout = np.minimum(65 + cycle * 2 + offset % 15 + rng.integers(-3, 4, n_booths), 90)
+    polled = total * turnout // 100
+    n_candidates = 3 + rng.integers(0, 2, n_booths)
+    winner_idx = (counter + serial) % len(BOOTH_CANDIDATES)
+    winner_votes = (polled * (40 + rng.integers(0, 20, n_booths)) // 100)
+    previous_error = rng.integers(0, 21, n_booths)
+    postal = polled * (2 + rng.integers(0, 6, n_booths)) // 100
+    tendered = rng.integers(0, 6, n_booths)
+
+    # Candidate rows: the winner first, then the others splitting the remaining votes.
+    booth = np.repeat(np.arange(n_booths), n_candidates)
+    position = np.arange(len(booth)) - np.repeat(np.cumsum(n_candidates) - n_candidates, n_candidates)
+    others = n_candidates[booth] - 1
+    rest = (polled - winner_votes)[booth]
+    share = np.zeros(len(booth), dtype=np.int64)
+    taken = np.zeros(n_booths, dtype=np.int64)
+    for j in range(1, int(n_candidates.max())):
+        rows = position == j
+        b = booth[rows]
+        last = j == others[rows]
+        remaining = rest[rows] - taken[b]
+        share[rows] = np.where(last, remaining, remaining // (others[rows] - j + 1))
+        taken[b] += share[rows]
+    votes = np.where(position == 0, winner_votes[booth], share)
+
+    is_winner = position == 0
+    candidate_idx = np.where(is_winner, winner_idx[booth], (winner_idx[booth] + position + 1) % len(BOOTH_CANDIDATES))
+    party_idx = (candidate_idx + offset[booth]) % len(BOOTH_PARTIES)
+
+    booths = compact_frame(pd.DataFrame({
+        'year': booth_year,
+        'district': pd.Categorical.from_codes(booth_district, categories=KERALA_DISTRICTS),
+        'constituency': pd.Categorical.from_codes(booth_constituency, categories=constituency_names),
+        'booth_id': 1000 + counter,
+        'booth_no': counter,
+        'booth_serial': booth_serial,
+        'booth_place': pd.Categorical.from_codes(serial % 5, categories=BOOTH_PLACE_NAMES),
+        'total_voters': total,
+        'votes_polled': polled,
+        'previous_error': previous_error,
+        'postal_votes': postal,
+        'tendered_votes': tendered,
+    }))
+    results = compact_frame(pd.DataFrame({
+        'booth_key': booth.astype(np.int32),
+        'candidate': pd.Categorical.from_codes(candidate_idx, categories=BOOTH_CANDIDATES),
+        'party': pd.Categorical.from_codes(party_idx, categories=BOOTH_PARTIES),
+        'votes': votes,
+    }))
+    return BoothTables.from_results(booths, results)
+
+@st.cache_resource
+def create_booth_tables():
+    """Create sample booth tables with all 14 districts of Kerala and 10 booths each.
+
+    The tables are generated once per host and attached read-only from the
+    shared column store by every server process. Booths are stored year by
+    year, so a lookup only indexes the year it needs.
+    """
+    def build():
+        tables = generate_booth_tables()
+        tables.booths.attrs['partitions'] = year_partitions(tables.booths, bounds=('booth_id',))
+        return {'booths': tables.booths, 'results': tables.results}
+
+    frames = shared_frames('booths', f"v{BOOTH_DATA_VERSION}-{BOOTH_DATA_SEED}", build)
+    return PartitionedBoothTables(frames['booths'], frames['results'])
 
-@st.cache_data
 def create_booth_data():
-    """Create sample data with all 14 districts of Kerala and 10 booths each."""
-    districts = [
-        'Thiruvananthapuram', 'Kollam', 'Pathanamthitta', 'Alappuzha', 'Kottayam',
-        'Idukki', 'Ernakulam', 'Thrissur', 'Palakkad', 'Malappuram',
-        'Kozhikode', 'Wayanad', 'Kannur', 'Kasaragod'
-    ]
-    
-    constituencies = {
-        'Thiruvananthapuram': ['Vattiyoorkavu', 'Nemom', 'Kazhakoottam', 'Kovalam', 'Parassala'],
-        'Kollam': ['Kollam', 'Kundara', 'Chavara', 'Punalur', 'Karunagappally'],
-        'Pathanamthitta': ['Pathanamthitta', 'Ranni', 'Aranmula', 'Konni', 'Adoor'],
-        'Alappuzha': ['Alappuzha', 'Cherthala', 'Ambalappuzha', 'Haripad', 'Kayamkulam'],
-        'Kottayam': ['Kottayam', 'Changanassery', 'Pala', 'Vaikom', 'Kaduthuruthy'],
-        'Idukki': ['Idukki', 'Peerumade', 'Udumbanchola', 'Devikulam', 'Thodupuzha'],
-        'Ernakulam': ['Ernakulam', 'Thrikkakara', 'Kalamassery', 'Paravur', 'Aluva'],
-        'Thrissur': ['Thrissur', 'Ollur', 'Irinjalakuda', 'Guruvayur', 'Kodungallur'],
-        'Palakkad': ['Palakkad', 'Ottapalam', 'Mannarkkad', 'Chittur', 'Alathur'],
-        'Malappuram': ['Malappuram', 'Manjeri', 'Ponnani', 'Tirur', 'Perinthalmanna'],
-        'Kozhikode': ['Kozhikode North', 'Kozhikode South', 'Beypore', 'Kunnamangalam', 'Koduvally'],
-        'Wayanad': ['Sulthan Bathery', 'Kalpetta', 'Mananthavady', 'Vythiri', 'Panamaram'],
-        'Kannur': ['Kannur', 'Thalassery', 'Payyanur', 'Taliparamba', 'Iritty'],
-        'Kasaragod': ['Kasaragod', 'Kanhangad', 'Uppala', 'Manjeshwar', 'Vellarikundu']
-    }
-    
-    data = {
-        'year': [], 'district': [], 'constituency': [], 'booth_id': [],
-        'booth_name': [], 'total_voters': [], 'votes_polled': [],
-        'candidate': [], 'party': [], 'votes': [], 'winner': [],
-        'margin': [], 'previous_error': [], 'postal_votes': [], 'tendered_votes': []
-    }
-    
-    booth_counter = 1
-    parties = ['CPI', 'INC', 'BJP', 'CPIM', 'IUML', 'KC(M)', 'JD(S)']
-    candidates = ['Suresh', 'Rajan', 'Meera', 'Anand', 'Priya', 'Manoj', 'Deepa',
-                  'Sunil', 'Bindu', 'Vijayan', 'Uma', 'George', 'Jose', 'Peter']
-    
-    for year in [2023, 2024, 2025]:
-        for district in districts:
-            district_constituencies = constituencies[district]
-            for i in range(10):
-                const_index = i % len(district_constituencies)
-                constituency = district_constituencies[const_index]
-                
-                total = 1200 + (i * 50) + (hash(f"{district}_{i}") % 300)
-                turnout = 65 + (i * 2) + (hash(constituency) % 15)
-                if turnout > 90:
-                    turnout = 90
-                votes_polled = int(total * turnout / 100)
-                
-                num_candidates = 3 + (hash(f"cand_{booth_counter}") % 2)
-                remaining_votes = votes_polled
-                
-                winner_idx = (booth_counter + i) % len(candidates)
-                winner_name = candidates[winner_idx]
-                winner_party = parties[(winner_idx + hash(constituency)) % len(parties)]
-                winner_votes = int(votes_polled * (0.4 + (hash(f"win_{booth_counter}") % 20)/100))
-                
-                runner_up_votes = int((votes_polled - winner_votes) * 0.6)
-                margin = winner_votes - runner_up_votes
-                
-                for j in range(num_candidates):
-                    if j == 0:
-                        candidate_name = winner_name
-                        party = winner_party
-                        vote_count = winner_votes
-                        is_winner = 'Yes'
-                        booth_margin = margin
-                    else:
-                        cand_idx = (winner_idx + j + 1) % len(candidates)
-                        candidate_name = candidates[cand_idx]
-                        party = parties[(cand_idx + hash(constituency)) % len(parties)]
-                        
-                        if j == num_candidates - 1:
-                            vote_count = remaining_votes - winner_votes
-                        else:
-                            vote_count = int((remaining_votes - winner_votes) / (num_candidates - j))
-                            remaining_votes -= vote_count
-                        
-                        is_winner = 'No'
-                        booth_margin = 0
-                    
-                    data['year'].append(year)
-                    data['district'].append(district)
-                    data['constituency'].append(constituency)
-                    data['booth_id'].append(1000 + booth_counter)
-                    data['booth_name'].append(f"Booth {booth_counter} - {['Govt. School', 'LP School', 'HSS', 'College', 'Community Hall'][i % 5]} {['North', 'South', 'East', 'West', 'Central'][i % 5]}")
-                    data['total_voters'].append(total)
-                    data['votes_polled'].append(votes_polled)
-                    data['candidate'].append(candidate_name)
-                    data['party'].append(party)
-                    data['votes'].append(vote_count)
-                    data['winner'].append(is_winner)
-                    data['margin'].append(booth_margin)
-                    data['previous_error'].append((hash(f"error_{booth_counter}") % 21))
-                    data['postal_votes'].append(int(votes_polled * (2 + (hash(f"postal_{booth_counter}") % 6)) / 100))
-                    data['tendered_votes'].append(hash(f"tender_{booth_counter}") % 6)
-                
-                booth_counter += 1
-    
-    return pd.DataFrame(data)
+    """Wide booth frame (booth metrics repeated per candidate row) built from the booth tables.
+
+    This materializes a new frame on every call; pages use the booth tables directly.
+    """
+    return create_booth_tables().wide()
+
+@st.cache_resource
+def election_database():
+    """SQLite copy of the election data and the tables derived from it, rebuilt when the CSV changes."""
+    return SQLiteStore(sqlite_path(DATA_PATH), election_data_version(), build_election_frames)
+
+def data_version():
+    """Version of all the data the chatbot answers from: the election CSV and the booth generator."""
+    return f"{election_data_version()}-booths-v{BOOTH_DATA_VERSION}-{BOOTH_DATA_SEED}"
+
+_election_version = None
+_refresh_lock = threading.Lock()
+
+def refresh_election_data():
+    """Drop the cached election data and everything built from it once the CSV has changed.
+
+    The loader and the indexes, cube, careers, swing engine, simulators and
+    leaderboards built on it are cached without arguments, so they would
+    keep serving the old rows after the CSV is replaced. ``setup_page``
+    calls this on every run; when the CSV is unchanged it costs one stat.
+    """
+    global _election_version
+    version = election_data_version()
+    with _refresh_lock:
+        if _election_version is not None and version != _election_version:
+            for cached in (load_election_frames, election_database, get_election_index, get_summary_index,
+                           get_party_cube, get_candidate_index, get_swing_engine, get_seat_simulator,
+                           get_seat_projection, get_leaderboards):
+                cached.clear()
+        _election_version = version
+
+@st.cache_resource
+def booth_database():
+    """SQLite copy of the booth tables and their anomaly scores, rebuilt when the generator version changes."""
+    def build():
+        tables = generate_booth_tables()
+        return {'booths': ElectionIndex(tables.booths).frame, 'booth_results': tables.results,
+                'anomalies': booth_anomalies(tables.booths, tables.results)}
+
+    return SQLiteStore(BOOTH_SQLITE_PATH, f"v{BOOTH_DATA_VERSION}-{BOOTH_DATA_SEED}-l{BOOTH_LAYOUT_VERSION}", build)
+
+@st.cache_resource
+def get_election_index():
+    """Build the shared selection index over the election data once per process."""
+    if BACKEND == "sqlite":
+        return SQLiteIndex(election_database())
+    return PartitionedIndex(load_shared_data())
+
+@st.cache_resource
+def get_summary_index():
+    """Selection index over the constituency summary (one row per year and constituency)."""
+    if BACKEND == "sqlite":
+        return SQLiteIndex(election_database(), 'summary')
+    return PartitionedIndex(load_election_frames()['summary'])
+
+@st.cache_resource
+def get_party_cube():
+    """Party x year x district seats and votes, with the statewide rollup, built once per process."""
+    if BACKEND == "sqlite":
+        return PartyCube(election_database().query('cube'))
+    return PartyCube(load_election_frames()['cube'])
+
+@st.cache_resource
+def get_candidate_index():
+    """Every candidate's contests keyed by (name, party, home district), built once per process."""
+    if BACKEND == "sqlite":
+        return CandidateIndex(election_database().query('careers'))
+    return CandidateIndex(load_election_frames()['careers'])
+
+@st.cache_resource
+def get_swing_engine():
+    """Year-over-year swing of every party in every constituency, built once per process."""
+    if BACKEND == "sqlite":
+        return SwingEngine(election_database().query('swing'))
+    return SwingEngine(load_election_frames()['swing'])
+
+@st.cache_resource
+def get_seat_simulator(year):
+    """Monte Carlo seat projector over one year's vote shares, built once per process and year."""
+    return SeatSimulator(get_swing_engine(), year)
+
+@st.cache_data(max_entries=32, show_spinner="Simulating elections...")
+def get_seat_projection(year, draws, swing=(), district_swing=(), seat_noise=2.0, seed=0):
+    """Seat projection for one set of inputs, simulated once and reused on later reruns.
+
+    ``swing`` holds (party, points) pairs and ``district_swing`` ((district,
+    party), points) pairs, so the inputs can be hashed. Runs in this process:
+    the server never forks workers on a rerun.
+    """
+    return get_seat_simulator(year).run(draws=draws, swing=dict(swing), district_swing=dict(district_swing) or None,
+                                        seat_noise=seat_noise, seed=seed)
+
+@st.cache_resource
+def get_leaderboards():
+    """Ranked contest and booth leaderboards (margins, vote share, turnout), built once per process."""
+    if BACKEND == "sqlite":
+        return build_leaderboards(election_database().query('summary'), booth_database().query('booths'))
+    return build_leaderboards(load_election_frames()['summary'], create_booth_tables().booths)
+
+@st.cache_resource
+def get_booth_index():
+    """Build the shared selection index over the booth data once per process."""
+    if BACKEND == "sqlite":
+        return SQLiteIndex(booth_database(), 'booths')
+    return PartitionedIndex(create_booth_tables().booths)
+
+@st.cache_resource
+def get_booth_rollup():
+    """Booth metrics rolled up to constituency, district and state, built once per process.
+
+    The booth data is generated whole, so the app builds the rollup once and
+    never updates it; ``BoothRollup.update`` applies a batch of new or
+    corrected booth rows for callers that receive booths in increments.
+    """
+    if BACKEND == "sqlite":
+        # Only the rollup's columns, with each booth's votes summed per party in SQL.
+        store = booth_database()
+        booths = store.query('booths', columns=['booth_key', 'year', 'booth_id', 'district', 'constituency']
+                             + ROLLUP_MEASURES[1:])
+        return BoothRollup.from_tables(BoothTables(booths, store.sum('booth_results', ['booth_key', 'party'], 'votes')))
+    return BoothRollup.from_tables(create_booth_tables())
+
+@st.cache_resource
+def get_booth_swing():
+    """Booths aligned across years with their turnout, margin and winner changes, built once per process."""
+    if BACKEND == "sqlite":
+        return BoothSwing(booth_database().query('booths'))
+    return BoothSwing(create_booth_tables().booths)
+
+@st.cache_resource
+def get_booth_anomalies():
+    """Booths ranked by robust z-score anomaly checks, computed once per booth data version.
+
+    The scores are published to the shared column store (the booth
+    database with the sqlite backend) under the booth data version, so
+    every server process attaches to one computed copy and a new generator
+    version recomputes them.
+    """
+    if BACKEND == "sqlite":
+        return AnomalyReport(booth_database().query('anomalies'))
+
+    def build():
+        tables = create_booth_tables()
+        return {'anomalies': booth_anomalies(tables.booths, tables.results)}
+
+    frames = shared_frames('booth_anomalies', f"v{BOOTH_DATA_VERSION}-{BOOTH_DATA_SEED}", build)
+    return AnomalyReport(frames['anomalies'])
+
+@st.cache_resource
+def get_live_count():
+    """Counting-day totals fed from LIVE_PATH, shared by every session of the process."""
+    return LiveCount(LIVE_PATH)
+
+def get_booth_store():
+    """Booth lookups (booth by ID, a booth's candidates) for the configured backend."""
+    if BACKEND == "sqlite":
+        return SQLiteBoothTables(booth_database())
+    return create_booth_tables()